@@ -4,12 +4,9 @@ import os
 from argparse import Namespace
 from time import perf_counter
 
-from ariadne import (
-    gql,
-    graphql_sync,
-)
-
 from dataall.base.api import bootstrap as bootstrap_schema, get_executable_schema
+from dataall.base.api.query_cache import QueryDocumentCache, execute_query
+from dataall.base.api.schema_cache import SCHEMA_CACHE_PATH
 from dataall.base.utils.api_handler_utils import (
     extract_groups,
     attach_tenant_policy_for_groups,
@@ -22,6 +19,7 @@ from dataall.base.aws.sqs import SqsQueue
 from dataall.base.context import set_context, dispose_context, RequestContext
 from dataall.base.db import get_engine
 from dataall.base.loader import load_modules, ImportMode
+from dataall.base.utils import Parameter
 
 from graphql.pyutils import did_you_mean
 
@@ -39,12 +37,16 @@ if not ALLOW_INTROSPECTION:
     did_you_mean.__globals__['MAX_LENGTH'] = 0
 
 load_modules(modes={ImportMode.API})
+modules_loaded = perf_counter()
 SCHEMA = bootstrap_schema()
-TYPE_DEFS = gql(SCHEMA.gql(with_directives=False))
+schema_bootstrapped = perf_counter()
 ENVNAME = os.getenv('envname', 'local')
 ENGINE = get_engine(envname=ENVNAME)
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', '*')
 Worker.queue = SqsQueue.send
+# parameters read by every request (reauth, queue url, pivot role) are loaded at once during the cold start
+for prefix in ['reauth', 'sqs', 'pivotRole']:
+    Parameter.prefetch(env=ENVNAME, prefix=prefix)
 
 
 def resolver_adapter(resolver):
@@ -64,9 +66,16 @@ def resolver_adapter(resolver):
     return adapted
 
 
-executable_schema = get_executable_schema()
+schema_started = perf_counter()
+executable_schema = get_executable_schema(SCHEMA, cache_path=SCHEMA_CACHE_PATH)
+QUERY_DOCUMENTS = QueryDocumentCache(executable_schema, introspection=ALLOW_INTROSPECTION)
 end = perf_counter()
-print(f'Lambda Context Initialization took: {end - start:.3f} sec')
+print(
+    f'Lambda Context Initialization took: {end - start:.3f} sec '
+    f'(load_modules: {modules_loaded - start:.3f} sec, '
+    f'bootstrap: {schema_bootstrapped - modules_loaded:.3f} sec, '
+    f'executable schema: {end - schema_started:.3f} sec)'
+)
 
 
 def handler(event, context):
@@ -122,9 +131,9 @@ def handler(event, context):
         log.debug('username is %s', username)
 
         groups: list = extract_groups(user_id=user_id, claims=claims)
-        attach_tenant_policy_for_groups(groups=groups)
-
+        # the context is set first, so that the tenant permissions loaded for the groups are reused by the request
         set_context(RequestContext(ENGINE, username, groups, user_id))
+        attach_tenant_policy_for_groups(groups=groups)
         app_context = {
             'engine': ENGINE,
             'username': username,
@@ -133,8 +142,12 @@ def handler(event, context):
         }
 
         query = json.loads(event.get('body'))
+        # the document is parsed and validated once, for the maintenance window check and the execution
+        document = QUERY_DOCUMENTS.find_document(query)
 
-        maintenance_window_validation_response = validate_and_block_if_maintenance_window(query=query, groups=groups)
+        maintenance_window_validation_response = validate_and_block_if_maintenance_window(
+            query=query, groups=groups, document=document
+        )
         if maintenance_window_validation_response is not None:
             return maintenance_window_validation_response
         reauth_validation_response = check_reauth(query=query, auth_time=claims['auth_time'], username=username)
@@ -144,14 +157,14 @@ def handler(event, context):
     else:
         raise Exception(f'Could not initialize user context from event {event}')
 
-    success, response = graphql_sync(
-        schema=executable_schema, data=query, context_value=app_context, introspection=ALLOW_INTROSPECTION
+    success, response = execute_query(
+        schema=executable_schema, data=query, documents=QUERY_DOCUMENTS, context_value=app_context, document=document
     )
 
     dispose_context()
     response = json.dumps(response)
 
-    log.info('Lambda Response Success: %s', success)
+    log.info('Lambda Response Success: %s, query cache: %s', success, QUERY_DOCUMENTS.stats())
     log.debug('Lambda Response %s', response)
     return {
         'statusCode': 200 if success else 400,
@@ -20,8 +20,10 @@ load_modules(modes={ImportMode.HANDLERS})
 def handler(event, context=None):
     """Processes  messages received from sqs"""
     log.info(f'Received Event: {event}')
+    task_ids = []
     for record in event['Records']:
         log.info('Consumed record from queue: %s' % record)
         message = json.loads(record['body'])
         log.info(f'Extracted Message: {message}')
-        Worker.process(engine=engine, task_ids=message)
+        task_ids.extend(message)
+    Worker.process(engine=engine, task_ids=task_ids)
@@ -6,13 +6,16 @@ from ariadne import (
     ObjectType,
     UnionType,
     QueryType,
-    gql as GQL,
-    make_executable_schema,
 )
+from ariadne.enums import set_default_enum_values_on_schema, validate_schema_enum_values
+from ariadne.executable_schema import repair_default_enum_values
+from graphql import assert_valid_schema
 
 from dataall.base.api import gql
 from dataall.base.api.constants import GraphQLEnumMapper
+from dataall.base.api.loader import register_siblings
 from dataall.base.api.queries import enumsQuery
+from dataall.base.api.schema_cache import load_graphql_schema
 
 
 def bootstrap():
@@ -63,13 +66,20 @@ def resolver_adapter(resolver):
             source=obj or None,
             **kwargs,
         )
+        register_siblings(response)
         return response
 
     return adapted
 
 
-def get_executable_schema():
-    schema = bootstrap()
+def get_executable_schema(schema: gql.Schema = None, cache_path: str = None):
+    """
+    Binds the resolvers to the GraphQL schema of the registered types.
+    The schema built by bootstrap() can be passed to avoid building it twice, and the GraphQL schema
+    is loaded from cache_path if it was stored there for the same SDL (see schema_cache)
+    """
+    if schema is None:
+        schema = bootstrap()
     _types = []
     for _type in schema.types:
         if _type.name == 'Query':
@@ -103,6 +113,13 @@ def get_executable_schema():
     for union in schema.unions:
         _unions.append(UnionType(union.name, union.resolver))
 
-    type_defs = GQL(schema.gql(with_directives=False))
-    executable_schema = make_executable_schema(type_defs, *(_types + _enums + _unions))
+    # same steps as ariadne.make_executable_schema, starting from the built schema instead of the SDL
+    executable_schema = load_graphql_schema(schema.gql(with_directives=False), cache_path)
+    bindables = _types + _enums + _unions
+    for bindable in bindables:
+        bindable.bind_to_schema(executable_schema)
+    set_default_enum_values_on_schema(executable_schema)
+    assert_valid_schema(executable_schema)
+    validate_schema_enum_values(executable_schema)
+    repair_default_enum_values(executable_schema, bindables)
     return executable_schema
@@ -0,0 +1,83 @@
+"""
+Request-scoped batching of field resolvers (DataLoader pattern).
+GraphQL resolves the fields of the nodes of a list one node at a time, so a field resolver that queries the database
+runs one query per node. resolver_adapter records the nodes returned by list fields as siblings of each other.
+The first time a BatchLoader is asked for the key of a node, it loads the keys of all the siblings of the node
+with a single call of its batch function and serves the following nodes from the request cache.
+Outside the request scope the loader calls the batch function for the requested key only.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from dataall.base.context import find_context
+
+log = logging.getLogger(__name__)
+
+_SIBLINGS_KEY = 'batch_loader_siblings'
+
+
+def register_siblings(result) -> None:
+    """Records the nodes of a list or of a page ({'nodes': [...]}) returned by a resolver as siblings"""
+    if isinstance(result, dict):
+        result = result.get('nodes')
+    if not isinstance(result, list) or len(result) < 2:
+        return
+    context = find_context()
+    if context is None:
+        return
+    # the list is referenced by the cache until the end of the request, so the ids of the nodes are not reused
+    siblings = context.cache.setdefault(_SIBLINGS_KEY, {})
+    for node in result:
+        siblings[id(node)] = result
+
+
+def _get_siblings(source) -> List[Any]:
+    context = find_context()
+    if context is None:
+        return [source]
+    return context.cache.get(_SIBLINGS_KEY, {}).get(id(source), [source])
+
+
+class BatchLoader:
+    """
+    Loads values by key in batches.
+    :param name: unique name of the loader, used as key of the request cache
+    :param key: returns the key of a source object, or None if the loader does not apply to it
+    :param batch_load: returns a dict with the values of a list of keys, missing keys resolve to None
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key: Callable[[Any], Optional[Hashable]],
+        batch_load: Callable[[List[Hashable]], Dict[Hashable, Any]],
+    ):
+        self.name = name
+        self._key = key
+        self._batch_load = batch_load
+
+    def load(self, source) -> Any:
+        key = self._key(source)
+        if key is None:
+            return None
+
+        context = find_context()
+        if context is None:
+            return self._batch_load([key]).get(key)
+
+        values = context.cache.setdefault(f'batch_loader:{self.name}', {})
+        if key in values:
+            return values[key]
+
+        keys = {key}
+        for sibling in _get_siblings(source):
+            sibling_key = self._key(sibling)
+            if sibling_key is not None and sibling_key not in values:
+                keys.add(sibling_key)
+
+        loaded = self._batch_load(list(keys))
+        log.debug(f'Loader {self.name} loaded {len(loaded)} values for {len(keys)} keys')
+        for k in keys:
+            values[k] = loaded.get(k)
+        return values[key]
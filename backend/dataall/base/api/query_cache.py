@@ -0,0 +1,184 @@
+"""
+Cache of the parsed and validated GraphQL documents of the API.
+The frontend sends a small fixed set of operations, but graphql_sync parses and validates the query of every request.
+QueryDocumentCache keeps the valid documents in a LRU cache keyed by the SHA-256 of the query text, and execute_query
+runs the same steps as ariadne.graphql_sync starting from the cached document.
+The cache also implements the automatic persisted queries of Apollo: a client can send only the hash of a query
+(extensions.persistedQuery.sha256Hash), and sends the whole query again if the hash is unknown.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from ariadne.extensions import ExtensionManager
+from ariadne.format_error import format_error
+from ariadne.graphql import (
+    handle_graphql_errors,
+    handle_query_result,
+    parse_query,
+    validate_data,
+    validate_operation_name,
+    validate_query,
+    validate_variables,
+)
+from ariadne.types import GraphQLResult
+from graphql import DocumentNode, ExecutionContext, GraphQLError, GraphQLSchema, execute_sync
+
+QUERY_CACHE_SIZE = int(os.getenv('GRAPHQL_QUERY_CACHE_SIZE', '500'))
+
+PERSISTED_QUERY_NOT_FOUND = 'PersistedQueryNotFound'
+
+
+class InvalidQuery(Exception):
+    def __init__(self, errors: List[GraphQLError]):
+        super().__init__(', '.join(error.message for error in errors))
+        self.errors = errors
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+def _persisted_query_hash(data: dict) -> Optional[str]:
+    extensions = data.get('extensions')
+    if not isinstance(extensions, dict) or not isinstance(extensions.get('persistedQuery'), dict):
+        return None
+    return extensions['persistedQuery'].get('sha256Hash')
+
+
+class QueryDocumentCache:
+    """LRU cache of the documents that are valid for the schema"""
+
+    def __init__(self, schema: GraphQLSchema, max_size: int = QUERY_CACHE_SIZE, introspection: bool = True):
+        self._schema = schema
+        self._max_size = max_size
+        self._introspection = introspection
+        self._documents: 'OrderedDict[str, DocumentNode]' = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_document(self, data: dict) -> DocumentNode:
+        """
+        Returns the parsed and validated document of the query of the request.
+        Raises GraphQLError if the request is malformed and InvalidQuery if the query is not valid for the schema
+        """
+        if not isinstance(data, dict):
+            validate_data(data)
+        persisted_hash = _persisted_query_hash(data)
+        query = data.get('query')
+        if persisted_hash and not query:
+            validate_variables(data.get('variables'))
+            validate_operation_name(data.get('operationName'))
+            document = self._lookup(persisted_hash)
+            if document is None:
+                raise GraphQLError(PERSISTED_QUERY_NOT_FOUND, extensions={'code': 'PERSISTED_QUERY_NOT_FOUND'})
+            return document
+
+        validate_data(data)
+        key = query_hash(query)
+        if persisted_hash and persisted_hash != key:
+            raise GraphQLError('provided sha does not match query', extensions={'code': 'BAD_REQUEST'})
+
+        document = self._lookup(key)
+        if document is None:
+            document = parse_query(query)
+            errors = validate_query(self._schema, document, enable_introspection=self._introspection)
+            if errors:
+                raise InvalidQuery(errors)
+            self._store(key, document)
+        return document
+
+    def find_document(self, data: dict) -> Optional[DocumentNode]:
+        """Same as get_document, but returns None instead of raising if the query is not valid"""
+        try:
+            return self.get_document(data)
+        except (GraphQLError, InvalidQuery):
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else None,
+                'size': len(self._documents),
+            }
+
+    def _lookup(self, key: str) -> Optional[DocumentNode]:
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._documents.move_to_end(key)
+            return document
+
+    def _store(self, key: str, document: DocumentNode) -> None:
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self._max_size:
+                self._documents.popitem(last=False)
+
+
+def execute_query(
+    schema: GraphQLSchema,
+    data: Any,
+    documents: QueryDocumentCache,
+    context_value: Optional[Any] = None,
+    document: Optional[DocumentNode] = None,
+) -> GraphQLResult:
+    """
+    Same as ariadne.graphql_sync, with the document of the query taken from the cache.
+    The document already found in the cache for this request can be passed to skip the lookup
+    """
+    extension_manager = ExtensionManager(None, context_value)
+    with extension_manager.request():
+        errors = None
+        if document is None:
+            try:
+                document = documents.get_document(data)
+            except InvalidQuery as e:
+                errors = e.errors
+            except GraphQLError as error:
+                errors = [error]
+        if errors:
+            return handle_graphql_errors(
+                errors,
+                logger=None,
+                error_formatter=format_error,
+                debug=False,
+                extension_manager=extension_manager,
+            )
+
+        try:
+            result = execute_sync(
+                schema,
+                document,
+                context_value=context_value,
+                variable_values=data.get('variables'),
+                operation_name=data.get('operationName'),
+                execution_context_class=ExecutionContext,
+                middleware=extension_manager.as_middleware_manager(None),
+            )
+        except GraphQLError as error:
+            return handle_graphql_errors(
+                [error],
+                logger=None,
+                error_formatter=format_error,
+                debug=False,
+                extension_manager=extension_manager,
+            )
+        return handle_query_result(
+            result,
+            logger=None,
+            error_formatter=format_error,
+            debug=False,
+            extension_manager=extension_manager,
+        )
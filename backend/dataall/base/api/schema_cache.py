@@ -0,0 +1,64 @@
+"""
+Serialized GraphQL schema of the API, generated when the Lambda image is built to shorten its cold start.
+Parsing the SDL and building the GraphQLSchema is the slowest step of the creation of the executable schema.
+The build stores the schema without resolvers together with the hash of its SDL. At startup the stored schema is used
+only if its hash matches the SDL of the loaded modules, otherwise the schema is built from the SDL as before.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from graphql import GraphQLSchema, build_ast_schema, parse
+
+log = logging.getLogger(__name__)
+
+SCHEMA_CACHE_PATH = os.getenv('GRAPHQL_SCHEMA_CACHE_PATH', 'graphql_schema.pickle')
+
+
+def sdl_hash(sdl: str) -> str:
+    return hashlib.sha256(sdl.encode('utf-8')).hexdigest()
+
+
+def build_graphql_schema(sdl: str) -> GraphQLSchema:
+    return build_ast_schema(parse(sdl))
+
+
+def load_graphql_schema(sdl: str, cache_path: str = None) -> GraphQLSchema:
+    """Returns the stored schema of the SDL, or builds it if there is no stored schema for this SDL"""
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached['hash'] == sdl_hash(sdl):
+                log.info(f'GraphQL schema loaded from {cache_path}')
+                return cached['schema']
+            log.warning(f'GraphQL schema of {cache_path} does not match the loaded modules, building it')
+        except Exception as e:
+            log.warning(f'Failed to load the GraphQL schema from {cache_path}: {e}')
+    return build_graphql_schema(sdl)
+
+
+def write_schema_cache(sdl: str, cache_path: str = SCHEMA_CACHE_PATH) -> None:
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'hash': sdl_hash(sdl), 'schema': build_graphql_schema(sdl)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    # the SDL is written next to the schema for the clients and the reviews of the API
+    with open(f'{os.path.splitext(cache_path)[0]}.graphql', 'w') as f:
+        f.write(sdl)
+
+
+def main(cache_path: str = SCHEMA_CACHE_PATH) -> None:
+    """Writes the schema of the API modules enabled in config.json"""
+    from dataall.base.api import bootstrap
+    from dataall.base.loader import ImportMode, load_modules
+
+    load_modules(modes={ImportMode.API})
+    write_schema_cache(bootstrap().gql(with_directives=False), cache_path)
+    log.info(f'GraphQL schema written to {cache_path}')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main(*sys.argv[1:])
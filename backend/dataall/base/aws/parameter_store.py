@@ -2,6 +2,8 @@ import logging
 
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.ttl_cache import PARAMETER_CACHE_NEGATIVE_TTL, parameter_cache
+
 from .sts import SessionHelper
 
 log = logging.getLogger(__name__)
@@ -29,14 +31,28 @@ class ParameterStoreManager:
     def get_parameter_value(AwsAccountId=None, region=None, parameter_path=None):
         if not parameter_path:
             raise Exception('Parameter name is None')
+        cache_key = ('ssm', AwsAccountId, region, parameter_path)
         try:
-            parameter_value = ParameterStoreManager.client(AwsAccountId, region).get_parameter(Name=parameter_path)[
-                'Parameter'
-            ]['Value']
+            parameter_value = parameter_cache.get(
+                cache_key,
+                lambda: ParameterStoreManager._fetch_parameter_value(AwsAccountId, region, parameter_path),
+            )
         except ClientError as e:
-            raise Exception(e)
+            if e.response['Error']['Code'] != 'ParameterNotFound':
+                raise Exception(e)
+            # missing parameters are cached for a short time only, they are usually created soon after
+            parameter_cache.put(cache_key, None, ttl=PARAMETER_CACHE_NEGATIVE_TTL)
+            parameter_value = None
+        if parameter_value is None:
+            raise Exception(f'Parameter {parameter_path} not found')
         return parameter_value
 
+    @staticmethod
+    def _fetch_parameter_value(AwsAccountId, region, parameter_path):
+        return ParameterStoreManager.client(AwsAccountId, region).get_parameter(Name=parameter_path)['Parameter'][
+            'Value'
+        ]
+
     @staticmethod
     def get_parameters_by_path(AwsAccountId=None, region=None, parameter_path=None):
         if not parameter_path:
@@ -62,4 +78,5 @@ class ParameterStoreManager:
         except ClientError as e:
             raise Exception(e)
         else:
+            parameter_cache.invalidate(('ssm', AwsAccountId, region, parameter_name))
             return str(response)
@@ -4,6 +4,8 @@ import os
 import boto3
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.ttl_cache import parameter_cache
+
 from .sts import SessionHelper
 
 log = logging.getLogger(__name__)
@@ -13,17 +15,31 @@ _DEFAULT_REGION = os.environ.get('AWS_REGION', 'eu-west-1')
 
 class SecretsManager:
     def __init__(self, account_id=None, region=_DEFAULT_REGION):
-        if account_id:
-            session = SessionHelper.remote_session(account_id, region)
-            self._client = session.client('secretsmanager', region_name=region)
-        else:
-            self._client = boto3.client('secretsmanager', region_name=region)
+        self._account_id = account_id
+        self._region = region
+        self.__client = None
+
+    @property
+    def _client(self):
+        # the client (and the remote session behind it) is only created when the secret is not cached
+        if self.__client is None:
+            if self._account_id:
+                session = SessionHelper.remote_session(self._account_id, self._region)
+                self.__client = session.client('secretsmanager', region_name=self._region)
+            else:
+                self.__client = boto3.client('secretsmanager', region_name=self._region)
+        return self.__client
 
     def get_secret_value(self, secret_id):
         if not secret_id:
             raise Exception('Secret name is None')
+        return parameter_cache.get(
+            ('secretsmanager', self._account_id, self._region, secret_id),
+            lambda: self._fetch_secret_value(secret_id),
+        )
+
+    def _fetch_secret_value(self, secret_id):
         try:
-            secret_value = self._client.get_secret_value(SecretId=secret_id)['SecretString']
+            return self._client.get_secret_value(SecretId=secret_id)['SecretString']
         except ClientError as e:
             raise Exception(e)
-        return secret_value
@@ -1,9 +1,15 @@
+import json
 import logging
 import os
+from typing import Dict, List
+
 import boto3
 
 log = logging.getLogger(__name__)
 
+# maximum number of destinations of a SendBulkEmail request
+MAX_BULK_DESTINATIONS = 50
+
 
 class Ses:
     def __init__(self, fromEmailId: str = None):
@@ -41,3 +47,30 @@ class Ses:
                 return True
             log.error(f'Error while sending email {e})')
             raise e
+
+    def send_bulk_email(self, toList: List[str], message, subject) -> Dict[str, dict]:
+        """
+        Sends the same message to each recipient as a separate email in one SendBulkEmail request,
+        with the message as inline template. Returns the result (Status, MessageId, Error) of each recipient
+        """
+        if len(toList) > MAX_BULK_DESTINATIONS:
+            raise ValueError(f'SendBulkEmail accepts at most {MAX_BULK_DESTINATIONS} destinations')
+        try:
+            response = self.client.send_bulk_email(
+                FromEmailAddress=self.fromEmailId,
+                DefaultContent={
+                    'Template': {
+                        'TemplateContent': {'Subject': subject, 'Html': message},
+                        'TemplateData': json.dumps({}),
+                    }
+                },
+                BulkEmailEntries=[{'Destination': {'ToAddresses': [emailId]}} for emailId in toList],
+            )
+            return dict(zip(toList, response['BulkEmailEntryResults']))
+        except Exception as e:
+            envname = os.getenv('envname', 'local')
+            if envname in ['local', 'dkrcompose']:
+                log.error('Local development environment does not support SES notifications')
+                return {emailId: {'Status': 'SUCCESS'} for emailId in toList}
+            log.error(f'Error while sending bulk email {e})')
+            raise e
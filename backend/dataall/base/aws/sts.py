@@ -2,11 +2,15 @@ import json
 import logging
 import os
 import urllib
+from threading import Lock
 
 import boto3
+import botocore.session
 from botocore.client import Config
+from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError
 from dataall.base.config import config
+from dataall.base.utils.ttl_cache import PARAMETER_CACHE_NEGATIVE_TTL, TTLCache, parameter_cache
 
 from dataall.version import __version__, __pkg_name__
 
@@ -20,16 +24,45 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# assumed role sessions refresh their credentials, the entries expire only to pick up changes of the role
+_assumed_sessions = TTLCache(name='sts_sessions', ttl=int(os.getenv('STS_SESSION_CACHE_TTL', '3600')))
+
+
+class CachedClientsSession(boto3.Session):
+    """
+    boto3 Session that reuses its clients.
+    Clients are thread safe while sessions are not, that's why the creation of clients is locked
+    """
+
+    def __init__(self, *args, role_arn=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.role_arn = role_arn
+        self._clients = {}
+        self._clients_lock = Lock()
+
+    def client(self, service_name, region_name=None, *args, **kwargs):
+        with self._clients_lock:
+            if args or kwargs:
+                # clients with a custom configuration or endpoint are not shared
+                return super().client(service_name, region_name, *args, **kwargs)
+            key = (service_name, region_name)
+            if key not in self._clients:
+                self._clients[key] = super().client(service_name, region_name=region_name)
+            return self._clients[key]
+
 
 class SessionHelper:
     """SessionHelpers is a class simplifying common aws boto3 session tasks and helpers"""
 
+    assume_role_calls = 0
+
     @classmethod
-    def get_session(cls, base_session=None, role_arn=None):
+    def get_session(cls, base_session=None, role_arn=None, cached=True):
         """Returns a boto3 session fo the given role
         Args:
             base_session(object,optional) :  a boto3 session
             role_arn(string, optional) : a role arn
+            cached(bool, optional) : False to assume the role again, for credentials handed to the users
         Returns:
             boto3.session.Session : a boto3 session
                     If neither base_session and role_arn is provided, returns a default boto3 session
@@ -37,37 +70,69 @@ class SessionHelper:
         """
         if role_arn:
             external_id_secret = cls.get_external_id_secret()
-            if external_id_secret:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                    ExternalId=external_id_secret,
-                )
-            else:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                )
+            region = os.getenv('AWS_REGION', 'eu-west-1')
+            if not cached:
+                return cls._assume_role_session(base_session, role_arn, region, external_id_secret)
+            # the role is assumed by the role of the base session, or by the default credentials of the process
+            return _assumed_sessions.get(
+                (role_arn, getattr(base_session, 'role_arn', None), region, external_id_secret),
+                lambda: cls._assume_role_session(base_session, role_arn, region, external_id_secret),
+            )
+        else:
+            return boto3.Session()
+
+    @classmethod
+    def _assume_role_session(cls, base_session, role_arn, region, external_id_secret):
+        """
+        Returns a session with credentials of the role that are refreshed by botocore shortly before they expire
+        """
+        if external_id_secret:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+                ExternalId=external_id_secret,
+            )
+        else:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+            )
+        sts = base_session.client(
+            'sts',
+            config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
+            region_name=region,
+            endpoint_url=f'https://sts.{region}.amazonaws.com',
+        )
+
+        def assume_role():
+            cls.assume_role_calls += 1
             try:
-                region = os.getenv('AWS_REGION', 'eu-west-1')
-                sts = base_session.client(
-                    'sts',
-                    config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
-                    region_name=region,
-                    endpoint_url=f'https://sts.{region}.amazonaws.com',
-                )
-                response = sts.assume_role(**assume_role_dict)
-                return boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                )
+                credentials = sts.assume_role(**assume_role_dict)['Credentials']
             except ClientError as e:
                 log.error(f'Failed to assume role {role_arn} due to: {e} ')
                 raise e
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+            metadata=assume_role(),
+            refresh_using=assume_role,
+            method='sts-assume-role',
+        )
+        return CachedClientsSession(botocore_session=botocore_session, role_arn=role_arn)
 
-        else:
-            return boto3.Session()
+    @classmethod
+    def session_cache_stats(cls):
+        return {**_assumed_sessions.stats(), 'assume_role_calls': cls.assume_role_calls}
+
+    @classmethod
+    def clear_session_cache(cls):
+        _assumed_sessions.invalidate()
 
     @classmethod
     def _get_parameter_value(cls, parameter_path=None):
@@ -76,17 +141,25 @@ class SessionHelper:
         :return:
         :rtype:
         """
-        parameter_value = None
         region = os.getenv('AWS_REGION', 'eu-west-1')
         if not parameter_path:
             raise Exception('Parameter name is None')
+        cache_key = ('ssm', None, region, parameter_path)
         try:
-            session = SessionHelper.get_session()
-            client = session.client('ssm', region_name=region)
-            parameter_value = client.get_parameter(Name=parameter_path)['Parameter']['Value']
-            log.debug(f'Found Parameter {parameter_path}|{parameter_value}')
+            return parameter_cache.get(cache_key, lambda: cls._fetch_parameter_value(region, parameter_path))
         except ClientError as e:
             log.warning(f'Parameter {parameter_path} not found: {e}')
+            if e.response['Error']['Code'] == 'ParameterNotFound':
+                # missing parameters are cached for a short time only, other errors are not cached
+                parameter_cache.put(cache_key, None, ttl=PARAMETER_CACHE_NEGATIVE_TTL)
+            return None
+
+    @classmethod
+    def _fetch_parameter_value(cls, region, parameter_path):
+        session = SessionHelper.get_session()
+        client = session.client('ssm', region_name=region)
+        parameter_value = client.get_parameter(Name=parameter_path)['Parameter']['Value']
+        log.debug(f'Found Parameter {parameter_path}|{parameter_value}')
         return parameter_value
 
     @classmethod
@@ -121,11 +194,12 @@ class SessionHelper:
     def get_console_access_url(cls, boto3_session, region='eu-west-1', bucket=None):
         """Returns an AWS Console access url for the boto3 session
         Args:
-            boto3_session(object): a boto3 session
+            boto3_session(object): a boto3 session, preferably with freshly assumed credentials
         Returns:
                 String: aws federated access console url
         """
-        c = boto3_session.get_credentials()
+        # the frozen credentials are read at once, a refresh can not mix the keys of two sets of credentials
+        c = boto3_session.get_credentials().get_frozen_credentials()
         json_string_with_temp_credentials = '{'
         json_string_with_temp_credentials += '"sessionId":"' + c.access_key + '",'
         json_string_with_temp_credentials += '"sessionKey":"' + c.secret_key + '",'
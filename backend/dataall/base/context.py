@@ -7,8 +7,8 @@ The class uses Flask's approach to handle request: ThreadLocal
 That approach should work fine for AWS Lambdas and local server that uses FastApi app
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from dataall.base.db.connection import Engine
 from threading import local
@@ -25,6 +25,8 @@ class RequestContext:
     username: str
     groups: List[str]
     user_id: str
+    # storage for values that are memoized for the lifetime of the request (e.g. resolved permissions)
+    cache: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
 
 
 def get_context() -> RequestContext:
@@ -32,6 +34,11 @@ def get_context() -> RequestContext:
     return _request_storage.context
 
 
+def find_context() -> Optional[RequestContext]:
+    """Retrieves context associated with a request or None if the code is running outside the request scope"""
+    return getattr(_request_storage, 'context', None)
+
+
 def set_context(context: RequestContext) -> None:
     """Retrieves context associated with a request"""
     _request_storage.context = context
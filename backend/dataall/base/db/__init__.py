@@ -9,5 +9,5 @@ from .connection import (
     has_column,
     drop_schema_if_exists,
 )
-from .dbconfig import DbConfig
+from .dbconfig import DbConfig, PoolConfig
 from .paginator import paginate
@@ -1,15 +1,19 @@
 import json
 import logging
 import os
+import time
+import weakref
 from contextlib import contextmanager
+from threading import Lock
 
 import sqlalchemy
 from sqlalchemy.engine import reflection
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from dataall.base.aws.secrets_manager import SecretsManager
 from dataall.base.db import Base
-from dataall.base.db.dbconfig import DbConfig
+from dataall.base.db.dbconfig import DbConfig, PoolConfig
 from dataall.base.utils import Parameter
 from dataall.base.aws.sts import SessionHelper
 
@@ -22,13 +26,41 @@ log = logging.getLogger(__name__)
 ENVNAME = os.getenv('envname', 'local')
 
 
+class _TimedQueuePool(QueuePool):
+    """QueuePool that measures how long the callers wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = Lock()
+        self.wait_count = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            with self._wait_lock:
+                self.wait_count += 1
+                self.wait_time += waited
+                self.max_wait_time = max(self.max_wait_time, waited)
+
+
 class Engine:
-    def __init__(self, dbconfig: DbConfig):
+    def __init__(self, dbconfig: DbConfig, pool_config: PoolConfig = None):
         self.dbconfig = dbconfig
+        self.pool_config = pool_config or PoolConfig()
         self.engine = sqlalchemy.create_engine(
             dbconfig.url,
             echo=False,
-            pool_size=1,
+            poolclass=_TimedQueuePool,
+            pool_size=self.pool_config.size,
+            max_overflow=self.pool_config.max_overflow,
+            pool_timeout=self.pool_config.timeout,
+            pool_pre_ping=self.pool_config.pre_ping,
+            pool_recycle=self.pool_config.recycle,
             connect_args={'options': f'-csearch_path={dbconfig.schema}'},
         )
         try:
@@ -39,14 +71,14 @@ class Engine:
         except Exception as e:
             log.error(f'Could not create schema: {e}')
 
-        self.sessions = {}
-        self._session = None
+        # every thread gets its own session, nested scoped_session() calls within a thread share it
+        self._sessions = scoped_session(sessionmaker(bind=self.engine, autoflush=True, expire_on_commit=False))
+        self._all_sessions = weakref.WeakSet()
 
     def session(self):
-        if self._session is None:
-            self._session = sessionmaker(bind=self.engine, autoflush=True, expire_on_commit=False)()
-
-        return self._session
+        s = self._sessions()
+        self._all_sessions.add(s)
+        return s
 
     @contextmanager
     def scoped_session(self):
@@ -60,7 +92,23 @@ class Engine:
         finally:
             s.close()
 
+    def pool_metrics(self) -> dict:
+        pool = self.engine.pool
+        return {
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'wait_count': pool.wait_count,
+            'wait_time': round(pool.wait_time, 6),
+            'max_wait_time': round(pool.max_wait_time, 6),
+        }
+
     def dispose(self):
+        """Closes the sessions of all the threads and the connections of the pool"""
+        for s in list(self._all_sessions):
+            s.close()
+        self._sessions.remove()
         self.engine.dispose()
 
 
@@ -96,7 +144,12 @@ def drop_schema_if_exists(engine, envname):
         raise e
 
 
-def get_engine(envname=ENVNAME):
+def get_engine(envname=ENVNAME, pool_config: PoolConfig = None):
+    """
+    Creates the Engine of the environment.
+    :param pool_config: the pool profile of the caller, single connection if not provided. DB_POOL_* environment
+    variables take precedence over the profile
+    """
     if envname not in ['local', 'pytest', 'dkrcompose']:
         param_store = Parameter()
         credential_arn = param_store.get_parameter(env=envname, path='aurora/dbcreds')
@@ -121,7 +174,7 @@ def get_engine(envname=ENVNAME):
             'pwd': 'docker',
             'schema': envname,
         }
-    return Engine(DbConfig(**db_params))
+    return Engine(DbConfig(**db_params), (pool_config or PoolConfig()).with_env_overrides())
 
 
 def has_table(table_name, engine):
@@ -1,5 +1,6 @@
 import os
 import re
+from dataclasses import dataclass, replace
 
 _SANITIZE_WORD_REGEX = r'[^\w]'  # A-Za-z0-9_
 _SANITIZE_HOST_REGEX = r'[^\w.-]'
@@ -11,6 +12,40 @@ _MAX_HOST_LENGTH = 253
 _envname = os.getenv('envname', 'local')
 
 
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings of the Engine.
+    The defaults keep a single connection, which is what a Lambda handling one request at a time needs.
+    ECS tasks and local servers that run DB work concurrently can use PoolConfig.wide()
+    Every setting can be overridden with the DB_POOL_* environment variables
+    """
+
+    size: int = 1
+    max_overflow: int = 10
+    timeout: int = 30
+    pre_ping: bool = False
+    recycle: int = -1
+
+    @staticmethod
+    def wide() -> 'PoolConfig':
+        return PoolConfig(size=5, max_overflow=10, pre_ping=True, recycle=3600)
+
+    def with_env_overrides(self) -> 'PoolConfig':
+        overrides = {}
+        for field, cast in (
+            ('size', int),
+            ('max_overflow', int),
+            ('timeout', int),
+            ('pre_ping', lambda v: v.lower() in ('1', 'true', 'yes')),
+            ('recycle', int),
+        ):
+            value = os.getenv(f'DB_POOL_{field.upper()}')
+            if value:
+                overrides[field] = cast(value)
+        return replace(self, **overrides)
+
+
 class DbConfig:
     def __init__(self, user: str, pwd: str, host: str, db: str, schema: str):
         for param in (user, db, schema):
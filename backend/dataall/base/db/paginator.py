@@ -1,10 +1,31 @@
+import base64
+import json
+import logging
 import math
+from enum import Enum
 
-__version__ = '0.0.2'
+from sqlalchemy import func, inspect, select
+
+__version__ = '0.0.3'
+
+log = logging.getLogger(__name__)
+
+
+class CountStrategy(Enum):
+    """
+    How the total number of items of a paginated query is computed
+    DISTINCT - SELECT COUNT over the distinct primary keys of the mapped entities of the query (default)
+    WINDOW - count(*) OVER() column added to the page query, saves a round trip for queries with unique rows
+    FETCH_ALL - materializes the whole result, kept as a reference for the other strategies
+    """
+
+    DISTINCT = 'distinct'
+    WINDOW = 'window'
+    FETCH_ALL = 'fetch_all'
 
 
 class Page(object):
-    def __init__(self, items, page, page_size, total):
+    def __init__(self, items, page, page_size, total, next_cursor=None):
         self.page_size = page_size
         self.page = page
         self.items = items
@@ -19,9 +40,10 @@ class Page(object):
             self.next_page = page + 1
         self.total = total
         self.pages = int(math.ceil(total / float(page_size)))
+        self.next_cursor = next_cursor
 
     def to_dict(self):
-        return {
+        page = {
             'count': self.total,
             'pages': self.pages,
             'page': self.page,
@@ -32,18 +54,35 @@ class Page(object):
             'nextPage': self.next_page,
             'previousPage': self.previous_page,
         }
+        if self.next_cursor is not None:
+            page['nextCursor'] = self.next_cursor
+        return page
 
 
-def paginate(query, page, page_size):
+def paginate(query, page, page_size, count_strategy=CountStrategy.DISTINCT, keyset=None, cursor=None):
+    """
+    Returns a page of the query.
+    :param count_strategy: how the total is computed, see CountStrategy
+    :param keyset: opt-in keyset pagination. A unique and sortable column (e.g. the URI of the entity).
+    The query is ordered by the column and the page starts after the cursor instead of using OFFSET
+    :param cursor: the nextCursor of the previous page, used together with keyset
+    """
     if page <= 0:
         raise AttributeError('page needs to be >= 1')
     if page_size <= 0:
         raise AttributeError('page_size needs to be >= 1')
+
+    if keyset is not None:
+        return _paginate_keyset(query, page, page_size, keyset, cursor, count_strategy)
+
+    if count_strategy == CountStrategy.WINDOW and _is_single_entity(query) and not query._distinct:
+        items, total = _fetch_page_with_window_count(query, page, page_size)
+        if total is not None:
+            return Page(items, page, page_size, total)
+        return Page(items, page, page_size, count(query))
+
     items = query.limit(page_size).offset((page - 1) * page_size).all()
-    # count doesn't de-duplicate the rows as described here https://tinyurl.com/3f7d8d5a
-    # nosemgrep: python.sqlalchemy.performance.performance-improvements.len-all-count
-    total = len(query.order_by(None).all())
-    return Page(items, page, page_size, total)
+    return Page(items, page, page_size, count(query, count_strategy))
 
 
 def paginate_list(items, page, page_size):
@@ -55,3 +94,107 @@ def paginate_list(items, page, page_size):
     end = start + page_size
     total = len(items)
     return Page(items[start:end], page, page_size, total)
+
+
+def count(query, count_strategy=CountStrategy.DISTINCT):
+    """
+    Counts the items that query.all() returns.
+    Query.count() is not used because it doesn't de-duplicate the rows as described here https://tinyurl.com/3f7d8d5a
+    """
+    query = query.order_by(None)
+    if count_strategy != CountStrategy.FETCH_ALL:
+        distinct_count = _count_distinct(query)
+        if distinct_count is not None:
+            return distinct_count
+    # nosemgrep: python.sqlalchemy.performance.performance-improvements.len-all-count
+    return len(query.all())
+
+
+def _count_distinct(query):
+    """
+    The ORM de-duplicates the rows that contain mapped entities by their identity, the same is done in SQL
+    with a COUNT over the distinct primary keys. Returns None if the keys of the query can't be resolved
+    """
+    try:
+        descriptions = query.column_descriptions
+        subquery = query.subquery(with_labels=True)
+        key_columns = []
+        has_entities = False
+        for description in descriptions:
+            expr = description['expr']
+            entity = description['entity']
+            if entity is not None and expr is entity:
+                has_entities = True
+                entity_info = inspect(entity)
+                selectable = entity_info.selectable
+                columns = [selectable.corresponding_column(column) for column in entity_info.mapper.primary_key]
+            else:
+                columns = [expr]
+            for column in columns:
+                key_column = subquery.corresponding_column(column) if column is not None else None
+                if key_column is None:
+                    return None
+                key_columns.append(key_column)
+    except Exception as e:
+        log.debug(f'Could not resolve the keys of the query, counting all the rows instead: {e}')
+        return None
+
+    if not has_entities:
+        return query.session.query(func.count()).select_from(subquery).scalar()
+    if len(key_columns) == 1:
+        return query.session.query(func.count(key_columns[0].distinct())).scalar()
+    keys = select(key_columns).distinct().alias()
+    return query.session.query(func.count()).select_from(keys).scalar()
+
+
+def _is_single_entity(query):
+    descriptions = query.column_descriptions
+    return (
+        len(descriptions) == 1
+        and descriptions[0]['entity'] is not None
+        and descriptions[0]['expr'] is descriptions[0]['entity']
+    )
+
+
+def _fetch_page_with_window_count(query, page, page_size):
+    """
+    Fetches the page together with count(*) OVER() so the total comes with the items in a single round trip.
+    The window counts the rows before the ORM de-duplication, so it must be used for queries with unique rows only.
+    Returns None as total if the page is empty, because there is no row to read the count from
+    """
+    rows = query.add_columns(func.count().over().label('_total')).limit(page_size).offset((page - 1) * page_size).all()
+    if not rows:
+        return [], None if page > 1 else 0
+    total = rows[0][-1]
+    items = [row[0] for row in rows]
+    return items, total
+
+
+def _paginate_keyset(query, page, page_size, keyset, cursor, count_strategy):
+    total = count(query, count_strategy)
+    keyset_query = query.order_by(None).order_by(keyset)
+    if cursor:
+        keyset_query = keyset_query.filter(keyset > decode_cursor(cursor))
+    rows = keyset_query.limit(page_size + 1).all()
+    items = rows[:page_size]
+    has_next = len(rows) > page_size
+    if items and not has_next:
+        # rows de-duplicated by the ORM can fill less than a page even if there are more items after it
+        last_key = getattr(items[-1], keyset.key)
+        has_next = query.session.query(keyset_query.filter(keyset > last_key).exists()).scalar()
+    next_cursor = encode_cursor(getattr(items[-1], keyset.key)) if has_next else ''
+    result = Page(items, page, page_size, total, next_cursor=next_cursor)
+    result.has_next = has_next
+    result.next_page = page + 1 if has_next else None
+    return result
+
+
+def encode_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise AttributeError(f'invalid cursor {cursor}') from e
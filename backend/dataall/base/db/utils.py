@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import nanoid
+from sqlalchemy import or_
 
 from dataall.base.utils.slugify import slugify
 
@@ -19,6 +20,12 @@ def now():
     return datetime.now().isoformat()
 
 
+def changed_since(model, since: datetime):
+    """Filter of the rows of the model created, updated or soft deleted after since"""
+    columns = [getattr(model, name) for name in ('created', 'updated', 'deleted') if hasattr(model, name)]
+    return or_(*[column > since for column in columns])
+
+
 def slugifier(field):
     def slugit(context):
         return slugify(context.get_current_parameters().get(field, 'Untitled'))
@@ -0,0 +1,161 @@
+"""
+Per-process cache of the group memberships resolved by the service provider (the IdP of custom_auth deployments).
+The groups of the users are resolved on every API and search request, and the members of the groups on every
+notification email, the cache avoids a remote call to the IdP for each of them.
+- fresh entries are returned for GROUP_MEMBERSHIP_CACHE_TTL seconds
+- expired entries are still returned for GROUP_MEMBERSHIP_CACHE_STALE_TTL seconds while a background thread
+  refreshes them (stale-while-revalidate), the stale value is kept if the refresh fails
+- empty results and errors of the IdP are cached for GROUP_MEMBERSHIP_CACHE_NEGATIVE_TTL seconds (negative caching),
+  the cached error is raised again to the callers
+"""
+
+import logging
+import os
+import threading
+import time
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterable, List
+
+from dataall.base.services.service_provider_factory import ServiceProviderFactory
+
+log = logging.getLogger(__name__)
+
+GROUP_MEMBERSHIP_CACHE_TTL = int(os.getenv('GROUP_MEMBERSHIP_CACHE_TTL', '300'))
+GROUP_MEMBERSHIP_CACHE_STALE_TTL = int(os.getenv('GROUP_MEMBERSHIP_CACHE_STALE_TTL', '3600'))
+GROUP_MEMBERSHIP_CACHE_NEGATIVE_TTL = int(os.getenv('GROUP_MEMBERSHIP_CACHE_NEGATIVE_TTL', '30'))
+
+
+class _Entry:
+    def __init__(self, value: List[str] = None, error: Exception = None, fresh_until=0.0, stale_until=0.0):
+        self.value = value
+        self.error = error
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class GroupMembershipCache:
+    def __init__(
+        self,
+        name: str,
+        ttl: float = GROUP_MEMBERSHIP_CACHE_TTL,
+        stale_ttl: float = GROUP_MEMBERSHIP_CACHE_STALE_TTL,
+        negative_ttl: float = GROUP_MEMBERSHIP_CACHE_NEGATIVE_TTL,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = Lock()
+        self._key_locks: Dict[Hashable, Lock] = {}
+        self._refreshes: Dict[Hashable, threading.Thread] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, loader: Callable[[], Iterable[str]]) -> List[str]:
+        """Returns the cached memberships of the key, calls the loader if they are missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None and now < entry.fresh_until:
+                self.hits += 1
+                return self._value(entry)
+            if entry is not None and entry.error is None and now < entry.stale_until:
+                self.stale_hits += 1
+                if key not in self._refreshes:
+                    self._refreshes[key] = threading.Thread(
+                        target=self._refresh, args=(key, loader), name=f'{self.name}-refresh', daemon=True
+                    )
+                    self._refreshes[key].start()
+                return self._value(entry)
+            self.misses += 1
+
+        with self._key_lock(key):
+            # another thread might have loaded the memberships while this one was waiting for the lock
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() < entry.fresh_until:
+                    return self._value(entry)
+            try:
+                return self._value(self._load(key, loader))
+            except Exception as e:
+                self._store(key, _Entry(error=e, fresh_until=time.monotonic() + self.negative_ttl))
+                raise e
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drops the key or the whole cache if no key is provided"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'name': self.name,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+            }
+
+    def _load(self, key, loader) -> _Entry:
+        value = list(loader() or [])
+        now = time.monotonic()
+        entry = _Entry(
+            value=value,
+            fresh_until=now + (self.ttl if value else self.negative_ttl),
+            stale_until=now + (self.stale_ttl if value else self.negative_ttl),
+        )
+        self._store(key, entry)
+        return entry
+
+    def _refresh(self, key, loader):
+        try:
+            with self._key_lock(key):
+                self._load(key, loader)
+        except Exception as e:
+            log.warning(f'Failed to refresh the {self.name} of {key}, the cached value is used: {e}')
+        finally:
+            with self._lock:
+                self._refreshes.pop(key, None)
+
+    def _store(self, key, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+    def _key_lock(self, key: Hashable) -> Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, Lock())
+
+    @staticmethod
+    def _value(entry: _Entry) -> List[str]:
+        if entry.error is not None:
+            raise entry.error
+        return list(entry.value)
+
+
+# groups of the users, resolved by the api and search handlers
+user_groups_cache = GroupMembershipCache(name='user_groups')
+# email ids of the members of the groups, resolved by the email notifications
+group_emails_cache = GroupMembershipCache(name='group_emails')
+
+
+def get_groups_for_user(user_id, service_provider=None) -> List[str]:
+    return user_groups_cache.get(
+        user_id,
+        lambda: (service_provider or ServiceProviderFactory.get_service_provider_instance()).get_groups_for_user(
+            user_id
+        ),
+    )
+
+
+def get_user_emailids_from_group(group_name, service_provider=None) -> List[str]:
+    return group_emails_cache.get(
+        group_name,
+        lambda: (
+            service_provider or ServiceProviderFactory.get_service_provider_instance()
+        ).get_user_emailids_from_group(group_name),
+    )
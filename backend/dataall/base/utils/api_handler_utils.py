@@ -6,7 +6,7 @@ import logging
 from graphql import parse, utilities, OperationType, GraphQLSyntaxError
 from dataall.base.aws.parameter_store import ParameterStoreManager
 from dataall.base.db import get_engine
-from dataall.base.services.service_provider_factory import ServiceProviderFactory
+from dataall.base.services.group_membership_cache import get_groups_for_user
 from dataall.core.permissions.services.tenant_permissions import TENANT_ALL
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.modules.maintenance.api.enums import MaintenanceModes, MaintenanceStatus
@@ -54,8 +54,7 @@ def get_cognito_groups(claims):
 
 
 def get_custom_groups(user_id):
-    service_provider = ServiceProviderFactory.get_service_provider_instance()
-    return service_provider.get_groups_for_user(user_id)
+    return get_groups_for_user(user_id)
 
 
 def send_unauthorized_response(operation='', message='', extension=None):
@@ -101,16 +100,12 @@ def attach_tenant_policy_for_groups(groups=None):
     if groups is None:
         groups = []
     with ENGINE.scoped_session() as session:
-        for group in groups:
-            policy = TenantPolicyService.find_tenant_policy(session, group, TenantPolicyService.TENANT_NAME)
-            if not policy:
-                log.info(f'No policy found for Team {group}. Attaching TENANT_ALL permissions')
-                TenantPolicyService.attach_group_tenant_policy(
-                    session=session,
-                    group=group,
-                    permissions=TENANT_ALL,
-                    tenant_name=TenantPolicyService.TENANT_NAME,
-                )
+        TenantPolicyService.attach_missing_group_tenant_policies(
+            session=session,
+            groups=groups,
+            permissions=TENANT_ALL,
+            tenant_name=TenantPolicyService.TENANT_NAME,
+        )
 
 
 def check_reauth(query, auth_time, username):
@@ -139,7 +134,7 @@ def check_reauth(query, auth_time, username):
             )
 
 
-def validate_and_block_if_maintenance_window(query, groups, blocked_for_mode_enum=None):
+def validate_and_block_if_maintenance_window(query, groups, blocked_for_mode_enum=None, document=None):
     """
     When the maintenance module is set to active, checks
         - If the maintenance mode is enabled
@@ -150,6 +145,7 @@ def validate_and_block_if_maintenance_window(query, groups, blocked_for_mode_enu
     @param query: graphql query dict containing operation, query, variables
     @param groups: user groups
     @param blocked_for_mode_enum: sets the mode for blocking only specific modes. When set to None, both graphql types ( Query and Mutation ) will be blocked. When a specific mode is set, blocking will only occure for that mode
+    @param document: parsed graphql query, the query is parsed if it is not provided
     @return: error response if maintenance window is blocking gql calls else None
     """
     if config.get_property('modules.maintenance.active'):
@@ -176,7 +172,7 @@ def validate_and_block_if_maintenance_window(query, groups, blocked_for_mode_enu
         ):
             # If its mutation then block and return
             try:
-                parsed_query_document = parse(query.get('query', ''))
+                parsed_query_document = document or parse(query.get('query', ''))
                 graphQL_operation_type = utilities.get_operation_ast(parsed_query_document)
                 if graphQL_operation_type.operation == OperationType.MUTATION:
                     return send_unauthorized_response(
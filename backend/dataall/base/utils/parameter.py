@@ -5,6 +5,8 @@ import os
 import boto3
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.ttl_cache import PARAMETER_CACHE_NEGATIVE_TTL, parameter_cache
+
 log = logging.getLogger(__name__)
 
 
@@ -16,6 +18,14 @@ class Parameter:
         client = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
         return client
 
+    @classmethod
+    def region(cls):
+        return os.getenv('AWS_REGION', 'eu-west-1')
+
+    @classmethod
+    def cache_key(cls, pname):
+        return 'ssm', None, cls.region(), pname
+
     @classmethod
     def get_parameter_name(cls, env, path=''):
         pname = f'/{cls.prefix}/{env}/{path}'
@@ -34,23 +44,48 @@ class Parameter:
             Type='String',
             Overwrite=True,
         )
+        parameter_cache.invalidate(cls.cache_key(pname))
         return Parameter.get_parameter(env, path)
 
     @classmethod
     def get_parameter(cls, env, path=''):
+        """
+        Returns the value of the parameter, values are cached for PARAMETER_CACHE_TTL
+        and missing parameters for PARAMETER_CACHE_NEGATIVE_TTL
+        """
         pname = cls.get_parameter_name(env, path)
-        ssm = cls.ssm()
+        cache_key = cls.cache_key(pname)
         try:
-            param_value = ssm.get_parameter(Name=pname)
-            return param_value['Parameter']['Value']
+            return parameter_cache.get(cache_key, lambda: cls._fetch_parameter(pname))
         except ClientError as e:
             if e.response['Error']['Code'] == 'ParameterNotFound':
                 log.warning('Parameter `{}` not found for env `{}`, defaulting to None'.format(path, env))
+                parameter_cache.put(cache_key, None, ttl=PARAMETER_CACHE_NEGATIVE_TTL)
                 return None
             else:
                 log.error('Error trying to retrieve parameter from SSM')
                 raise e
 
+    @classmethod
+    def _fetch_parameter(cls, pname):
+        param_value = cls.ssm().get_parameter(Name=pname)
+        return param_value['Parameter']['Value']
+
+    @classmethod
+    def prefetch(cls, env, prefix=None):
+        """
+        Loads all the parameters under the prefix with GetParametersByPath into the cache,
+        so that a cold start pays a few paginated calls instead of one call per parameter
+        """
+        pname = cls.get_parameter_name(env, prefix or '')
+        try:
+            paginator = cls.ssm().get_paginator('get_parameters_by_path')
+            for page in paginator.paginate(Path=pname, Recursive=True):
+                for parameter in page['Parameters']:
+                    parameter_cache.put(cls.cache_key(parameter['Name']), parameter['Value'])
+        except Exception as e:
+            log.warning(f'Could not prefetch the parameters under {pname}: {e}')
+
     @classmethod
     def clean_environment(cls, env):
         params = cls.get_parameters(env=env)
@@ -0,0 +1,82 @@
+"""
+Per-process cache with time-to-live expiration.
+Lambdas and ECS tasks keep the process between invocations, so values that rarely change (SSM parameters, secrets)
+can be reused instead of being fetched on every call.
+When an entry is missing or expired only one thread loads it (single-flight), the others wait for its value.
+"""
+
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class TTLCache:
+    def __init__(self, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._lock = Lock()
+        self._key_locks: Dict[Hashable, Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Returns the cached value of the key, calls the loader if the value is missing or expired"""
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        with self._key_lock(key):
+            # another thread might have loaded the value while this one was waiting for the lock
+            found, value = self._lookup(key, count=False)
+            if found:
+                return value
+            value = loader()
+            self.put(key, value, ttl)
+            return value
+
+    def contains(self, key: Hashable) -> bool:
+        """Returns True if the key has a value that did not expire"""
+        return self._lookup(key)[0]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drops the key or the whole cache if no key is provided"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'name': self.name, 'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def _lookup(self, key: Hashable, count: bool = True) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            found = entry is not None and entry[1] > time.monotonic()
+            if count:
+                if found:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return found, entry[0] if found else None
+
+    def _key_lock(self, key: Hashable) -> Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, Lock())
+
+
+# SSM parameters and secrets of data.all, shared by Parameter, ParameterStoreManager, SecretsManager and SessionHelper
+parameter_cache = TTLCache(name='parameters', ttl=int(os.getenv('PARAMETER_CACHE_TTL', '300')))
+# SSM parameters that were not found are cached for a few seconds only
+PARAMETER_CACHE_NEGATIVE_TTL = int(os.getenv('PARAMETER_CACHE_NEGATIVE_TTL', '10'))
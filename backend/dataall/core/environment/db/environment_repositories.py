@@ -5,7 +5,7 @@ from dataall.core.environment.db.environment_models import (
     ConsumptionRole,
     EnvironmentGroup,
 )
-from sqlalchemy.sql import and_, or_
+from sqlalchemy.sql import and_, or_, tuple_
 from sqlalchemy.orm import Query
 
 from dataall.base.db import exceptions
@@ -91,6 +91,25 @@ class EnvironmentRepository:
             .first()
         )
 
+    @staticmethod
+    def get_environments_by_uris(session, uris) -> List[Environment]:
+        return session.query(Environment).filter(Environment.environmentUri.in_(uris)).all()
+
+    @staticmethod
+    def get_consumption_roles_by_uris(session, role_uris) -> List[ConsumptionRole]:
+        return session.query(ConsumptionRole).filter(ConsumptionRole.consumptionRoleUri.in_(role_uris)).all()
+
+    @staticmethod
+    def get_environment_groups(session, group_environment_uris) -> List[EnvironmentGroup]:
+        """Environment groups of a list of (groupUri, environmentUri)"""
+        return (
+            session.query(EnvironmentGroup)
+            .filter(
+                tuple_(EnvironmentGroup.groupUri, EnvironmentGroup.environmentUri).in_(list(group_environment_uris))
+            )
+            .all()
+        )
+
     @staticmethod
     def get_environment_group(session, group_uri, environment_uri):
         return (
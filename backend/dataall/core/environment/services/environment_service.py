@@ -1003,6 +1003,7 @@ class EnvironmentService:
                 aws_session = SessionHelper.get_session(
                     base_session=pivot_session,
                     role_arn=environment.EnvironmentDefaultIAMRoleArn,
+                    cached=False,
                 )
             else:
                 raise exceptions.UnauthorizedOperation(
@@ -1022,6 +1023,7 @@ class EnvironmentService:
                 aws_session = SessionHelper.get_session(
                     base_session=pivot_session,
                     role_arn=env_group.environmentIAMRoleArn,
+                    cached=False,
                 )
             if not aws_session:
                 raise exceptions.AWSResourceNotFound(
@@ -1056,13 +1058,14 @@ class EnvironmentService:
         context = get_context()
         with context.db_engine.scoped_session() as session:
             environment = EnvironmentService.get_environment_by_uri(session, uri)
-            c = EnvironmentService._get_environment_group_aws_session(
+            aws_session = EnvironmentService._get_environment_group_aws_session(
                 session=session,
                 username=context.username,
                 groups=context.groups,
                 environment=environment,
                 groupUri=groupUri,
-            ).get_credentials()
+            )
+            c = aws_session.get_credentials().get_frozen_credentials()
             return {
                 'AccessKey': c.access_key,
                 'SessionKey': c.secret_key,
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import List
+from typing import Dict, List, Optional
 
 
 class StackFinder(ABC):
@@ -15,3 +15,11 @@ class StackFinder(ABC):
     def find_stack_uris(self, session) -> List[str]:
         """Finds stacks to update"""
         raise NotImplementedError('find_stack_uris is not implemented')
+
+    def find_stack_uris_by_environment(self, session) -> Dict[Optional[str], List[str]]:
+        """
+        Finds stacks to update grouped by the environment they are deployed to.
+        The stacks of an environment are updated after the stack of the environment, the stacks of None after all
+        the environments
+        """
+        return {None: self.find_stack_uris(session)}
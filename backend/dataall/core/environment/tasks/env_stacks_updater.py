@@ -1,7 +1,8 @@
 import logging
 import os
-import sys
 import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
 
 from dataall.base.loader import ImportMode, load_modules
 from dataall.core.environment.db.environment_models import Environment
@@ -17,47 +18,158 @@ log = logging.getLogger(__name__)
 
 RETRIES = 30
 SLEEP_TIME = 30
+# number of environment stacks updated at the same time, the stacks of an account and region are updated one at a time
+MAX_CONCURRENT_UPDATES = int(os.getenv('STACK_UPDATER_MAX_CONCURRENT_UPDATES', '10'))
+# number of the slowest environments listed in the summary of the run
+SLOWEST_UPDATES_REPORTED = 5
+
+
+class _StackUpdate:
+    def __init__(self, environment: Environment, stack_uri: str, name: str):
+        self.environment = environment
+        self.stack_uri = stack_uri
+        self.name = name
+        self.started = time.monotonic()
+        self.duration = None
+        self.status = None
+
+    @property
+    def started_by(self):
+        return f'awsworker-{self.stack_uri}'
+
+
+class StackUpdateScheduler:
+    """
+    Updates the stacks of the environments, up to max_concurrent environments at the same time, one at a time per
+    account and region. The running cdkproxy tasks of the cluster are listed once per poll for all the updates.
+    The stacks of an environment (datasets...) are updated as soon as the stack of the environment is updated
+    """
+
+    def __init__(
+        self,
+        session,
+        envname,
+        max_concurrent=MAX_CONCURRENT_UPDATES,
+        poll_interval=SLEEP_TIME,
+        timeout=RETRIES * SLEEP_TIME,
+    ):
+        self._session = session
+        self._cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+        self._max_concurrent = max(1, max_concurrent)
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+        self._running_tasks: Set[str] = set()
+        self._in_flight: Dict[str, _StackUpdate] = {}
+        self._busy_accounts = set()
+        self._finished: List[_StackUpdate] = []
+        self._dependent_stacks_started = 0
+        self._dependent_stacks_skipped = 0
+
+    def run(self, environments: List[Environment], dependent_stacks: Dict[Optional[str], List[str]]):
+        started = time.monotonic()
+        dependent_stacks = dict(dependent_stacks)
+        pending = list(environments)
+        self._running_tasks = Ecs.list_running_tasks_started_by(self._cluster_name)
+
+        while pending or self._in_flight:
+            pending = self._start_updates(pending, dependent_stacks)
+            if not self._in_flight:
+                continue
+            time.sleep(self._poll_interval)
+            self._running_tasks = Ecs.list_running_tasks_started_by(self._cluster_name)
+            for update in list(self._in_flight.values()):
+                if update.started_by not in self._running_tasks:
+                    self._finish(update, 'COMPLETE', dependent_stacks)
+                elif time.monotonic() - update.started > self._timeout:
+                    log.info(f'Update for {update.name}//{update.stack_uri} is not complete after {self._timeout}s')
+                    self._finish(update, 'TIMEOUT', dependent_stacks)
+
+        # the stacks without environment or of an environment that is not active
+        for stack_uris in dependent_stacks.values():
+            self._start_dependent_stacks(stack_uris)
+
+        self._log_summary(time.monotonic() - started)
+
+    def _start_updates(self, pending, dependent_stacks):
+        """Starts the updates of the pending environments that can start now and returns the others"""
+        waiting = []
+        for environment in pending:
+            account = (environment.AwsAccountId, environment.region)
+            if len(self._in_flight) >= self._max_concurrent or account in self._busy_accounts:
+                waiting.append(environment)
+                continue
+            try:
+                stack = StackRepository.get_stack_by_target_uri(self._session, target_uri=environment.environmentUri)
+                update = _StackUpdate(environment, stack.stackUri, stack.name)
+                if update.started_by in self._running_tasks:
+                    log.info(f'Stack update is already running... Waiting for stack {stack.name}//{stack.stackUri}')
+                else:
+                    stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
+                    self._session.commit()
+            except Exception as e:
+                log.error(f'Failed to start the update of environment {environment.environmentUri}: {e}')
+                update = _StackUpdate(environment, None, environment.name)
+                self._finish(update, 'FAILED', dependent_stacks)
+                continue
+            self._in_flight[update.stack_uri] = update
+            self._busy_accounts.add(account)
+        return waiting
+
+    def _finish(self, update: _StackUpdate, status, dependent_stacks):
+        update.duration = time.monotonic() - update.started
+        update.status = status
+        self._finished.append(update)
+        if update.stack_uri in self._in_flight:
+            del self._in_flight[update.stack_uri]
+            self._busy_accounts.discard((update.environment.AwsAccountId, update.environment.region))
+        log.info(f'Update for {update.name}//{update.stack_uri} {status} in {update.duration:.0f}s')
+        self._start_dependent_stacks(dependent_stacks.pop(update.environment.environmentUri, []))
+
+    def _start_dependent_stacks(self, target_uris):
+        for target_uri in target_uris:
+            try:
+                stack = StackRepository.get_stack_by_target_uri(self._session, target_uri=target_uri)
+                if f'awsworker-{stack.stackUri}' in self._running_tasks:
+                    log.info(f'Stack update is already running... Skipping stack {stack.name}//{stack.stackUri}')
+                    self._dependent_stacks_skipped += 1
+                    continue
+                stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
+                self._session.commit()
+                self._dependent_stacks_started += 1
+            except Exception as e:
+                log.error(f'Failed to start the update of stack {target_uri}: {e}')
+
+    def _log_summary(self, elapsed):
+        statuses = defaultdict(int)
+        for update in self._finished:
+            statuses[update.status] += 1
+        log.info(
+            f'Updated {len(self._finished)} environment stacks in {elapsed:.0f}s '
+            f'({", ".join(f"{count} {status}" for status, count in statuses.items()) or "none"}), '
+            f'started {self._dependent_stacks_started} other stacks, skipped {self._dependent_stacks_skipped} '
+            f'already running, {self._max_concurrent} concurrent updates'
+        )
+        slowest = sorted(self._finished, key=lambda update: update.duration, reverse=True)[:SLOWEST_UPDATES_REPORTED]
+        if slowest:
+            log.info(
+                'Slowest environment stacks: '
+                + ', '.join(f'{update.name}//{update.stack_uri} ({update.duration:.0f}s)' for update in slowest)
+            )
 
 
 def update_stacks(engine, envname):
     with engine.scoped_session() as session:
         all_environments: [Environment] = EnvironmentService.list_all_active_environments(session)
-        additional_stacks = []
+        dependent_stacks = defaultdict(list)
         for finder in StackFinder.all():
-            additional_stacks.extend(finder.find_stack_uris(session))
+            for environment_uri, stack_uris in finder.find_stack_uris_by_environment(session).items():
+                dependent_stacks[environment_uri].extend(stack_uris)
+        additional_stacks = sum(len(stack_uris) for stack_uris in dependent_stacks.values())
 
         log.info(f'Found {len(all_environments)} environments, triggering update stack tasks...')
-        environment: Environment
-        for environment in all_environments:
-            update_stack(session=session, envname=envname, target_uri=environment.environmentUri, wait=True)
-
-        for stack_uri in additional_stacks:
-            update_stack(session=session, envname=envname, target_uri=stack_uri, wait=False)
-
-        return len(all_environments), len(additional_stacks)
-
-
-def update_stack(session, envname, target_uri, wait=False):
-    stack = StackRepository.get_stack_by_target_uri(session, target_uri=target_uri)
-    cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
-    if not Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
-        stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
-        if wait:
-            retries = 1
-            while Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
-                log.info(
-                    f'Update for {stack.name}//{stack.stackUri} is not complete, waiting for {SLEEP_TIME} seconds...'
-                )
-                time.sleep(SLEEP_TIME)
-                retries = retries + 1
-                if retries > RETRIES:
-                    log.info(f'Maximum number of retries exceeded ({RETRIES} retries), continuing task...')
-                    break
-            log.info(
-                f'Update for {stack.name}//{stack.stackUri} COMPLETE or maximum number of retries exceeded ({RETRIES} retries)'
-            )
-    else:
-        log.info(f'Stack update is already running... Skipping stack {stack.name}//{stack.stackUri}')
+        StackUpdateScheduler(session, envname).run(all_environments, dependent_stacks)
+
+        return len(all_environments), additional_stacks
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 import os
 
 from dataall.base.services.service_provider_factory import ServiceProviderFactory
+from dataall.base.services.group_membership_cache import get_groups_for_user
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.base.context import get_context
@@ -59,9 +60,7 @@ class GroupService:
             return GroupService.LOCAL_TEST_GROUPS
 
         # for real environment
-        service_provider = ServiceProviderFactory.get_service_provider_instance()
-        groups = service_provider.get_groups_for_user(userId)
-        return groups
+        return get_groups_for_user(userId)
 
     @staticmethod
     def get_user_list_for_group(groupUri):
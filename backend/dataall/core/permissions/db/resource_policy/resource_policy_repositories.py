@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List
+from typing import Optional, List, Set
 
 from sqlalchemy.sql import and_
 
@@ -40,6 +40,31 @@ class ResourcePolicyRepository:
         else:
             return policy
 
+    @staticmethod
+    def get_user_resource_permission_names(session, groups: [str], resource_uri: str) -> Set[str]:
+        """Returns the names of all the permissions that the groups have on the resource in a single query"""
+        permissions = (
+            session.query(Permission.name)
+            .join(
+                ResourcePolicyPermission,
+                Permission.permissionUri == ResourcePolicyPermission.permissionUri,
+            )
+            .join(
+                ResourcePolicy,
+                ResourcePolicy.sid == ResourcePolicyPermission.sid,
+            )
+            .filter(
+                and_(
+                    ResourcePolicy.principalId.in_(groups),
+                    ResourcePolicy.principalType == 'GROUP',
+                    ResourcePolicy.resourceUri == resource_uri,
+                )
+            )
+            .distinct()
+            .all()
+        )
+        return {permission.name for permission in permissions}
+
     @staticmethod
     def has_group_resource_permission(
         session, group_uri: str, resource_uri: str, permission_name: str
@@ -1,4 +1,5 @@
 import logging
+from typing import Dict, Set
 
 from sqlalchemy.sql import and_
 
@@ -37,6 +38,32 @@ class TenantPolicyRepository:
         )
         return tenant_policy
 
+    @staticmethod
+    def get_groups_tenant_permission_names(session, groups: [str], tenant_name: str) -> Dict[str, Set[str]]:
+        """
+        Returns the names of the tenant permissions of each group that has a tenant policy in a single query,
+        the groups without a tenant policy are missing from the result
+        """
+        rows = (
+            session.query(TenantPolicy.principalId, Permission.name)
+            .join(Tenant, Tenant.tenantUri == TenantPolicy.tenantUri)
+            .outerjoin(TenantPolicyPermission, TenantPolicy.sid == TenantPolicyPermission.sid)
+            .outerjoin(Permission, Permission.permissionUri == TenantPolicyPermission.permissionUri)
+            .filter(
+                and_(
+                    TenantPolicy.principalId.in_(groups),
+                    Tenant.name == tenant_name,
+                )
+            )
+            .all()
+        )
+        permissions = {}
+        for group, permission_name in rows:
+            group_permissions = permissions.setdefault(group, set())
+            if permission_name:
+                group_permissions.add(permission_name)
+        return permissions
+
     @staticmethod
     def has_group_tenant_permission(session, group_uri: str, tenant_name: str, permission_name: str):
         tenant_policy: TenantPolicy = (
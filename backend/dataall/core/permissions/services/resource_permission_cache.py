@@ -0,0 +1,79 @@
+"""
+Request-scoped cache of the resource permissions of the user.
+A single GraphQL request can check the same resource many times (e.g. for every node of a list), so the whole
+set of permissions that the user groups have on a resource is loaded once and memoized in the RequestContext.
+Outside the request scope (ECS tasks, handlers without a context) the cache is bypassed.
+"""
+
+import logging
+from threading import Lock
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from dataall.base.context import find_context
+from dataall.core.permissions.db.resource_policy.resource_policy_repositories import ResourcePolicyRepository
+
+log = logging.getLogger(__name__)
+
+_CACHE_KEY = 'resource_permissions'
+
+
+class ResourcePermissionCache:
+    """Permissions of a set of groups per resource_uri, valid for a single request"""
+
+    _lock = Lock()
+    _total_hits = 0
+    _total_misses = 0
+
+    def __init__(self):
+        self._permissions: Dict[Tuple[FrozenSet[str], str], Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def current(cls) -> Optional['ResourcePermissionCache']:
+        context = find_context()
+        if context is None:
+            return None
+        return context.cache.setdefault(_CACHE_KEY, cls())
+
+    @classmethod
+    def get_permissions(cls, session, groups: List[str], resource_uri: str) -> Set[str]:
+        """Returns the names of the permissions the groups have on the resource, memoized for the current request"""
+        cache = cls.current()
+        if cache is None:
+            return ResourcePolicyRepository.get_user_resource_permission_names(session, groups, resource_uri)
+
+        key = (frozenset(groups or []), resource_uri)
+        permissions = cache._permissions.get(key)
+        if permissions is not None:
+            cache._record(hit=True)
+            return permissions
+
+        cache._record(hit=False)
+        permissions = ResourcePolicyRepository.get_user_resource_permission_names(session, groups, resource_uri)
+        cache._permissions[key] = permissions
+        return permissions
+
+    @classmethod
+    def invalidate(cls, resource_uri: str) -> None:
+        """Drops the cached permissions of the resource, must be called when policies of the resource change"""
+        cache = cls.current()
+        if cache is None:
+            return
+        for key in [key for key in cache._permissions if key[1] == resource_uri]:
+            del cache._permissions[key]
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Hits and misses accumulated by all the requests handled by this process"""
+        with cls._lock:
+            return {'hits': cls._total_hits, 'misses': cls._total_misses}
+
+    def _record(self, hit: bool) -> None:
+        with ResourcePermissionCache._lock:
+            if hit:
+                self.hits += 1
+                ResourcePermissionCache._total_hits += 1
+            else:
+                self.misses += 1
+                ResourcePermissionCache._total_misses += 1
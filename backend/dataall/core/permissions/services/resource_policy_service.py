@@ -3,6 +3,7 @@ from dataall.core.permissions.db.resource_policy.resource_policy_repositories im
 from dataall.base.db import exceptions
 from dataall.core.permissions.db.resource_policy.resource_policy_models import ResourcePolicy, ResourcePolicyPermission
 from dataall.core.permissions.services.permission_service import PermissionService
+from dataall.core.permissions.services.resource_permission_cache import ResourcePermissionCache
 from typing import Protocol, Callable, List
 from dataall.base.context import get_context
 from functools import wraps
@@ -62,23 +63,22 @@ class ResourcePolicyRequestValidationService:
 class ResourcePolicyService:
     @staticmethod
     def check_user_resource_permission(session, username: str, groups: [str], resource_uri: str, permission_name: str):
-        resource_policy = None
+        has_permission = False
         if username and permission_name and resource_uri:
-            resource_policy = ResourcePolicyRepository.has_user_resource_permission(
+            has_permission = permission_name in ResourcePermissionCache.get_permissions(
                 session=session,
                 groups=groups,
-                permission_name=permission_name,
                 resource_uri=resource_uri,
             )
 
-        if not resource_policy:
+        if not has_permission:
             raise exceptions.ResourceUnauthorized(
                 username=username,
                 action=permission_name,
                 resource_uri=resource_uri,
             )
         else:
-            return resource_policy
+            return has_permission
 
     @staticmethod
     def find_resource_policies(session, group, resource_uri, resource_type, permissions: List[str] = None):
@@ -123,6 +123,8 @@ class ResourcePolicyService:
         except Exception as e:
             session.rollback()
             raise e
+        finally:
+            ResourcePermissionCache.invalidate(resource_uri)
         return True
 
     @staticmethod
@@ -210,6 +212,7 @@ class ResourcePolicyService:
         )
         session.add(policy_permission)
         session.commit()
+        ResourcePermissionCache.invalidate(policy.resourceUri)
 
     @staticmethod
     def get_resource_policy_permissions(session, group_uri, resource_uri) -> List[ResourcePolicyPermission]:
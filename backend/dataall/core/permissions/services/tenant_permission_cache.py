@@ -0,0 +1,62 @@
+"""
+Request-scoped cache of the tenant permissions of the user.
+Every API request makes sure that the groups of the user have a tenant policy, and most requests check one or more
+tenant permissions of the same groups. The policies of all the groups are loaded with a single query and memoized in
+the RequestContext. The groups known to have a tenant policy are also kept in process memory for
+TENANT_POLICY_CACHE_TTL seconds, so that the policies are only looked up when a new group appears.
+Outside the request scope (ECS tasks, handlers without a context) the request cache is bypassed.
+"""
+
+import logging
+import os
+from typing import Dict, List, Set
+
+from dataall.base.context import find_context
+from dataall.base.utils.ttl_cache import TTLCache
+from dataall.core.permissions.db.tenant.tenant_policy_repositories import TenantPolicyRepository
+
+log = logging.getLogger(__name__)
+
+_CACHE_KEY = 'tenant_permissions'
+
+# (tenant_name, group) of the groups that have a tenant policy
+tenant_policy_groups = TTLCache(name='tenant_policy_groups', ttl=int(os.getenv('TENANT_POLICY_CACHE_TTL', '300')))
+
+
+class TenantPermissionCache:
+    @staticmethod
+    def get_group_permissions(session, groups: List[str], tenant_name: str) -> Dict[str, Set[str]]:
+        """Returns the tenant permissions of each group that has a tenant policy, memoized for the current request"""
+        context = find_context()
+        if context is None:
+            return TenantPolicyRepository.get_groups_tenant_permission_names(session, groups, tenant_name)
+
+        snapshots = context.cache.setdefault(_CACHE_KEY, {})
+        key = (frozenset(groups or []), tenant_name)
+        if key not in snapshots:
+            snapshots[key] = TenantPolicyRepository.get_groups_tenant_permission_names(session, groups, tenant_name)
+            for group in snapshots[key]:
+                tenant_policy_groups.put((tenant_name, group), True)
+        return snapshots[key]
+
+    @staticmethod
+    def has_permission(session, groups: List[str], tenant_name: str, permission_name: str) -> bool:
+        group_permissions = TenantPermissionCache.get_group_permissions(session, groups, tenant_name)
+        return any(permission_name in permissions for permissions in group_permissions.values())
+
+    @staticmethod
+    def get_groups_without_policy(session, groups: List[str], tenant_name: str) -> List[str]:
+        """Returns the groups that do not have a tenant policy, the database is queried only for unknown groups"""
+        unknown = [group for group in dict.fromkeys(groups) if not tenant_policy_groups.contains((tenant_name, group))]
+        if not unknown:
+            return []
+        group_permissions = TenantPermissionCache.get_group_permissions(session, groups, tenant_name)
+        return [group for group in unknown if group not in group_permissions]
+
+    @staticmethod
+    def invalidate(tenant_name: str, group: str) -> None:
+        """Drops the cached permissions of the group, must be called when the tenant policy of the group changes"""
+        tenant_policy_groups.invalidate((tenant_name, group))
+        context = find_context()
+        if context is not None:
+            context.cache.pop(_CACHE_KEY, None)
@@ -7,6 +7,7 @@ from dataall.core.permissions.db.tenant.tenant_models import TenantPolicy, Tenan
 from dataall.base.context import get_context
 from dataall.core.permissions.db.tenant.tenant_repositories import TenantRepository
 from dataall.core.permissions.services.permission_service import PermissionService
+from dataall.core.permissions.services.tenant_permission_cache import TenantPermissionCache
 from dataall.core.permissions.db.tenant.tenant_models import Tenant
 from dataall.base.services.service_provider_factory import ServiceProviderFactory
 from dataall.base.aws.sts import SessionHelper
@@ -218,13 +219,7 @@ class TenantPolicyService:
             return True
 
         with get_context().db_engine.scoped_session() as session:
-            tenant_policy = TenantPolicyRepository.has_user_tenant_permission(
-                session=session,
-                groups=groups,
-                permission_name=permission_name,
-                tenant_name=tenant_name,
-            )
-            return tenant_policy is not None
+            return TenantPermissionCache.has_permission(session, groups, tenant_name, permission_name)
 
     @staticmethod
     def check_user_tenant_permission(session, username: str, groups: [str], tenant_name: str, permission_name: str):
@@ -234,22 +229,14 @@ class TenantPolicyService:
         if not username or not permission_name:
             return False
 
-        tenant_policy = TenantPolicyRepository.has_user_tenant_permission(
-            session=session,
-            groups=groups,
-            permission_name=permission_name,
-            tenant_name=tenant_name,
-        )
-
-        if not tenant_policy:
+        if not TenantPermissionCache.has_permission(session, groups, tenant_name, permission_name):
             raise exceptions.TenantUnauthorized(
                 username=username,
                 action=permission_name,
                 tenant_name=tenant_name,
             )
 
-        else:
-            return tenant_policy
+        return True
 
     @staticmethod
     def attach_group_tenant_policy(
@@ -263,9 +250,22 @@ class TenantPolicyService:
         policy = TenantPolicyService.save_group_tenant_policy(session, group, tenant_name)
 
         TenantPolicyService.add_permission_to_group_tenant_policy(session, group, permissions, tenant_name, policy)
+        TenantPermissionCache.invalidate(tenant_name, group)
 
         return policy
 
+    @staticmethod
+    def attach_missing_group_tenant_policies(session, groups: [str], permissions: [str], tenant_name: str):
+        """Attaches a tenant policy with the permissions to the groups that do not have a tenant policy yet"""
+        for group in TenantPermissionCache.get_groups_without_policy(session, groups, tenant_name):
+            log.info(f'No policy found for Team {group}. Attaching {len(permissions)} tenant permissions')
+            TenantPolicyService.attach_group_tenant_policy(
+                session=session,
+                group=group,
+                permissions=permissions,
+                tenant_name=tenant_name,
+            )
+
     @staticmethod
     def find_tenant_policy(session, group_uri: str, tenant_name: str):
         RequestValidationService.validate_find_tenant_policy(group_uri, tenant_name)
@@ -355,6 +355,7 @@ class TenantPolicyService:
                 session.delete(permission)
             session.delete(policy)
             session.commit()
+        TenantPermissionCache.invalidate(tenant_name, group)
 
         return True
 
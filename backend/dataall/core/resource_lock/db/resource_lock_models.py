@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, DateTime
 
 from dataall.base.db import Base
 
@@ -11,6 +11,8 @@ class ResourceLock(Base):
     resourceType = Column(String, nullable=False, primary_key=True)
     acquiredByUri = Column(String, nullable=True)
     acquiredByType = Column(String, nullable=True)
+    acquiredAt = Column(DateTime, nullable=True)
+    expiresAt = Column(DateTime, nullable=True)
 
     def __init__(
         self,
@@ -18,8 +20,12 @@ class ResourceLock(Base):
         resourceType: str,
         acquiredByUri: Optional[str] = None,
         acquiredByType: Optional[str] = None,
+        acquiredAt=None,
+        expiresAt=None,
     ):
         self.resourceUri = resourceUri
         self.resourceType = resourceType
         self.acquiredByUri = acquiredByUri
         self.acquiredByType = acquiredByType
+        self.acquiredAt = acquiredAt
+        self.expiresAt = expiresAt
@@ -1,137 +1,302 @@
 import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from threading import Condition, Event, Lock, Thread
+from typing import List, Tuple
 
-from dataall.core.resource_lock.db.resource_lock_models import ResourceLock
 from sqlalchemy import and_, or_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from time import sleep
-from typing import List, Tuple
-from contextlib import contextmanager
+
 from dataall.base.db.exceptions import ResourceLockTimeout
+from dataall.core.resource_lock.db.resource_lock_models import ResourceLock
 
 log = logging.getLogger(__name__)
 
-MAX_RETRIES = 10
-RETRY_INTERVAL = 60
+# maximum time spent waiting for the locks before giving up with ResourceLockTimeout
+LOCK_TIMEOUT_SECONDS = int(os.getenv('RESOURCE_LOCK_TIMEOUT_SECONDS', '600'))
+# locks older than the lease were left by a crashed holder and can be taken over
+LOCK_LEASE_SECONDS = int(os.getenv('RESOURCE_LOCK_LEASE_SECONDS', '7200'))
+# the holder of the locks renews their lease at this interval, so that they expire only if the holder is gone
+LOCK_HEARTBEAT_SECONDS = int(os.getenv('RESOURCE_LOCK_HEARTBEAT_SECONDS', str(LOCK_LEASE_SECONDS // 4)))
+# the wait between two attempts starts short and doubles up to the maximum
+MIN_RETRY_INTERVAL = 0.5
+MAX_RETRY_INTERVAL = 15
+
+# wakes up the waiters of the process as soon as a lock is released
+_lock_released = Condition()
+
+
+class LockWaitMetrics:
+    """Lock wait statistics of the process"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        self.acquired = 0
+        self.timeouts = 0
+        self.contended = 0
+        self.expired = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record(self, waited, attempts, acquired):
+        with self._lock:
+            if acquired:
+                self.acquired += 1
+            else:
+                self.timeouts += 1
+            if attempts > 1:
+                self.contended += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+    def record_expired(self, count):
+        with self._lock:
+            self.expired += count
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'acquired': self.acquired,
+                'timeouts': self.timeouts,
+                'contended': self.contended,
+                'expired': self.expired,
+                'wait_time': round(self.wait_time, 3),
+                'max_wait_time': round(self.max_wait_time, 3),
+            }
+
+
+lock_wait_metrics = LockWaitMetrics()
+
+
+class _LeaseHeartbeat:
+    """
+    Renews the leases of the locks in a background thread while they are held.
+    The thread uses its own session, the session of the holder is not thread safe
+    """
+
+    def __init__(self, engine, resources, acquired_by_uri):
+        self._engine = engine
+        self._resources = resources
+        self._acquired_by_uri = acquired_by_uri
+        self._stopped = Event()
+        self._thread = Thread(target=self._run, name='resource-lock-heartbeat', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(LOCK_HEARTBEAT_SECONDS):
+            session = Session(bind=self._engine)
+            try:
+                renewed = ResourceLockRepository._renew_locks(session, self._resources, self._acquired_by_uri)
+                if renewed < len(self._resources):
+                    log.error(f'The locks of {self._acquired_by_uri} on {self._resources} were lost, {renewed=}')
+            except Exception as e:
+                session.rollback()
+                log.error(f'Failed to renew the locks of {self._acquired_by_uri} on {self._resources}: {e}')
+            finally:
+                session.close()
 
 
 class ResourceLockRepository:
+    @staticmethod
+    def _resources_filter(resources):
+        return or_(
+            *[
+                and_(ResourceLock.resourceUri == resource[0], ResourceLock.resourceType == resource[1])
+                for resource in resources
+            ]
+        )
+
     @staticmethod
     def _acquire_locks(resources, session, acquired_by_uri, acquired_by_type):
         """
         Attempts to acquire/create one or more locks on the resources identified by resourceUri and resourceType.
+        The locks are inserted with ON CONFLICT DO NOTHING on the primary key, so that concurrent attempts on the same
+        resource cannot both succeed. Either all the locks are acquired or none of them.
 
         Args:
             resources: List of resource tuples (resourceUri, resourceType) to acquire locks for.
             session (sqlalchemy.orm.Session): The SQLAlchemy session object used for interacting with the database.
             acquired_by_uri: The ID of the resource that is attempting to acquire the lock.
-            acquired_by_type: The resource type that is attempting to acquire the lock.qu
+            acquired_by_type: The resource type that is attempting to acquire the lock.
 
         Returns:
             bool: True if the lock is successfully acquired, False otherwise.
         """
+        now = datetime.now()
         try:
-            # Execute the query to get the ResourceLock object
-            filter_conditions = [
-                and_(
-                    ResourceLock.resourceUri == resource[0],
-                    ResourceLock.resourceType == resource[1],
-                )
-                for resource in resources
-            ]
-
-            if not session.query(ResourceLock).filter(or_(*filter_conditions)).first():
-                records = []
-                for resource in resources:
-                    records.append(
-                        ResourceLock(
+            ResourceLockRepository._delete_expired_locks(session, resources, now)
+            savepoint = session.begin_nested()
+            inserted = session.execute(
+                insert(ResourceLock.__table__)
+                .values(
+                    [
+                        dict(
                             resourceUri=resource[0],
                             resourceType=resource[1],
                             acquiredByUri=acquired_by_uri,
                             acquiredByType=acquired_by_type,
+                            acquiredAt=now,
+                            expiresAt=now + timedelta(seconds=LOCK_LEASE_SECONDS),
                         )
-                    )
-                session.add_all(records)
-                session.commit()
-                return True
-            else:
-                log.info(
-                    'Not all ResourceLocks were found. One or more ResourceLocks may be acquired by another resource...'
+                        for resource in resources
+                    ]
                 )
+                .on_conflict_do_nothing(index_elements=['resourceUri', 'resourceType'])
+                .returning(ResourceLock.resourceUri)
+            ).fetchall()
+            if len(inserted) < len(resources):
+                savepoint.rollback()
+                log.info('One or more ResourceLocks are acquired by another resource...')
                 return False
+            savepoint.commit()
+            session.commit()
+            return True
         except Exception as e:
             session.expunge_all()
             session.rollback()
-            log.error('Error occurred while acquiring lock:', e)
+            log.error(f'Error occurred while acquiring lock: {e}')
             return False
 
     @staticmethod
-    def _release_lock(session, resource_uri, resource_type, share_uri):
+    def _delete_expired_locks(session, resources, now):
+        expired = (
+            session.query(ResourceLock)
+            .filter(
+                and_(
+                    ResourceLockRepository._resources_filter(resources),
+                    ResourceLock.expiresAt < now,
+                )
+            )
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for resource_lock in expired:
+            log.warning(
+                f'Lease of the lock of resource {resource_lock.resourceUri=}, {resource_lock.resourceType=} '
+                f'acquired by {resource_lock.acquiredByUri} at {resource_lock.acquiredAt} expired, releasing it'
+            )
+            session.delete(resource_lock)
+        if expired:
+            session.commit()
+            lock_wait_metrics.record_expired(len(expired))
+
+    @staticmethod
+    def _renew_locks(session, resources, acquired_by_uri) -> int:
+        """Extends the leases of the locks held by acquired_by_uri, returns the number of locks renewed"""
+        renewed = (
+            session.query(ResourceLock)
+            .filter(
+                and_(
+                    ResourceLockRepository._resources_filter(resources),
+                    ResourceLock.acquiredByUri == acquired_by_uri,
+                )
+            )
+            .update(
+                {ResourceLock.expiresAt: datetime.now() + timedelta(seconds=LOCK_LEASE_SECONDS)},
+                synchronize_session=False,
+            )
+        )
+        session.commit()
+        return renewed
+
+    @staticmethod
+    def _release_locks(session, resources, acquired_by_uri):
         """
-        Releases/delete the lock on the resource identified by resource_uri, resource_type.
+        Releases/delete the locks on the resources that are acquired by acquired_by_uri and wakes up the waiters.
 
         Args:
             session (sqlalchemy.orm.Session): The SQLAlchemy session object used for interacting with the database.
-            resource_uri: The ID of the resource that owns the lock.
-            resource_type: The type of the resource that owns the lock.
-            share_uri: The ID of the share that is attempting to release the lock.
+            resources: List of resource tuples (resourceUri, resourceType) to release the locks of.
+            acquired_by_uri: The ID of the resource that is attempting to release the lock.
 
         Returns:
-            bool: True if the lock is successfully released, False otherwise.
+            bool: True if all the locks are successfully released, False otherwise.
         """
         try:
-            log.info(f'Releasing lock for resource: {resource_uri=}, {resource_type=}')
-
-            resource_lock = (
+            log.info(f'Releasing lock for resources: {resources}')
+            released = (
                 session.query(ResourceLock)
                 .filter(
                     and_(
-                        ResourceLock.resourceUri == resource_uri,
-                        ResourceLock.resourceType == resource_type,
-                        ResourceLock.acquiredByUri == share_uri,
+                        ResourceLockRepository._resources_filter(resources),
+                        ResourceLock.acquiredByUri == acquired_by_uri,
                     )
                 )
-                .with_for_update()
-                .first()
+                .delete(synchronize_session=False)
             )
-
-            if resource_lock:
-                session.delete(resource_lock)
-                session.commit()
-                return True
-            else:
-                log.info(f'ResourceLock not found for resource: {resource_uri=}, {resource_type=}')
-                return False
-
+            session.commit()
+            if released < len(resources):
+                log.info(f'Not all ResourceLocks were found for resources: {resources}')
+            return released == len(resources)
         except Exception as e:
             session.expunge_all()
             session.rollback()
-            log.error('Error occurred while releasing lock:', e)
+            log.error(f'Error occurred while releasing lock: {e}')
             return False
+        finally:
+            with _lock_released:
+                _lock_released.notify_all()
 
     @staticmethod
     @contextmanager
     def acquire_lock_with_retry(
         resources: List[Tuple[str, str]], session: Session, acquired_by_uri: str, acquired_by_type: str
     ):
-        retries_remaining = MAX_RETRIES
+        """
+        Acquires the locks on the resources for the duration of the context.
+        While the locks are held by another resource, the attempts are repeated with an exponential backoff,
+        and as soon as a lock is released in this process. Raises ResourceLockTimeout after LOCK_TIMEOUT_SECONDS.
+        The leases of the locks are renewed every LOCK_HEARTBEAT_SECONDS until the context exits
+        """
         log.info(f'Attempting to acquire lock for resources {resources} by share {acquired_by_uri}...')
+        started = time.monotonic()
+        deadline = started + LOCK_TIMEOUT_SECONDS
+        interval = MIN_RETRY_INTERVAL
+        attempts = 1
         while not (
             lock_acquired := ResourceLockRepository._acquire_locks(
                 resources, session, acquired_by_uri, acquired_by_type
             )
         ):
-            log.info(
-                f'Lock for one or more resources {resources} already acquired. Retrying in {RETRY_INTERVAL} seconds...'
-            )
-            sleep(RETRY_INTERVAL)
-            retries_remaining -= 1
-            if retries_remaining <= 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                waited = time.monotonic() - started
+                lock_wait_metrics.record(waited, attempts, acquired=False)
+                log.error(
+                    f'Failed to acquire lock for resources {resources} after {attempts} attempts in {waited:.1f}s, '
+                    f'lock metrics: {lock_wait_metrics.to_dict()}'
+                )
                 raise ResourceLockTimeout(
                     'process shares',
                     f'Failed to acquire lock for one or more of {resources=}',
                 )
+            wait = min(interval * random.uniform(0.5, 1), remaining)
+            log.info(f'Lock for one or more resources {resources} already acquired. Retrying in {wait:.1f} seconds...')
+            with _lock_released:
+                _lock_released.wait(timeout=wait)
+            interval = min(interval * 2, MAX_RETRY_INTERVAL)
+            attempts += 1
+
+        waited = time.monotonic() - started
+        lock_wait_metrics.record(waited, attempts, acquired=True)
+        log.info(f'Acquired lock for resources {resources} after {attempts} attempts in {waited:.1f}s')
+        heartbeat = _LeaseHeartbeat(session.get_bind(), resources, acquired_by_uri)
+        heartbeat.start()
         try:
             yield lock_acquired
         finally:
-            for resource in resources:
-                ResourceLockRepository._release_lock(session, resource[0], resource[1], acquired_by_uri)
+            heartbeat.stop()
+            ResourceLockRepository._release_locks(session, resources, acquired_by_uri)
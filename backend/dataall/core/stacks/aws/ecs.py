@@ -1,5 +1,6 @@
 import logging
 import os
+from typing import Set
 
 import boto3
 from botocore.exceptions import ClientError
@@ -8,6 +9,9 @@ from dataall.base.utils import Parameter
 
 log = logging.getLogger('aws:ecs')
 
+# maximum number of tasks of a DescribeTasks call
+DESCRIBE_TASKS_BATCH_SIZE = 100
+
 
 class Ecs:
     def __init__(self):
@@ -99,3 +103,20 @@ class Ecs:
         except ClientError as e:
             log.error(e)
             raise e
+
+    @staticmethod
+    def list_running_tasks_started_by(cluster_name) -> Set[str]:
+        """Returns the startedBy of all the running tasks of the cluster, with one DescribeTasks call per 100 tasks"""
+        try:
+            client = boto3.client('ecs')
+            task_arns = []
+            for page in client.get_paginator('list_tasks').paginate(cluster=cluster_name, desiredStatus='RUNNING'):
+                task_arns.extend(page['taskArns'])
+            started_by = set()
+            for i in range(0, len(task_arns), DESCRIBE_TASKS_BATCH_SIZE):
+                tasks = client.describe_tasks(cluster=cluster_name, tasks=task_arns[i : i + DESCRIBE_TASKS_BATCH_SIZE])
+                started_by.update(task['startedBy'] for task in tasks['tasks'] if task.get('startedBy'))
+            return started_by
+        except ClientError as e:
+            log.error(e)
+            raise e
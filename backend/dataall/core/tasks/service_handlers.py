@@ -1,8 +1,11 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
+from sqlalchemy import and_, update
+
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils.json_utils import to_json
 
@@ -22,6 +25,7 @@ class WorkerHandler:
     def __init__(self):
         self.handlers = {}
         self.enabled = True
+        self.max_workers = int(os.getenv('WORKER_MAX_WORKERS', '4'))
 
     def queue(self, engine, task_ids: [str]):
         log.info(f'Queuing Task Ids: {task_ids}')
@@ -34,46 +38,82 @@ class WorkerHandler:
         return decorator
 
     def process(self, engine, task_ids: [str], save_response=True):
+        """
+        Processes a batch of tasks.
+        All the pending tasks of the batch are claimed with a single statement, tasks of different targets run
+        concurrently (tasks of the same target run one after another in the order they were queued)
+        and their status is written back in bulk.
+        """
         tasks_responses = []
-        if self.enabled:
-            for taskid in task_ids:
-                try:
-                    log.info(f'Processing Task: {taskid}')
-                    handler, task = self.get_task_handler(engine, taskid)
-
-                    error, response, status = self.handle_task(engine, task, handler)
-                    if save_response:
-                        WorkerHandler.update_task(engine, taskid, error, to_json(response), status)
-
-                    else:
-                        WorkerHandler.update_task(engine, taskid, error, {}, status)
-                    tasks_responses.append(
-                        {
-                            'taskUri': taskid,
-                            'response': response,
-                            'error': error,
-                            'status': status,
-                        }
-                    )
-                    return tasks_responses
-                except Exception as e:
-                    log.exception('Error in process')
-                    log.error(f'Task processing failed {e} : {taskid}')
-        else:
+        if not self.enabled:
             log.info(f'Worker disabled, tasks {task_ids} wont be processed')
+            return tasks_responses
+
+        log.info(f'Processing Tasks: {task_ids}')
+        try:
+            tasks = self.claim_tasks(engine, task_ids)
+        except Exception as e:
+            log.exception('Error in process')
+            log.error(f'Tasks processing failed {e} : {task_ids}')
+            return tasks_responses
+
+        tasks_per_target = {}
+        for task in tasks:
+            tasks_per_target.setdefault(task.targetUri, []).append(task)
+
+        def run_target_tasks(target_tasks):
+            return [self._run_task(engine, task) for task in target_tasks]
+
+        groups = list(tasks_per_target.values())
+        if len(groups) <= 1 or self.max_workers <= 1:
+            results = [run_target_tasks(group) for group in groups]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                results = list(executor.map(run_target_tasks, groups))
+
+        responses = {response['taskUri']: response for group in results for response in group}
+        tasks_responses = [responses[task_id] for task_id in task_ids if task_id in responses]
+        try:
+            WorkerHandler.update_tasks(engine, tasks_responses, save_response)
+        except Exception as e:
+            log.exception('Error in process')
+            log.error(f'Failed to save the status of the tasks {e} : {task_ids}')
+        return tasks_responses
 
-    def get_task_handler(self, engine, taskid):
+    def claim_tasks(self, engine, task_ids: [str]) -> [Task]:
+        """Sets the pending tasks with a known handler to started in one statement and returns them"""
         with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            handler = self.handlers.get(task.action)
-            log.info(f' found handler {handler} for task action {task.action}|{task.taskUri}')
-            if task.status != 'pending':
-                raise Exception(f'Could not start task {task.taskUri} as its status is {task.status}')
-            if not handler:
-                raise Exception(f'No handler defined for {task.action}')
-            task.status = 'started'
+            claimed = session.execute(
+                update(Task.__table__)
+                .where(
+                    and_(
+                        Task.taskUri.in_(task_ids),
+                        Task.status == 'pending',
+                        Task.action.in_(list(self.handlers.keys())),
+                    )
+                )
+                .values(status='started')
+                .returning(Task.taskUri)
+            )
+            claimed_ids = {row.taskUri for row in claimed}
+            tasks = session.query(Task).filter(Task.taskUri.in_(claimed_ids)).all() if claimed_ids else []
             session.commit()
-        return handler, task
+
+        for task_id in set(task_ids) - claimed_ids:
+            log.error(f'Could not start task {task_id} as it is not pending or has no handler')
+        tasks_by_uri = {task.taskUri: task for task in tasks}
+        return [tasks_by_uri[task_id] for task_id in dict.fromkeys(task_ids) if task_id in tasks_by_uri]
+
+    def _run_task(self, engine, task: Task) -> dict:
+        handler = self.handlers.get(task.action)
+        log.info(f' found handler {handler} for task action {task.action}|{task.taskUri}')
+        error, response, status = self.handle_task(engine, task, handler)
+        return {
+            'taskUri': task.taskUri,
+            'response': response,
+            'error': error,
+            'status': status,
+        }
 
     @staticmethod
     def handle_task(engine, task: Task, handler):
@@ -98,6 +138,25 @@ class WorkerHandler:
             session.commit()
             return task
 
+    @staticmethod
+    def update_tasks(engine, tasks_responses: [dict], save_response=True):
+        if not tasks_responses:
+            return
+        with engine.scoped_session() as session:
+            session.bulk_update_mappings(
+                Task,
+                [
+                    {
+                        'taskUri': task_response['taskUri'],
+                        'status': task_response['status'],
+                        'error': task_response['error'],
+                        'response': to_json(task_response['response']) if save_response else {},
+                    }
+                    for task_response in tasks_responses
+                ],
+            )
+            session.commit()
+
     @classmethod
     def retry(cls, exception, tries=4, delay=3, backoff=2, logger=None):
         """
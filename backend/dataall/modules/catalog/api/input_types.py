@@ -104,6 +104,7 @@ GlossaryNodeSearchFilter = gql.InputType(
     arguments=[
         gql.Argument(name='term', type=gql.String),
         gql.Argument(name='nodeType', type=gql.String),
+        gql.Argument(name='maxDepth', type=gql.Integer),
         gql.Argument(name='page', type=gql.Integer),
         gql.Argument(name='pageSize', type=gql.Integer),
     ],
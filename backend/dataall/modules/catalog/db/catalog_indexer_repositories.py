@@ -0,0 +1,47 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from dataall.core.tasks.db.task_models import Task
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_INDEXING_ACTION = 'catalog.index.incremental'
+
+
+class CatalogIndexerRepository:
+    """
+    The high-water mark of the incremental catalog indexing is recorded in a single completed Task,
+    updated by every run with the mark and the counts of the run
+    """
+
+    @staticmethod
+    def get_high_water_mark(session) -> Optional[datetime]:
+        last_run: Task = (
+            session.query(Task)
+            .filter(Task.action == INCREMENTAL_INDEXING_ACTION, Task.status == 'completed')
+            .order_by(Task.created.desc())
+            .first()
+        )
+        if not last_run:
+            return None
+        return datetime.fromisoformat(last_run.payload['high_water_mark'])
+
+    @staticmethod
+    def save_high_water_mark(session, high_water_mark: datetime, indexed: int, deleted: int) -> Task:
+        runs = (
+            session.query(Task).filter(Task.action == INCREMENTAL_INDEXING_ACTION).order_by(Task.created.desc()).all()
+        )
+        # older deployments recorded a Task for each run, only the latest one is kept
+        for old_run in runs[1:]:
+            session.delete(old_run)
+        if runs:
+            run = runs[0]
+        else:
+            run = Task(action=INCREMENTAL_INDEXING_ACTION, targetUri='ALL', created=datetime.now())
+            session.add(run)
+        run.status = 'completed'
+        run.updated = datetime.now()
+        run.payload = {'high_water_mark': high_water_mark.isoformat()}
+        run.response = {'indexed': indexed, 'deleted': deleted}
+        return run
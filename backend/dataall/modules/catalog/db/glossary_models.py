@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, String, DateTime, Enum
+from sqlalchemy import Boolean, Column, String, DateTime, Enum, Index, Integer
 from sqlalchemy.orm import query_expression
 
 from dataall.base.db import Base
@@ -18,11 +18,20 @@ class GlossaryNodeStatus(enum.Enum):
 
 class GlossaryNode(Base):
     __tablename__ = 'glossary_node'
+    # the subtree of a node is the range of the paths starting with its path, text_pattern_ops serves the prefix LIKE.
+    # label and readme also have trigram indexes for the ilike searches, created by the migration when pg_trgm is
+    # available, they are excluded from the autogenerate comparison in alembic.ini
+    __table_args__ = (
+        Index('ix_glossary_node_path', 'path', 'depth', postgresql_ops={'path': 'text_pattern_ops'}),
+        Index('ix_glossary_node_parentUri', 'parentUri'),
+    )
     nodeUri = Column(String, primary_key=True, default=utils.uuid('glossary_node'))
     parentUri = Column(String, nullable=True)
     nodeType = Column(String, default='G')
     status = Column(String, Enum(GlossaryNodeStatus), default=GlossaryNodeStatus.draft.value)
     path = Column(String, nullable=False)
+    # number of nodes in the path, 1 for a glossary
+    depth = Column(Integer, nullable=True)
     label = Column(String, nullable=False)
     readme = Column(String, nullable=False)
     created = Column(DateTime, default=datetime.now)
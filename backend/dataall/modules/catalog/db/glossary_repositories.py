@@ -1,7 +1,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import asc, or_, and_, literal
+from sqlalchemy import asc, or_, and_, func, literal
 from sqlalchemy.orm import with_expression
 
 from dataall.base.db import exceptions, paginate
@@ -13,6 +13,24 @@ from dataall.base.context import get_context
 logger = logging.getLogger(__name__)
 
 
+def _path_depth(path: str) -> int:
+    return path.count('/')
+
+
+def _subtree(path: str, include_node=True, max_depth=None):
+    """
+    Filter of the nodes under the node of the path, and of the node itself if include_node.
+    The prefix LIKE is a range scan of the text_pattern_ops index on path, max_depth limits the levels below the node
+    """
+    pattern = path.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '/%'
+    condition = GlossaryNode.path.like(pattern)
+    if include_node:
+        condition = or_(GlossaryNode.path == path, condition)
+    if max_depth is not None:
+        condition = and_(condition, GlossaryNode.depth <= _path_depth(path) + max_depth)
+    return condition
+
+
 class GlossaryRepository:
     @staticmethod
     def create_glossary(session, data=None):
@@ -29,6 +47,7 @@ class GlossaryRepository:
         session.add(g)
         session.commit()
         g.path = f'/{g.nodeUri}'
+        g.depth = _path_depth(g.path)
         return g
 
     @staticmethod
@@ -48,6 +67,7 @@ class GlossaryRepository:
         session.add(cat)
         session.commit()
         cat.path = parent.path + '/' + cat.nodeUri
+        cat.depth = _path_depth(cat.path)
         return cat
 
     @staticmethod
@@ -69,6 +89,7 @@ class GlossaryRepository:
         session.add(term)
         session.commit()
         term.path = parent.path + '/' + term.nodeUri
+        term.depth = _path_depth(term.path)
         return term
 
     @staticmethod
@@ -90,7 +111,7 @@ class GlossaryRepository:
     def list_node_children(session, path, filter):
         q = (
             session.query(GlossaryNode)
-            .filter(GlossaryNode.path.startswith(path + '/'))
+            .filter(_subtree(path, include_node=False, max_depth=filter.get('maxDepth')))
             .order_by(asc(GlossaryNode.path))
         )
         term = filter.get('term')
@@ -110,7 +131,7 @@ class GlossaryRepository:
     def get_node_tree(session, path, filter):
         q = (
             session.query(GlossaryNode)
-            .filter(GlossaryNode.path.startswith(path))
+            .filter(_subtree(path, max_depth=filter.get('maxDepth')))
             .filter(GlossaryNode.deleted.is_(None))
             .order_by(asc(GlossaryNode.path))
         )
@@ -154,37 +175,28 @@ class GlossaryRepository:
 
     @staticmethod
     def get_glossary_categories_terms_and_associations(session, path):
-        categories = (
-            session.query(GlossaryNode)
-            .filter(
-                and_(
-                    GlossaryNode.path.startswith(path),
-                    GlossaryNode.nodeType == 'C',
-                    GlossaryNode.deleted.is_(None),
-                )
+        categories, terms = (
+            session.query(
+                func.count(GlossaryNode.nodeUri).filter(GlossaryNode.nodeType == 'C'),
+                func.count(GlossaryNode.nodeUri).filter(GlossaryNode.nodeType == 'T'),
             )
-            .count()
-        )
-        terms = (
-            session.query(GlossaryNode)
             .filter(
                 and_(
-                    GlossaryNode.path.startswith(path),
-                    GlossaryNode.nodeType == 'T',
+                    _subtree(path),
                     GlossaryNode.deleted.is_(None),
                 )
             )
-            .count()
+            .one()
         )
 
         associations = (
-            session.query(TermLink)
+            session.query(func.count(TermLink.linkUri))
             .join(
                 GlossaryNode,
-                GlossaryNode.nodeType == TermLink.nodeUri,
+                GlossaryNode.nodeUri == TermLink.nodeUri,
             )
-            .filter(GlossaryNode.path.startswith(path))
-            .count()
+            .filter(_subtree(path))
+            .scalar()
         )
 
         return {'categories': categories, 'terms': terms, 'associations': associations}
@@ -226,7 +238,7 @@ class GlossaryRepository:
         if node.nodeType == 'T':
             q = q.filter(TermLink.nodeUri == node.nodeUri)
         elif node.nodeType in ['C', 'G']:
-            q = q.filter(GlossaryNode.path.startswith(node.path))
+            q = q.filter(_subtree(node.path))
         else:
             raise Exception(f'InvalidNodeType ({node.nodeUri}/{node.nodeType})')
 
@@ -312,7 +324,7 @@ class GlossaryRepository:
         if node.nodeType in ['G', 'C']:
             children = session.query(GlossaryNode).filter(
                 and_(
-                    GlossaryNode.path.startswith(node.path),
+                    _subtree(node.path),
                     GlossaryNode.deleted.is_(None),
                 )
             )
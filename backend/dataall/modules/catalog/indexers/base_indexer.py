@@ -1,16 +1,115 @@
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from operator import and_
+from threading import local
+from typing import Dict, List, Set
 
+from opensearchpy import helpers
+from sqlalchemy import or_
 from sqlalchemy.orm import with_expression
 
 from dataall.modules.catalog.db.glossary_models import GlossaryNode, TermLink
+from dataall.base.db.utils import changed_since
 from dataall.base.searchproxy import connect
 
 log = logging.getLogger(__name__)
 
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+_bulk_context = local()
+
+
+@dataclass
+class BulkIndexingStats:
+    """Outcome of a bulk indexing run"""
+
+    indexed: int = 0
+    deleted: int = 0
+    failed: int = 0
+    retried: int = 0
+    failed_ids: Set[str] = field(default_factory=set)
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        elapsed = self.elapsed or (time.perf_counter() - self.started)
+        return (self.indexed + self.deleted) / elapsed if elapsed else 0.0
+
+    def __str__(self):
+        return (
+            f'indexed={self.indexed} deleted={self.deleted} failed={self.failed} retried={self.retried} '
+            f'in {self.elapsed:.2f}s ({self.docs_per_second:.1f} docs/sec)'
+        )
+
+
+class _BulkRequest:
+    """
+    Buffers index/delete actions and sends them with the _bulk API.
+    Chunks are limited by the number of actions and by their size and are sent by parallel threads.
+    Actions rejected with a retryable status (throttling, unavailability) are sent again with a backoff
+    """
+
+    def __init__(self, es_provider, chunk_size, max_chunk_bytes, thread_count, max_retries):
+        self._es_provider = es_provider
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.thread_count = thread_count
+        self.max_retries = max_retries
+        self.actions = []
+        self.stats = BulkIndexingStats()
+
+    def add(self, action):
+        self.actions.append(action)
+        if len(self.actions) >= self.chunk_size * self.thread_count:
+            self.flush()
+
+    def flush(self):
+        actions, self.actions = self.actions, []
+        attempt = 0
+        while actions:
+            failed = self._send(actions)
+            retryable = []
+            for action, status in failed:
+                if attempt < self.max_retries and (not isinstance(status, int) or status in _RETRYABLE_STATUSES):
+                    retryable.append(action)
+                else:
+                    log.error(f'Failed to {action["_op_type"]} doc {action["_id"]} with status {status}')
+                    self.stats.failed += 1
+                    self.stats.failed_ids.add(action['_id'])
+            if retryable:
+                attempt += 1
+                self.stats.retried += len(retryable)
+                time.sleep(min(0.5 * 2**attempt, 10))
+            actions = retryable
+
+    def _send(self, actions):
+        by_key = {(action['_op_type'], action['_id']): action for action in actions}
+        failed = []
+        for ok, item in helpers.parallel_bulk(
+            self._es_provider(),
+            actions,
+            thread_count=self.thread_count,
+            chunk_size=self.chunk_size,
+            max_chunk_bytes=self.max_chunk_bytes,
+            raise_on_error=False,
+            raise_on_exception=False,
+        ):
+            op_type, result = next(iter(item.items()))
+            status = result.get('status')
+            if ok or (op_type == 'delete' and status == 404):
+                if op_type == 'delete':
+                    self.stats.deleted += 1
+                else:
+                    self.stats.indexed += 1
+            else:
+                failed.append((by_key[(op_type, result.get('_id'))], status))
+        return failed
+
 
 class BaseIndexer(ABC):
     """API to work with OpenSearch"""
@@ -35,16 +134,60 @@ class BaseIndexer(ABC):
     def upsert(session, target_id):
         raise NotImplementedError('Method upsert is not implemented')
 
+    @classmethod
+    @contextmanager
+    def bulk(cls):
+        """
+        Within the context the documents indexed or deleted by the current thread are sent with the _bulk API.
+        The remaining actions are sent when the context exits. Yields the BulkIndexingStats of the run.
+        The batching is configured with the CATALOG_BULK_* environment variables
+        """
+        request = getattr(_bulk_context, 'request', None)
+        if request is not None:
+            # nested contexts are part of the outer bulk request
+            yield request.stats
+            return
+
+        request = _BulkRequest(
+            es_provider=cls.es,
+            chunk_size=int(os.getenv('CATALOG_BULK_CHUNK_SIZE', '500')),
+            max_chunk_bytes=int(os.getenv('CATALOG_BULK_MAX_BYTES', str(10 * 1024 * 1024))),
+            thread_count=int(os.getenv('CATALOG_BULK_THREADS', '4')),
+            max_retries=int(os.getenv('CATALOG_BULK_MAX_RETRIES', '3')),
+        )
+        _bulk_context.request = request
+        try:
+            yield request.stats
+            request.flush()
+        finally:
+            _bulk_context.request = None
+            request.stats.elapsed = time.perf_counter() - request.stats.started
+
     @classmethod
     def delete_doc(cls, doc_id):
+        request = getattr(_bulk_context, 'request', None)
+        if request is not None:
+            request.add({'_op_type': 'delete', '_index': cls._INDEX, '_id': doc_id})
+            return True
         es = cls.es()
         es.delete(index=cls._INDEX, id=doc_id, ignore=[400, 404])
         return True
 
+    @classmethod
+    def delete_docs(cls, doc_ids: List[str]):
+        with cls.bulk() as stats:
+            for doc_id in doc_ids:
+                cls.delete_doc(doc_id=doc_id)
+        return stats
+
     @classmethod
     def _index(cls, doc_id, doc):
-        es = cls.es()
         doc['_indexed'] = datetime.now()
+        request = getattr(_bulk_context, 'request', None)
+        if request is not None:
+            request.add({'_op_type': 'index', '_index': cls._INDEX, '_id': doc_id, '_source': doc})
+            return True
+        es = cls.es()
         if es:
             res = es.index(index=cls._INDEX, id=doc_id, body=doc)
             log.info(f'doc {doc} for id {doc_id} indexed with response {res}')
@@ -102,3 +245,29 @@ class BaseIndexer(ABC):
             )
         )
         return [t.path for t in q]
+
+    @staticmethod
+    def _get_glossary_terms_by_target(session, target_uris: List[str] = None) -> Dict[str, List[str]]:
+        """Same as _get_target_glossary_terms for many targets (all of them if target_uris is None) in a single query"""
+        q = (
+            session.query(TermLink.targetUri, GlossaryNode.path)
+            .join(GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri)
+            .filter(TermLink.approvedBySteward.is_(True))
+        )
+        if target_uris is not None:
+            q = q.filter(TermLink.targetUri.in_(target_uris))
+        terms = {}
+        for target_uri, path in q:
+            terms.setdefault(target_uri, []).append(path)
+        return terms
+
+    @staticmethod
+    def _get_targets_with_changed_glossary(session, since: datetime) -> Set[str]:
+        """URIs of the targets whose glossary terms were linked, approved or changed after since"""
+        q = (
+            session.query(TermLink.targetUri)
+            .join(GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri)
+            .filter(or_(changed_since(TermLink, since), changed_since(GlossaryNode, since)))
+            .distinct()
+        )
+        return {target_uri for (target_uri,) in q}
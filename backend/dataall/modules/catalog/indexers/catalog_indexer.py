@@ -1,4 +1,5 @@
 from abc import ABC
+from datetime import datetime
 from typing import List
 
 
@@ -14,3 +15,10 @@ class CatalogIndexer(ABC):
 
     def index(self, session) -> List[str]:
         raise NotImplementedError('index is not implemented')
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        """
+        Re-indexes the objects changed after since and deletes the documents of the soft deleted ones.
+        Indexers that don't track their changes re-index all their objects
+        """
+        return self.index(session)
@@ -1,8 +1,10 @@
 import logging
 import os
 import sys
+from datetime import datetime, timedelta
 from typing import List
 
+from dataall.modules.catalog.db.catalog_indexer_repositories import CatalogIndexerRepository
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.base.db import get_engine
@@ -11,6 +13,9 @@ from dataall.base.utils.alarm_service import AlarmService
 
 log = logging.getLogger(__name__)
 
+# changes committed by transactions that were running when the previous run started are picked up by the next one
+HIGH_WATER_MARK_OVERLAP = timedelta(minutes=5)
+
 
 class CatalogIndexerTask:
     """
@@ -22,32 +27,76 @@ class CatalogIndexerTask:
         try:
             indexed_object_uris = []
             with engine.scoped_session() as session:
-                for indexer in CatalogIndexer.all():
-                    indexed_object_uris += indexer.index(session)
+                # the documents are sent in batches with the _bulk API instead of one request per document
+                with BaseIndexer.bulk() as stats:
+                    for indexer in CatalogIndexer.all():
+                        indexed_object_uris += indexer.index(session)
 
-                log.info(f'Successfully indexed {len(indexed_object_uris)} objects')
+                log.info(f'Successfully indexed {len(indexed_object_uris)} objects: {stats}')
 
-                if with_deletes == 'True':
+                if stats.failed:
+                    # the documents that failed might still be in the index, the outdated documents are not deleted
+                    error = f'{stats.failed} documents failed to be indexed: {sorted(stats.failed_ids)}'
+                    log.error(f'The outdated documents were not deleted because {error}')
+                    AlarmService().trigger_catalog_indexing_failure_alarm(error=error)
+                elif with_deletes == 'True':
                     CatalogIndexerTask._delete_old_objects(indexed_object_uris)
                 return len(indexed_object_uris)
         except Exception as e:
             AlarmService().trigger_catalog_indexing_failure_alarm(error=str(e))
             raise e
 
+    @classmethod
+    def index_changes(cls, engine):
+        """
+        Re-indexes only the objects changed since the previous incremental run (the high-water mark).
+        The first run indexes everything. The mark is moved only if all the documents were sent successfully
+        """
+        try:
+            run_started = datetime.now()
+            with engine.scoped_session() as session:
+                high_water_mark = CatalogIndexerRepository.get_high_water_mark(session)
+                indexed_object_uris = []
+                with BaseIndexer.bulk() as stats:
+                    for indexer in CatalogIndexer.all():
+                        if high_water_mark is None:
+                            indexed_object_uris += indexer.index(session)
+                        else:
+                            indexed_object_uris += indexer.index_changes(
+                                session, high_water_mark - HIGH_WATER_MARK_OVERLAP
+                            )
+
+                log.info(f'Incrementally indexed {len(indexed_object_uris)} objects since {high_water_mark}: {stats}')
+                if stats.failed:
+                    error = f'{stats.failed} documents failed to be indexed: {sorted(stats.failed_ids)}'
+                    log.error(f'The high-water mark was not moved because {error}')
+                    AlarmService().trigger_catalog_indexing_failure_alarm(error=error)
+                else:
+                    CatalogIndexerRepository.save_high_water_mark(
+                        session, run_started, indexed=len(indexed_object_uris), deleted=stats.deleted
+                    )
+                return len(indexed_object_uris)
+        except Exception as e:
+            AlarmService().trigger_catalog_indexing_failure_alarm(error=str(e))
+            raise e
+
     @classmethod
     def _delete_old_objects(cls, indexed_object_uris: List[str]) -> None:
         # Search for documents in opensearch without an ID in the indexed_object_uris list
         query = {'query': {'bool': {'must_not': {'terms': {'_id': indexed_object_uris}}}}}
         # Delete All "Outdated" Objects from Index
+        # delete_by_query is not supported by OpenSearch Serverless, the outdated documents are deleted in bulk instead
         docs = BaseIndexer.search_all(query, sort='_id')
-        for doc in docs:
-            BaseIndexer.delete_doc(doc_id=doc['_id'])
-        log.info(f'Deleted {len(docs)} records')
+        stats = BaseIndexer.delete_docs([doc['_id'] for doc in docs])
+        log.info(f'Deleted {len(docs)} records: {stats}')
 
 
 if __name__ == '__main__':
     load_modules({ImportMode.CATALOG_INDEXER_TASK})
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
-    with_deletes = os.environ.get('with_deletes', 'False')
-    CatalogIndexerTask.index_objects(engine=ENGINE, with_deletes=with_deletes)
+    if os.environ.get('indexing_mode', 'full') == 'incremental':
+        CatalogIndexerTask.index_changes(engine=ENGINE)
+    else:
+        with_deletes = os.environ.get('with_deletes', 'False')
+        CatalogIndexerTask.index_objects(engine=ENGINE, with_deletes=with_deletes)
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Query
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.base.db import exceptions, paginate
+from dataall.base.db.utils import changed_since
 from dataall.modules.dashboards.db.dashboard_models import DashboardShare, DashboardShareStatus, Dashboard
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,14 @@ class DashboardRepository(EnvironmentResource):
             raise exceptions.ObjectNotFound('Dashboard', uri)
         return dashboard
 
+    @staticmethod
+    def list_dashboards_changed_since(session, since, target_uris=None) -> [Dashboard]:
+        return (
+            session.query(Dashboard)
+            .filter(or_(changed_since(Dashboard, since), Dashboard.dashboardUri.in_(list(target_uris or []))))
+            .all()
+        )
+
     @staticmethod
     def _query_user_dashboards(session, username, groups, filter) -> Query:
         query = (
@@ -1,10 +1,14 @@
 import logging
+from datetime import datetime
 
 from typing import List
 
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.modules.dashboards.db.dashboard_models import Dashboard
+from dataall.modules.dashboards.db.dashboard_repositories import DashboardRepository
 from dataall.modules.dashboards.indexers.dashboard_indexer import DashboardIndexer
+from dataall.modules.vote.db.vote_repositories import VoteRepository
 
 log = logging.getLogger(__name__)
 
@@ -12,11 +16,21 @@ log = logging.getLogger(__name__)
 class DashboardCatalogIndexer(CatalogIndexer):
     def index(self, session) -> List[str]:
         all_dashboards: List[Dashboard] = session.query(Dashboard).all()
-        all_dashboard_uris = []
-
         log.info(f'Found {len(all_dashboards)} dashboards')
+        return self._index_dashboards(session, all_dashboards)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        target_uris = BaseIndexer._get_targets_with_changed_glossary(session, since)
+        target_uris |= VoteRepository.list_targets_voted_since(session, target_type='dashboard', since=since)
+        changed_dashboards = DashboardRepository.list_dashboards_changed_since(session, since, target_uris)
+        log.info(f'Found {len(changed_dashboards)} dashboards changed since {since}')
+        return self._index_dashboards(session, changed_dashboards)
+
+    @staticmethod
+    def _index_dashboards(session, dashboards: List[Dashboard]) -> List[str]:
+        all_dashboard_uris = []
         dashboard: Dashboard
-        for dashboard in all_dashboards:
+        for dashboard in dashboards:
             all_dashboard_uris.append(dashboard.dashboardUri)
             DashboardIndexer.upsert(session=session, dashboard_uri=dashboard.dashboardUri)
 
@@ -284,8 +284,8 @@ class DataPipelineService:
     @staticmethod
     def _get_credentials_from_aws(env_role_arn, aws_account_id, region):
         aws_session = SessionHelper.remote_session(aws_account_id, region)
-        env_session = SessionHelper.get_session(aws_session, role_arn=env_role_arn)
-        c = env_session.get_credentials()
+        env_session = SessionHelper.get_session(aws_session, role_arn=env_role_arn, cached=False)
+        c = env_session.get_credentials().get_frozen_credentials()
         body = json.dumps(
             {
                 'AWS_ACCESS_KEY_ID': c.access_key,
@@ -37,6 +37,10 @@ class DatasetBaseRepository:
             raise ObjectNotFound('Dataset', dataset_uri)
         return dataset
 
+    @staticmethod
+    def get_datasets_by_uris(session, dataset_uris) -> List[DatasetBase]:
+        return session.query(DatasetBase).filter(DatasetBase.datasetUri.in_(dataset_uris)).all()
+
 
 class DatasetListRepository:
     """DAO layer for Listing Datasets in Environments"""
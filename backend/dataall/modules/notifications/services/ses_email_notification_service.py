@@ -1,13 +1,134 @@
 # Email Notification Provider implements the email notification service abstract method
 import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, List
+
+from botocore.exceptions import ClientError
 
 from dataall.base.aws.cognito import Cognito
-from dataall.base.aws.ses import Ses
+from dataall.base.aws.ses import MAX_BULK_DESTINATIONS, Ses
+from dataall.base.services.group_membership_cache import get_user_emailids_from_group
 from dataall.base.services.service_provider_factory import ServiceProviderFactory
 from dataall.modules.notifications.services.base_email_notification_service import BaseEmailNotificationService
 
 log = logging.getLogger(__name__)
 
+# number of SES requests sent at the same time
+MAX_CONCURRENT_SENDS = int(os.getenv('SES_MAX_CONCURRENT_SENDS', '4'))
+# emails per second allowed by the SES sending quota of the account
+MAX_SEND_RATE = float(os.getenv('SES_MAX_SEND_RATE', '14'))
+THROTTLING_ERRORS = ['TooManyRequestsException', 'LimitExceededException', 'Throttling']
+THROTTLING_RETRIES = 3
+# the recipients of a bulk request that failed with these statuses are sent an individual email instead
+RETRYABLE_BULK_STATUSES = ['ACCOUNT_THROTTLED', 'TRANSIENT_FAILURE', 'FAILED']
+
+
+class _SendRateLimiter:
+    """Spaces the SES requests of the process so that the emails sent per second stay under the sending quota"""
+
+    def __init__(self, rate):
+        self._interval = 1 / rate if rate > 0 else 0
+        self._lock = Lock()
+        self._next = time.monotonic()
+
+    def acquire(self, emails_count):
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next, now)
+            self._next = start + emails_count * self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_send_rate_limiter = _SendRateLimiter(MAX_SEND_RATE)
+
+
+class _EmailDelivery:
+    """Email of a notification sent to the recipients, with the SES message id of each recipient"""
+
+    def __init__(self, email_provider, subject, message, recipients):
+        self.email_provider = email_provider
+        self.subject = subject
+        self.message = message
+        self.recipients = sorted(recipients)
+        self.message_ids = {}
+        self.failed = {}
+        self.error = None
+
+    @property
+    def bulk(self):
+        # the message is sent as an inline template, it must not contain template tags
+        return len(self.recipients) > 1 and '{{' not in self.message and '{{' not in self.subject
+
+    def chunks(self):
+        size = MAX_BULK_DESTINATIONS if self.bulk else 1
+        return [self.recipients[i : i + size] for i in range(0, len(self.recipients), size)]
+
+    def send(self, recipients):
+        if self.bulk:
+            try:
+                _send_rate_limiter.acquire(len(recipients))
+                results = _with_throttling_retries(
+                    lambda: self.email_provider.send_bulk_email(recipients, self.message, self.subject)
+                )
+            except Exception as e:
+                log.warning(f'Failed to send bulk email {self.subject}, sending individual emails instead: {e}')
+                results = {}
+            for email_id in recipients:
+                result = results.get(email_id, {})
+                if result.get('Status') == 'SUCCESS':
+                    self.message_ids[email_id] = result.get('MessageId')
+                elif result and result.get('Status') not in RETRYABLE_BULK_STATUSES:
+                    self.failed[email_id] = f'{result.get("Status")}: {result.get("Error")}'
+                else:
+                    self._send_individual(email_id)
+        else:
+            for email_id in recipients:
+                self._send_individual(email_id)
+
+    def _send_individual(self, email_id):
+        try:
+            _send_rate_limiter.acquire(1)
+            response = _with_throttling_retries(
+                lambda: self.email_provider.send_email([email_id], self.message, self.subject)
+            )
+            self.message_ids[email_id] = response.get('MessageId') if isinstance(response, dict) else None
+        except Exception as e:
+            log.error(f'Failed to send email {self.subject} to {email_id}: {e}')
+            self.failed[email_id] = str(e)
+            self.error = e
+
+    def result(self) -> dict:
+        return {'messageIds': self.message_ids, 'failed': self.failed}
+
+
+def _with_throttling_retries(send):
+    for attempt in range(THROTTLING_RETRIES + 1):
+        try:
+            return send()
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in THROTTLING_ERRORS or attempt == THROTTLING_RETRIES:
+                raise e
+            time.sleep(2**attempt * random.uniform(0.5, 1))
+
+
+def _send_deliveries(deliveries: List[_EmailDelivery]):
+    """Sends the emails of the deliveries, up to MAX_CONCURRENT_SENDS SES requests at the same time"""
+    requests = [(delivery, recipients) for delivery in deliveries for recipients in delivery.chunks()]
+    if len(requests) <= 1 or MAX_CONCURRENT_SENDS <= 1:
+        for delivery, recipients in requests:
+            delivery.send(recipients)
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_SENDS, len(requests)), thread_name_prefix='ses-email'
+    ) as executor:
+        for future in [executor.submit(delivery.send, recipients) for delivery, recipients in requests]:
+            future.result()
+
 
 class SESEmailNotificationService(BaseEmailNotificationService):
     def __init__(self, email_client, recipient_group_list, recipient_email_list) -> None:
@@ -18,13 +139,16 @@ class SESEmailNotificationService(BaseEmailNotificationService):
 
     # Implementation
     def send_email(self, to, message, subject):
-        self.email_client.send_email(to, message, subject)
+        return self.email_client.send_email(to, message, subject)
+
+    def send_bulk_email(self, to, message, subject):
+        return self.email_client.send_bulk_email(to, message, subject)
 
     @staticmethod
     def get_email_ids_from_groupList(group_list, identity_provider):
         email_list = set()
         for group in group_list:
-            email_list.update(identity_provider.get_user_emailids_from_group(group))
+            email_list.update(get_user_emailids_from_group(group, identity_provider))
         return email_list
 
     @staticmethod
@@ -33,30 +157,70 @@ class SESEmailNotificationService(BaseEmailNotificationService):
 
     @staticmethod
     def send_email_task(subject, message, recipient_groups_list, recipient_email_list):
-        # Get instance of the email provider
-        email_provider = SESEmailNotificationService.get_email_provider_instance(
-            recipient_groups_list, recipient_email_list
-        )
-        try:
-            identityProvider = ServiceProviderFactory.get_service_provider_instance()
+        """
+        Sends the email to the members of the groups and to the email ids.
+        Returns the SES message id of each recipient and the recipients that could not be sent the email
+        """
+        delivery = SESEmailNotificationService._send_emails(
+            [(subject, message, recipient_groups_list, recipient_email_list)]
+        )[0]
+        if delivery.error and not delivery.message_ids:
+            raise delivery.error
+        return delivery.result()
 
+    @staticmethod
+    def send_emails(emails) -> List[dict]:
+        """
+        Sends the emails (subject, message, recipient_groups_list, recipient_email_list) together: the groups are
+        expanded once and the SES requests of all the emails are sent concurrently. Returns the result of each email
+        """
+        return [delivery.result() for delivery in SESEmailNotificationService._send_emails(emails)]
+
+    @staticmethod
+    def _send_emails(emails) -> List[_EmailDelivery]:
+        email_client = Ses.get_ses_client()
+        identity_provider = ServiceProviderFactory.get_service_provider_instance()
+        deliveries = []
+        for subject, message, recipient_groups_list, recipient_email_list in emails:
+            email_provider = SESEmailNotificationService(email_client, recipient_groups_list, recipient_email_list)
             email_ids_to_send_emails = email_provider.get_email_ids_from_groupList(
-                email_provider.recipient_group_list, identityProvider
+                email_provider.recipient_group_list, identity_provider
             )
-
-            if len(recipient_email_list) > 0:
-                email_ids_to_send_emails.update(recipient_email_list)
-
-            SESEmailNotificationService.send_email_to_users(email_ids_to_send_emails, email_provider, message, subject)
-
-        except Exception as e:
-            raise e
-        else:
-            return True
+            email_ids_to_send_emails.update(recipient_email_list)
+            deliveries.append(_EmailDelivery(email_provider, subject, message, email_ids_to_send_emails))
+        _send_deliveries(deliveries)
+        for delivery in deliveries:
+            log.info(
+                f'Email {delivery.subject} sent to {len(delivery.message_ids)} recipients, '
+                f'failed for {len(delivery.failed)} recipients'
+            )
+        return deliveries
 
     @staticmethod
-    def send_email_to_users(email_list, email_provider, message, subject):
+    def send_email_to_users(email_list, email_provider, message, subject) -> Dict[str, str]:
         # Send individual emails to all the email ids. Sending individual emails helps in tracking individual emails via message-ids
         # https://aws.amazon.com/blogs/messaging-and-targeting/how-to-send-messages-to-multiple-recipients-with-amazon-simple-email-service-ses/
-        for emailId in email_list:
-            email_provider.send_email([emailId], message, subject)
+        # The emails are sent in bulk requests when possible, each recipient still gets its own email and message id
+        delivery = _EmailDelivery(email_provider, subject, message, email_list)
+        _send_deliveries([delivery])
+        return delivery.message_ids
+
+
+class EmailNotificationBatch:
+    """Emails of several notifications collected by a task and sent together at the end"""
+
+    def __init__(self):
+        self._emails = []
+
+    def add(self, subject, message, recipient_groups_list=None, recipient_email_list=None):
+        self._emails.append((subject, message, list(recipient_groups_list or []), list(recipient_email_list or [])))
+
+    def __len__(self):
+        return len(self._emails)
+
+    def send(self) -> List[dict]:
+        if not self._emails:
+            return []
+        results = SESEmailNotificationService.send_emails(self._emails)
+        self._emails = []
+        return results
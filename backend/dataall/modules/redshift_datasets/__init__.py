@@ -88,6 +88,25 @@ class RedshiftDatasetApiModuleInterface(ModuleInterface):
         log.info('API of Redshift datasets has been imported')
 
 
+class RedshiftCatalogIndexerModuleInterface(ModuleInterface):
+    @staticmethod
+    def is_supported(modes: Set[ImportMode]) -> bool:
+        return ImportMode.CATALOG_INDEXER_TASK in modes
+
+    @staticmethod
+    def depends_on() -> List[Type['ModuleInterface']]:
+        from dataall.modules.catalog import CatalogIndexerModuleInterface
+        from dataall.modules.datasets_base import DatasetBaseModuleInterface
+
+        return [CatalogIndexerModuleInterface, DatasetBaseModuleInterface]
+
+    def __init__(self):
+        from dataall.modules.redshift_datasets.indexers.redshift_catalog_indexer import RedshiftCatalogIndexer
+
+        RedshiftCatalogIndexer()
+        log.info('Redshift catalog indexer task has been loaded')
+
+
 class RedshiftDatasetCdkModuleInterface(ModuleInterface):
     """Loads dataset cdk stacks"""
 
@@ -1,17 +1,43 @@
+import copy
 import logging
+import os
 import time
 from botocore.exceptions import ClientError
 from dataall.base.aws.sts import SessionHelper
+from dataall.base.utils.ttl_cache import TTLCache
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
 
 log = logging.getLogger(__name__)
 
+PENDING_STATEMENT_STATUSES = ['PICKED', 'STARTED', 'SUBMITTED']
+# the status of a statement is polled every 0.1 second at first, then less and less often up to every 2 seconds
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 2
+# maximum number of statements of a BatchExecuteStatement call
+MAX_BATCH_STATEMENTS = 40
+
+# schemas, tables and columns of the Redshift connections
+redshift_metadata_cache = TTLCache(name='redshift_metadata', ttl=int(os.getenv('REDSHIFT_METADATA_CACHE_TTL', '300')))
+
+
+def wait_for_statement(client, statement_id: str) -> dict:
+    """Waits until the statement (or batch of statements) finishes and returns its description, raises if it failed"""
+    interval = MIN_POLL_INTERVAL
+    while (response := client.describe_statement(Id=statement_id))['Status'] in PENDING_STATEMENT_STATUSES:
+        time.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    if response['Status'] == 'FAILED':
+        raise Exception(response['Error'])
+    return response
+
 
 class RedshiftDataClient:
     def __init__(self, account_id: str, region: str, connection: RedshiftConnection) -> None:
         session = SessionHelper.remote_session(accountid=account_id, region=region)
         self.client = session.client(service_name='redshift-data', region_name=region)
         self.database = connection.database
+        self._cache_key = (connection.connectionUri, connection.database) if connection.connectionUri else None
         self.execute_connection_params = {
             'Database': connection.database,
         }
@@ -29,23 +55,21 @@ class RedshiftDataClient:
 
     def _execute_statement(self, sql: str):
         log.info(f'Executing {sql=} with connection {self.execute_connection_params}...')
-        execute_dict = self.execute_connection_params
-        execute_dict['Sql'] = sql
-        execute_statement_response = self.client.execute_statement(**execute_dict)
-
-        execution_finished = False
-        describe_statement_response = None
-        while not execution_finished:
-            describe_statement_response = self.client.describe_statement(Id=execute_statement_response['Id'])
-            time.sleep(1)
-            execution_finished = describe_statement_response['Status'] not in ['PICKED', 'STARTED', 'SUBMITTED']
-
-        if describe_statement_response['Status'] == 'FAILED':
-            raise Exception(describe_statement_response['Error'])
-
+        execute_statement_response = self.client.execute_statement(**self.execute_connection_params, Sql=sql)
+        describe_statement_response = wait_for_statement(self.client, execute_statement_response['Id'])
         log.info(f'Received response {describe_statement_response=}')
         return describe_statement_response['Id']
 
+    def _cached(self, key: tuple, loader, refresh: bool = False):
+        """Returns a copy of the metadata of the connection cached for REDSHIFT_METADATA_CACHE_TTL seconds"""
+        if self._cache_key is None:
+            return loader()
+        key = (*self._cache_key, *key)
+        if refresh:
+            redshift_metadata_cache.invalidate(key)
+        # the callers can modify the returned metadata
+        return copy.deepcopy(redshift_metadata_cache.get(key, loader))
+
     @staticmethod
     def identifier(name: str) -> str:
         return f'"{name}"'
@@ -67,7 +91,10 @@ class RedshiftDataClient:
             log.error(e)
             raise e
 
-    def list_redshift_schemas(self):
+    def list_redshift_schemas(self, refresh: bool = False):
+        return self._cached(('schemas',), self._list_redshift_schemas, refresh)
+
+    def _list_redshift_schemas(self):
         schemas = []
         try:
             log.info(f'Fetching {self.database} schemas')
@@ -86,7 +113,10 @@ class RedshiftDataClient:
             log.error(e)
             raise e
 
-    def list_redshift_tables(self, schema: str):
+    def list_redshift_tables(self, schema: str, refresh: bool = False):
+        return self._cached(('tables', schema), lambda: self._list_redshift_tables(schema), refresh)
+
+    def _list_redshift_tables(self, schema: str):
         tables_list = []
         try:
             log.info(f'Fetching {self.database} tables')
@@ -115,7 +145,12 @@ class RedshiftDataClient:
             log.error(e)
             raise e
 
-    def list_redshift_table_columns(self, schema: str, table: str):
+    def list_redshift_table_columns(self, schema: str, table: str, refresh: bool = False):
+        return self._cached(
+            ('columns', schema, table), lambda: self._list_redshift_table_columns(schema, table), refresh
+        )
+
+    def _list_redshift_table_columns(self, schema: str, table: str):
         columns_list = []
         try:
             log.info(f'Fetching {self.database} tables')
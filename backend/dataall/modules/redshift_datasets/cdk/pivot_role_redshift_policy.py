@@ -89,6 +89,7 @@ class RedshiftDatasetsPivotRole(PivotRoleStatementSet):
                             'redshift-data:ListSchemas',
                             'redshift-data:ListTables',
                             'redshift-data:ExecuteStatement',
+                            'redshift-data:BatchExecuteStatement',
                             'redshift-data:DescribeTable',
                         ],
                         resources=cluster_arns + workgroup_arns,
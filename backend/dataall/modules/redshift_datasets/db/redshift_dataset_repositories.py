@@ -6,6 +6,7 @@ from dataall.core.environment.db.environment_models import Environment
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.base.db import paginate
 from dataall.base.db.exceptions import ObjectNotFound
+from dataall.base.db.utils import changed_since
 from dataall.modules.datasets_base.services.datasets_enums import ConfidentialityClassification, Language
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset, RedshiftTable
@@ -127,6 +128,32 @@ class RedshiftDatasetRepository:
     def count_dataset_tables(session, dataset_uri) -> int:
         return RedshiftDatasetRepository._query_redshift_dataset_tables(session, dataset_uri).count()
 
+    @staticmethod
+    def list_all_active_redshift_datasets(session) -> [RedshiftDataset]:
+        return session.query(RedshiftDataset).filter(RedshiftDataset.deleted.is_(None)).all()
+
+    @staticmethod
+    def list_redshift_datasets_changed_since(session, since, target_uris=None) -> [RedshiftDataset]:
+        """Active datasets changed after since, including changes of their tables and of the other target_uris"""
+        target_uris = list(target_uris or [])
+        changed_tables = session.query(RedshiftTable.datasetUri).filter(
+            or_(changed_since(RedshiftTable, since), RedshiftTable.rsTableUri.in_(target_uris))
+        )
+        return (
+            session.query(RedshiftDataset)
+            .filter(
+                and_(
+                    RedshiftDataset.deleted.is_(None),
+                    or_(
+                        changed_since(RedshiftDataset, since),
+                        RedshiftDataset.datasetUri.in_(target_uris),
+                        RedshiftDataset.datasetUri.in_(changed_tables),
+                    ),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def count_environment_group_datasets(session, environment, group_uri) -> int:
         return (
@@ -0,0 +1,44 @@
+import logging
+from datetime import datetime
+
+from typing import List
+
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset
+from dataall.modules.redshift_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
+from dataall.modules.redshift_datasets.services.redshift_constants import VOTE_REDSHIFT_DATASET_NAME
+from dataall.modules.vote.db.vote_repositories import VoteRepository
+
+log = logging.getLogger(__name__)
+
+
+class RedshiftCatalogIndexer(CatalogIndexer):
+    """Indexes Redshift datasets and their tables. Register automatically itself when the instance is created"""
+
+    def index(self, session) -> List[str]:
+        all_datasets = RedshiftDatasetRepository.list_all_active_redshift_datasets(session)
+        log.info(f'Found {len(all_datasets)} redshift datasets')
+        return self._index_datasets(session, all_datasets)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        target_uris = BaseIndexer._get_targets_with_changed_glossary(session, since)
+        target_uris |= VoteRepository.list_targets_voted_since(session, VOTE_REDSHIFT_DATASET_NAME, since)
+        changed_datasets = RedshiftDatasetRepository.list_redshift_datasets_changed_since(session, since, target_uris)
+        log.info(f'Found {len(changed_datasets)} redshift datasets changed since {since}')
+        return self._index_datasets(session, changed_datasets)
+
+    @staticmethod
+    def _index_datasets(session, datasets: List[RedshiftDataset]) -> List[str]:
+        all_dataset_uris = []
+        for dataset in datasets:
+            for table in RedshiftDatasetRepository.list_redshift_dataset_tables(session, dataset.datasetUri):
+                DatasetTableIndexer.upsert(session=session, table_uri=table.rsTableUri, dataset=dataset)
+                all_dataset_uris.append(table.rsTableUri)
+
+            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+            all_dataset_uris.append(dataset.datasetUri)
+
+        return all_dataset_uris
@@ -412,7 +412,7 @@ class RedshiftDatasetService:
         success_tables = []
         rs_tables = redshift_data_client(
             account_id=dataset.AwsAccountId, region=dataset.region, connection=connection
-        ).list_redshift_tables(dataset.schema)
+        ).list_redshift_tables(dataset.schema, refresh=True)
         rs_tables_names = [t['name'] for t in rs_tables]
         for table in tables:
             if table not in rs_tables_names:
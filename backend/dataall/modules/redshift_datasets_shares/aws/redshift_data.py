@@ -1,7 +1,9 @@
 import logging
-import time
-from botocore.exceptions import ClientError
+from contextlib import contextmanager
+from typing import List
+
 from dataall.base.aws.sts import SessionHelper
+from dataall.modules.redshift_datasets.aws.redshift_data import MAX_BATCH_STATEMENTS, wait_for_statement
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
 
 log = logging.getLogger(__name__)
@@ -12,6 +14,10 @@ class RedshiftShareDataClient:
         session = SessionHelper.remote_session(accountid=account_id, region=region)
         self.client = session.client(service_name='redshift-data', region_name=region)
         self.database = connection.database
+        # statements of the current batch_statements() context
+        self._batch = None
+        # records of the queries executed since the last statement that modified the namespace
+        self._records = {}
         self.execute_connection_params = {
             'Database': connection.database,
         }
@@ -28,24 +34,53 @@ class RedshiftShareDataClient:
             self.execute_connection_params['DbUser'] = connection.redshiftUser
 
     def _execute_statement(self, sql: str):
-        log.info(f'Executing {sql=} with connection {self.execute_connection_params}...')
-        execute_dict = self.execute_connection_params
-        execute_dict['Sql'] = sql
-        execute_statement_response = self.client.execute_statement(**execute_dict)
-
-        while (describe_statement_response := self.client.describe_statement(Id=execute_statement_response['Id']))[
-            'Status'
-        ] in ['PICKED', 'STARTED', 'SUBMITTED']:
-            time.sleep(1)
+        if self._batch is not None:
+            log.info(f'Adding {sql=} to the batch of statements...')
+            self._batch.append(sql)
+            return None
 
-        if describe_statement_response['Status'] == 'FAILED':
-            raise Exception(describe_statement_response['Error'])
+        statement_id = self._run_statement(sql)
+        # the statement may have modified the namespace
+        self._records.clear()
+        return statement_id
 
+    def _run_statement(self, sql: str):
+        log.info(f'Executing {sql=} with connection {self.execute_connection_params}...')
+        execute_statement_response = self.client.execute_statement(**self.execute_connection_params, Sql=sql)
+        describe_statement_response = wait_for_statement(self.client, execute_statement_response['Id'])
         log.info(f'Received response {describe_statement_response["Id"]}')
         return describe_statement_response['Id']
 
+    def _batch_execute_statements(self, sqls: List[str]):
+        for i in range(0, len(sqls), MAX_BATCH_STATEMENTS):
+            statements = sqls[i : i + MAX_BATCH_STATEMENTS]
+            log.info(f'Executing batch of {statements=} with connection {self.execute_connection_params}...')
+            batch_response = self.client.batch_execute_statement(**self.execute_connection_params, Sqls=statements)
+            self._records.clear()
+            wait_for_statement(self.client, batch_response['Id'])
+            log.info(f'Received response {batch_response["Id"]}')
+
+    @contextmanager
+    def batch_statements(self):
+        """
+        Statements executed in the context are sent together with one BatchExecuteStatement call when the context
+        exits. They run in a single transaction: use it only for statements that cannot fail with an error that
+        is ignored, because the errors are raised when the context exits
+        """
+        self._batch = []
+        try:
+            yield
+            statements = self._batch
+        finally:
+            self._batch = None
+        if statements:
+            self._batch_execute_statements(statements)
+
     def _execute_statement_return_records(self, sql: str):
-        id = self._execute_statement(sql=sql)
+        if sql in self._records:
+            log.info(f'Returning records of previous execution of {sql=}')
+            return self._records[sql]
+        id = self._run_statement(sql=sql)
         log.info(f'Returning records for sql {id=}...')
         try:
             response = self.client.get_statement_result(Id=id)
@@ -58,6 +93,7 @@ class RedshiftShareDataClient:
                 next_token = response.get('NextToken', None)
             filtered_records = [[d for d in record if d.get('stringValue', False)] for record in records]
             log.info(f'Returning {len(filtered_records)} records from executed statement')
+            self._records[sql] = filtered_records
             return filtered_records
         except Exception as e:
             log.error(f'Failed to retrieve records for sql {id=}: {e}')
@@ -130,7 +166,9 @@ class RedshiftShareDataClient:
         try:
             log.info(f'Checking {datashare=}...')
             sql_statement = f'DESC DATASHARE {RedshiftShareDataClient.double_quoted_name(datashare)};'
-            return self._execute_statement(sql=sql_statement)
+            # same query as the checks of the schema and the tables in the datashare, executed once for all of them
+            self._execute_statement_return_records(sql=sql_statement)
+            return True
         except Exception as e:
             log.error(f'Checking of {datashare=} failed due to: {e}')
             return False
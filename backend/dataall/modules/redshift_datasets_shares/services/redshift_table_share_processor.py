@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 from dataall.base.utils.naming_convention import NamingConventionService, NamingConventionPattern
@@ -85,6 +86,13 @@ class ProcessRedshiftShare(SharesProcessorInterface):
             connection=self.target_connection,
         )
 
+    @staticmethod
+    def _run_checks(*checks):
+        """Runs the independent checks at the same time and returns their results in the same order"""
+        with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix='redshift-share-check') as executor:
+            futures = [executor.submit(check) for check in checks]
+            return [future.result() for future in futures]
+
     def process_approved_shares(self) -> bool:
         """
         1) (in source namespace) Create datashare for this dataset for this target namespace. If it does not exist yet. One time operation.
@@ -171,23 +179,24 @@ class ProcessRedshiftShare(SharesProcessorInterface):
                     namespace=self.source_connection.nameSpaceId,
                     account=self.share_data.source_environment.AwsAccountId if self.cross_account else None,
                 )
-                # 5) Grant usage access to the redshift role to the new local database
-                self.redshift_data_client_in_target.grant_database_usage_access_to_redshift_role(
-                    database=self.local_db, rs_role=self.redshift_role
-                )
-
                 # 6) Create external schema in local database, if it does not exist yet
                 self.redshift_data_client_in_target.create_external_schema(
                     database=self.local_db, schema=self.dataset.schema, external_schema=self.external_schema
                 )
-                # 7) Grant usage access to the redshift role to the external schema
-                self.redshift_data_client_in_target.grant_schema_usage_access_to_redshift_role(
-                    schema=self.external_schema, rs_role=self.redshift_role
-                )
-                # 7) Grant usage access to the redshift role to the schema of the self.local_db
-                self.redshift_data_client_in_target.grant_schema_usage_access_to_redshift_role(
-                    database=self.local_db, schema=self.dataset.schema, rs_role=self.redshift_role
-                )
+                # 5) and 7) The grants cannot fail if the database and the schema exist, they are sent together
+                with self.redshift_data_client_in_target.batch_statements():
+                    # 5) Grant usage access to the redshift role to the new local database
+                    self.redshift_data_client_in_target.grant_database_usage_access_to_redshift_role(
+                        database=self.local_db, rs_role=self.redshift_role
+                    )
+                    # 7) Grant usage access to the redshift role to the external schema
+                    self.redshift_data_client_in_target.grant_schema_usage_access_to_redshift_role(
+                        schema=self.external_schema, rs_role=self.redshift_role
+                    )
+                    # 7) Grant usage access to the redshift role to the schema of the self.local_db
+                    self.redshift_data_client_in_target.grant_schema_usage_access_to_redshift_role(
+                        database=self.local_db, schema=self.dataset.schema, rs_role=self.redshift_role
+                    )
 
                 for table in self.tables:
                     try:
@@ -195,19 +204,20 @@ class ProcessRedshiftShare(SharesProcessorInterface):
                         self.redshift_data_client_in_source.add_table_to_datashare(
                             datashare=self.datashare_name, schema=self.dataset.schema, table_name=table.name
                         )
-                        # 9) Grant select access to the requested tables to the redshift role to the self.local_db
-                        self.redshift_data_client_in_target.grant_select_table_access_to_redshift_role(
-                            database=self.local_db,
-                            schema=self.dataset.schema,
-                            table=table.name,
-                            rs_role=self.redshift_role,
-                        )
-                        # 10) Grant select access to the requested tables to the redshift role to the external_schema
-                        self.redshift_data_client_in_target.grant_select_table_access_to_redshift_role(
-                            schema=self.external_schema,
-                            table=table.name,
-                            rs_role=self.redshift_role,
-                        )
+                        with self.redshift_data_client_in_target.batch_statements():
+                            # 9) Grant select access to the requested tables to the redshift role to the self.local_db
+                            self.redshift_data_client_in_target.grant_select_table_access_to_redshift_role(
+                                database=self.local_db,
+                                schema=self.dataset.schema,
+                                table=table.name,
+                                rs_role=self.redshift_role,
+                            )
+                            # 10) Grant select access to the requested tables to the redshift role to the external_schema
+                            self.redshift_data_client_in_target.grant_select_table_access_to_redshift_role(
+                                schema=self.external_schema,
+                                table=table.name,
+                                rs_role=self.redshift_role,
+                            )
 
                         share_item = ShareObjectRepository.find_sharable_item(
                             self.session, self.share.shareUri, table.rsTableUri
@@ -294,6 +304,11 @@ class ProcessRedshiftShare(SharesProcessorInterface):
             log.info('No Redshift tables to revoke. Skipping...')
         else:
             self._initialize_clients()
+            # the tables are revoked one by one, but the database and the schema do not change in the meantime
+            local_db_exists = self.redshift_data_client_in_target.check_database_exists(database=self.local_db)
+            external_schema_exists = local_db_exists and self.redshift_data_client_in_target.check_schema_exists(
+                schema=self.external_schema, database=self.target_connection.database
+            )
 
             for table in self.tables:
                 log.info(f'Revoking access to table {table}...')
@@ -306,11 +321,8 @@ class ProcessRedshiftShare(SharesProcessorInterface):
                     started_state = revoked_item_SM.run_transition(ShareObjectActions.Start.value)
                     revoked_item_SM.update_state_single_item(self.session, share_item, started_state)
 
-                    local_db_exists = self.redshift_data_client_in_target.check_database_exists(database=self.local_db)
                     # 1) (in target namespace) Revoke access to the revoked tables to the redshift role in external schema (if schema exists)
-                    if local_db_exists and self.redshift_data_client_in_target.check_schema_exists(
-                        schema=self.external_schema, database=self.target_connection.database
-                    ):
+                    if external_schema_exists:
                         self.redshift_data_client_in_target.revoke_select_table_access_to_redshift_role(
                             schema=self.external_schema, table=table.name, rs_role=self.redshift_role
                         )
@@ -468,13 +480,41 @@ class ProcessRedshiftShare(SharesProcessorInterface):
             ds_level_errors = []
             self._initialize_clients()
             try:
+                # the checks of the namespaces are independent, the queries run at the same time. The checks of the
+                # source namespace both read DESC DATASHARE, they run one after the other so that it runs once
+                (
+                    (datashare_exists, schema_in_datashare),
+                    consumer_has_permissions,
+                    local_db_exists,
+                    role_has_database_usage,
+                    external_schema_exists,
+                    role_has_schema_usage,
+                ) = self._run_checks(
+                    lambda: (
+                        self.redshift_data_client_in_source.check_datashare_exists(self.datashare_name),
+                        self.redshift_data_client_in_source.check_schema_in_datashare(
+                            datashare=self.datashare_name, schema=self.dataset.schema
+                        ),
+                    ),
+                    lambda: self.redshift_data_client_in_target.check_consumer_permissions_to_datashare(
+                        datashare=self.datashare_name
+                    ),
+                    lambda: self.redshift_data_client_in_target.check_database_exists(self.local_db),
+                    lambda: self.redshift_data_client_in_target.check_role_permissions_in_database(
+                        database=self.local_db, rs_role=self.redshift_role
+                    ),
+                    lambda: self.redshift_data_client_in_target.check_schema_exists(
+                        schema=self.external_schema, database=self.target_connection.database
+                    ),
+                    lambda: self.redshift_data_client_in_target.check_role_permissions_in_schema(
+                        schema=self.external_schema, rs_role=self.redshift_role
+                    ),
+                )
                 # 1) (in source namespace) Check that datashare exists
-                if not self.redshift_data_client_in_source.check_datashare_exists(self.datashare_name):
+                if not datashare_exists:
                     ds_level_errors.append(ShareErrorFormatter.dne_error_msg('Redshift datashare', self.datashare_name))
                 # 2) (in source namespace) Check that schema is added to datashare
-                if not self.redshift_data_client_in_source.check_schema_in_datashare(
-                    datashare=self.datashare_name, schema=self.dataset.schema
-                ):
+                if not schema_in_datashare:
                     ds_level_errors.append(
                         ShareErrorFormatter.dne_error_msg(
                             'Redshift schema added to datashare',
@@ -525,9 +565,7 @@ class ProcessRedshiftShare(SharesProcessorInterface):
                             )
                         )
                 # 3.a)b) (in target namespace) Check the access is granted to the consumer cluster to the datashare
-                if not self.redshift_data_client_in_target.check_consumer_permissions_to_datashare(
-                    datashare=self.datashare_name
-                ):
+                if not consumer_has_permissions:
                     ds_level_errors.append(
                         ShareErrorFormatter.missing_permission_error_msg(
                             self.target_connection.nameSpaceId,
@@ -538,30 +576,24 @@ class ProcessRedshiftShare(SharesProcessorInterface):
                         )
                     )
                 # 4) (in target namespace) Check that local db exists
-                if not self.redshift_data_client_in_target.check_database_exists(self.local_db):
+                if not local_db_exists:
                     ds_level_errors.append(
                         ShareErrorFormatter.dne_error_msg('Redshift local database in consumer', self.local_db)
                     )
                 # 5) (in target namespace) Check that the redshift role has access to the local db
-                if not self.redshift_data_client_in_target.check_role_permissions_in_database(
-                    database=self.local_db, rs_role=self.redshift_role
-                ):
+                if not role_has_database_usage:
                     ds_level_errors.append(
                         ShareErrorFormatter.missing_permission_error_msg(
                             self.redshift_role, 'USAGE', ['USAGE'], 'Redshift local database in consumer', self.local_db
                         )
                     )
                 # 6) (in target namespace) Check that external schema exists
-                if not self.redshift_data_client_in_target.check_schema_exists(
-                    schema=self.external_schema, database=self.target_connection.database
-                ):
+                if not external_schema_exists:
                     ds_level_errors.append(
                         ShareErrorFormatter.dne_error_msg('Redshift external schema', self.external_schema)
                     )
                 # 7) (in target namespace) Check that the redshift role has access to the external schema
-                if not self.redshift_data_client_in_target.check_role_permissions_in_schema(
-                    schema=self.external_schema, rs_role=self.redshift_role
-                ):
+                if not role_has_schema_usage:
                     ds_level_errors.append(
                         ShareErrorFormatter.missing_permission_error_msg(
                             self.redshift_role, 'USAGE', ['USAGE'], 'Redshift external schema', self.external_schema
@@ -635,13 +667,15 @@ class ProcessRedshiftShare(SharesProcessorInterface):
             log.info('No Redshift tables to revoke. Skipping...')
         else:
             self._initialize_clients()
+            # the tables are revoked one by one, but the database and the schema do not change in the meantime
+            local_db_exists = self.redshift_data_client_in_target.check_database_exists(database=self.local_db)
+            external_schema_exists = local_db_exists and self.redshift_data_client_in_target.check_schema_exists(
+                schema=self.external_schema, database=self.target_connection.database
+            )
             for table in self.tables:
                 log.info(f'Revoking access to table {table}...')
-                local_db_exists = self.redshift_data_client_in_target.check_database_exists(database=self.local_db)
                 # 1) (in target namespace) Revoke access to the revoked tables to the redshift role in external schema (if schema exists)
-                if local_db_exists and self.redshift_data_client_in_target.check_schema_exists(
-                    schema=self.external_schema, database=self.target_connection.database
-                ):
+                if external_schema_exists:
                     execute_and_suppress_exception(
                         func=self.redshift_data_client_in_target.revoke_select_table_access_to_redshift_role,
                         schema=self.external_schema,
@@ -17,7 +17,7 @@ class AthenaTableClient:
         session = SessionHelper.remote_session(accountid=table.AWSAccountId, region=table.region)
 
         self._client = session.client('athena', region_name=env.region)
-        self._creds = session.get_credentials()
+        self._creds = session.get_credentials().get_frozen_credentials()
         self._env = env
         self._table = table
 
@@ -43,11 +43,8 @@ class AthenaTableClient:
         cursor.execute(sql)  # nosemgrep
         # it is not possible to build the query string with the table.X parameters using Pyathena connect
         # to remediate sql injections we built the Identifier class that removes any malicious code from the string
-        fields = []
-        for f in cursor.description:
-            fields.append(json.dumps({'name': f[0]}))
-        rows = []
-        for row in cursor:
-            rows.append(json.dumps(json_utils.to_json(list(row))))
+        fields = [json.dumps({'name': f[0]}) for f in cursor.description]
+        # every row is encoded once, as a JSON array of its values
+        rows = [json.dumps(list(row), default=json_utils.json_decoder) for row in cursor]
 
         return {'rows': rows, 'fields': fields}
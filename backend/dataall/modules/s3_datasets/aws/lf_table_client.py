@@ -6,6 +6,9 @@ from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
 
 log = logging.getLogger(__name__)
 
+# maximum number of entries of a BatchGrantPermissions request
+BATCH_GRANT_SIZE = 20
+
 
 class LakeFormationTableClient:
     """Requests to AWS LakeFormation"""
@@ -39,6 +42,41 @@ class LakeFormationTableClient:
             except ClientError:
                 pass  # ignore the error to continue with other requests
 
+    @staticmethod
+    def batch_grant_principals_all_table_permissions(tables: [DatasetTable], principals: [str], aws_session=None):
+        """
+        Same as grant_principals_all_table_permissions for many tables of the same account and region,
+        sent with BatchGrantPermissions. Failed entries are logged and ignored like in the single table version
+        """
+        if not tables:
+            return
+        if not aws_session:
+            aws_session = SessionHelper.remote_session(tables[0].AWSAccountId, tables[0].region)
+        client = aws_session.client('lakeformation', region_name=tables[0].region)
+        pairs = [(table, principal) for table in tables for principal in principals]
+        entries = [
+            dict(
+                Id=str(i),
+                Principal={'DataLakePrincipalIdentifier': principal},
+                Resource={'Table': {'DatabaseName': table.GlueDatabaseName, 'Name': table.name}},
+                Permissions=['ALL'],
+            )
+            for i, (table, principal) in enumerate(pairs)
+        ]
+        for start in range(0, len(entries), BATCH_GRANT_SIZE):
+            batch = entries[start : start + BATCH_GRANT_SIZE]
+            try:
+                response = client.batch_grant_permissions(Entries=batch)
+            except ClientError as e:
+                log.error(f'Failed to grant all permissions on {len(batch)} table/principal pairs: {e}')
+                continue
+            for failure in response.get('Failures', []):
+                entry = failure.get('RequestEntry', {})
+                log.error(
+                    f'Failed to grant all permissions on {entry.get("Resource")} '
+                    f'to {entry.get("Principal")}: {failure.get("Error")}'
+                )
+
     def _grant_permissions_to_table(self, principal, permissions):
         table = self._table
         try:
@@ -101,6 +101,10 @@ class DatasetLocationRepository:
         """return the dataset folders"""
         return session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == dataset_uri).all()
 
+    @staticmethod
+    def get_folders_of_datasets(session, dataset_uris):
+        return session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri.in_(dataset_uris)).all()
+
     @staticmethod
     def paginated_dataset_locations(session, uri, data=None) -> dict:
         query = session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == uri)
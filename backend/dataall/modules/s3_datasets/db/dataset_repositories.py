@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Query
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_models import Environment
@@ -9,7 +9,8 @@ from dataall.base.db import paginate
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.modules.datasets_base.services.datasets_enums import ConfidentialityClassification, Language
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
-from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
+from dataall.base.db.utils import changed_since
+from dataall.modules.s3_datasets.db.dataset_models import DatasetStorageLocation, DatasetTable, S3Dataset
 from dataall.base.utils.naming_convention import (
     NamingConventionService,
     NamingConventionPattern,
@@ -202,6 +203,39 @@ class DatasetRepository(EnvironmentResource):
     def list_all_active_datasets(session) -> [S3Dataset]:
         return session.query(S3Dataset).filter(S3Dataset.deleted.is_(None)).all()
 
+    @staticmethod
+    def list_active_datasets_changed_since(session, since, target_uris=None) -> [S3Dataset]:
+        """
+        Active datasets changed after since, together with the datasets of the tables and folders changed after since.
+        target_uris are other changes to consider (e.g. glossary terms, votes) as URIs of datasets, tables or folders
+        """
+        target_uris = list(target_uris or [])
+        changed_tables = session.query(DatasetTable.datasetUri).filter(
+            or_(changed_since(DatasetTable, since), DatasetTable.tableUri.in_(target_uris))
+        )
+        changed_folders = session.query(DatasetStorageLocation.datasetUri).filter(
+            or_(changed_since(DatasetStorageLocation, since), DatasetStorageLocation.locationUri.in_(target_uris))
+        )
+        return (
+            session.query(S3Dataset)
+            .filter(
+                and_(
+                    S3Dataset.deleted.is_(None),
+                    or_(
+                        changed_since(S3Dataset, since),
+                        S3Dataset.datasetUri.in_(target_uris),
+                        S3Dataset.datasetUri.in_(changed_tables),
+                        S3Dataset.datasetUri.in_(changed_folders),
+                    ),
+                )
+            )
+            .all()
+        )
+
+    @staticmethod
+    def list_datasets_deleted_since(session, since) -> [S3Dataset]:
+        return session.query(S3Dataset).filter(S3Dataset.deleted > since).all()
+
     @staticmethod
     def get_dataset_by_bucket_name(session, bucket) -> [S3Dataset]:
         return session.query(S3Dataset).filter(S3Dataset.S3BucketName == bucket).first()
@@ -210,6 +244,15 @@ class DatasetRepository(EnvironmentResource):
     def count_dataset_tables(session, dataset_uri):
         return session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset_uri).count()
 
+    @staticmethod
+    def count_tables_by_dataset(session, dataset_uris) -> dict:
+        return dict(
+            session.query(DatasetTable.datasetUri, func.count(DatasetTable.tableUri))
+            .filter(DatasetTable.datasetUri.in_(dataset_uris))
+            .group_by(DatasetTable.datasetUri)
+            .all()
+        )
+
     @staticmethod
     def query_environment_group_datasets(session, env_uri, group_uri, filter) -> Query:
         query = session.query(S3Dataset).filter(
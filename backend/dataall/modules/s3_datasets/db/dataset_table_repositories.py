@@ -1,7 +1,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy.sql import and_
+from sqlalchemy.sql import and_, or_
 
 from dataall.base.db import exceptions
 from dataall.modules.s3_datasets.db.dataset_models import (
@@ -88,6 +88,33 @@ class DatasetTableRepository:
             .all()
         )
 
+    @staticmethod
+    def find_all_active_tables_of_datasets(session, dataset_uris):
+        return (
+            session.query(DatasetTable)
+            .filter(
+                and_(
+                    DatasetTable.datasetUri.in_(dataset_uris),
+                    DatasetTable.LastGlueTableStatus != 'Deleted',
+                )
+            )
+            .all()
+        )
+
+    @staticmethod
+    def find_tables_deleted_since(session, since):
+        """Tables soft deleted or removed from Glue after since"""
+        return (
+            session.query(DatasetTable)
+            .filter(
+                or_(
+                    DatasetTable.deleted > since,
+                    and_(DatasetTable.LastGlueTableStatus == 'Deleted', DatasetTable.updated > since),
+                )
+            )
+            .all()
+        )
+
     @staticmethod
     def find_all_deleted_tables(session, dataset_uri):
         return (
@@ -102,9 +129,13 @@ class DatasetTableRepository:
         )
 
     @staticmethod
-    def sync_table_columns(session, dataset_table, glue_table):
-        DatasetTableRepository.delete_all_table_columns(session, dataset_table)
-
+    def sync_table_columns(session, dataset_table, glue_table) -> dict:
+        """
+        Reconciles the columns of the table with the columns and partition keys of the Glue table by name.
+        Only the new, changed and removed columns are written, so the metadata of the unchanged columns is kept.
+        Removed columns are soft-deleted and restored if they come back.
+        Returns the names of the columns that were added, updated and removed
+        """
         columns = [
             {**item, **{'columnType': 'column'}} for item in glue_table.get('StorageDescriptor', {}).get('Columns', [])
         ]
@@ -116,32 +147,87 @@ class DatasetTableRepository:
         logger.debug(f'Found columns {columns} for table {dataset_table}')
         logger.debug(f'Found partitions {partitions} for table {dataset_table}')
 
-        for col in columns + partitions:
-            table_col = DatasetTableColumn(
-                name=col['Name'],
-                description=col.get('Comment', 'No description provided'),
-                label=col['Name'],
-                owner=dataset_table.owner,
-                datasetUri=dataset_table.datasetUri,
-                tableUri=dataset_table.tableUri,
-                AWSAccountId=dataset_table.AWSAccountId,
-                GlueDatabaseName=dataset_table.GlueDatabaseName,
-                GlueTableName=dataset_table.GlueTableName,
-                region=dataset_table.region,
-                typeName=col['Type'],
-                columnType=col['columnType'],
+        existing = (
+            session.query(
+                DatasetTableColumn.columnUri,
+                DatasetTableColumn.name,
+                DatasetTableColumn.typeName,
+                DatasetTableColumn.columnType,
+                DatasetTableColumn.description,
+                DatasetTableColumn.deleted,
             )
-            session.add(table_col)
+            .filter(DatasetTableColumn.tableUri == dataset_table.tableUri)
+            # the active column of a name comes first
+            .order_by(DatasetTableColumn.deleted.desc().nullsfirst(), DatasetTableColumn.created.asc())
+            .all()
+        )
+        existing_by_name = {}
+        duplicates = []
+        for column in existing:
+            if column.name not in existing_by_name:
+                existing_by_name[column.name] = column
+            elif column.deleted is None:
+                duplicates.append(column)
 
-    @staticmethod
-    def delete_all_table_columns(session, dataset_table):
-        session.query(DatasetTableColumn).filter(
-            and_(
-                DatasetTableColumn.GlueDatabaseName == dataset_table.GlueDatabaseName,
-                DatasetTableColumn.GlueTableName == dataset_table.GlueTableName,
-            )
-        ).delete()
-        session.commit()
+        now = datetime.now()
+        inserts, updates = [], []
+        drift = {'added': [], 'updated': [], 'removed': []}
+        for col in columns + partitions:
+            current = existing_by_name.pop(col['Name'], None)
+            if current is None:
+                inserts.append(
+                    dict(
+                        name=col['Name'],
+                        description=col.get('Comment', 'No description provided'),
+                        label=col['Name'],
+                        owner=dataset_table.owner,
+                        datasetUri=dataset_table.datasetUri,
+                        tableUri=dataset_table.tableUri,
+                        AWSAccountId=dataset_table.AWSAccountId,
+                        GlueDatabaseName=dataset_table.GlueDatabaseName,
+                        GlueTableName=dataset_table.GlueTableName,
+                        region=dataset_table.region,
+                        typeName=col['Type'],
+                        columnType=col['columnType'],
+                        created=now,
+                    )
+                )
+                drift['added'].append(col['Name'])
+                continue
+
+            changes = {}
+            if current.typeName != col['Type']:
+                changes['typeName'] = col['Type']
+            if current.columnType != col['columnType']:
+                changes['columnType'] = col['columnType']
+            # descriptions edited in data.all are written to Glue, a column without comment keeps its description
+            if col.get('Comment') and current.description != col['Comment']:
+                changes['description'] = col['Comment']
+            if current.deleted is not None:
+                changes['deleted'] = None
+                drift['added'].append(col['Name'])
+            elif changes:
+                drift['updated'].append(col['Name'])
+            if changes:
+                updates.append(dict(columnUri=current.columnUri, updated=now, **changes))
+
+        removed = [column for column in existing_by_name.values() if column.deleted is None] + duplicates
+        drift['removed'] = [column.name for column in removed]
+
+        if inserts:
+            session.bulk_insert_mappings(DatasetTableColumn, inserts)
+        if updates:
+            session.bulk_update_mappings(DatasetTableColumn, updates)
+        if removed:
+            session.query(DatasetTableColumn).filter(
+                DatasetTableColumn.columnUri.in_([column.columnUri for column in removed])
+            ).update({DatasetTableColumn.deleted: now}, synchronize_session=False)
+
+        logger.info(
+            f'Synchronized columns of table {dataset_table.GlueDatabaseName}.{dataset_table.GlueTableName}: '
+            f'{len(drift["added"])} added, {len(drift["updated"])} updated, {len(drift["removed"])} removed'
+        )
+        return drift
 
     @staticmethod
     def get_table_by_s3_prefix(session, s3_prefix, accountid, region):
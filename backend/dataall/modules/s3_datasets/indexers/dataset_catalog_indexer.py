@@ -1,12 +1,19 @@
+"""Contains dataset related indexers for OpenSearch"""
+
 import logging
+from datetime import datetime
 
 from typing import List
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.s3_datasets.indexers.dataset_indexing_context import DatasetIndexingContext
 from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
+from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.s3_datasets.db.dataset_models import S3Dataset
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+from dataall.modules.vote.db.vote_repositories import VoteRepository
 
 log = logging.getLogger(__name__)
 
@@ -19,16 +26,36 @@ class DatasetCatalogIndexer(CatalogIndexer):
 
     def index(self, session) -> List[str]:
         all_datasets: List[S3Dataset] = DatasetRepository.list_all_active_datasets(session)
-        all_dataset_uris = []
         log.info(f'Found {len(all_datasets)} datasets')
-        for dataset in all_datasets:
-            tables = DatasetTableIndexer.upsert_all(session, dataset.datasetUri)
+        return self._index_datasets(session, all_datasets)
+
+    def index_changes(self, session, since: datetime) -> List[str]:
+        # the document of a dataset contains the counts of its tables and folders, so a change in any of them
+        # re-indexes the whole dataset
+        target_uris = BaseIndexer._get_targets_with_changed_glossary(session, since)
+        target_uris |= VoteRepository.list_targets_voted_since(session, target_type='dataset', since=since)
+        changed_datasets = DatasetRepository.list_active_datasets_changed_since(session, since, target_uris)
+        log.info(f'Found {len(changed_datasets)} datasets changed since {since}')
+
+        for table in DatasetTableRepository.find_tables_deleted_since(session, since):
+            DatasetTableIndexer.delete_doc(doc_id=table.tableUri)
+        for dataset in DatasetRepository.list_datasets_deleted_since(session, since):
+            DatasetIndexer.delete_doc(doc_id=dataset.datasetUri)
+
+        return self._index_datasets(session, changed_datasets)
+
+    @staticmethod
+    def _index_datasets(session, datasets: List[S3Dataset]) -> List[str]:
+        all_dataset_uris = []
+        context = DatasetIndexingContext.load(session, datasets)
+        for dataset in datasets:
+            tables = DatasetTableIndexer.upsert_all(session, dataset.datasetUri, context=context)
             all_dataset_uris += [table.tableUri for table in tables]
 
-            folders = DatasetLocationIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
+            folders = DatasetLocationIndexer.upsert_all(session, dataset_uri=dataset.datasetUri, context=context)
             all_dataset_uris += [folder.locationUri for folder in folders]
 
-            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri, context=context)
             all_dataset_uris.append(dataset.datasetUri)
 
         return all_dataset_uris
@@ -7,15 +7,26 @@ from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.s3_datasets.indexers.dataset_indexing_context import DatasetIndexingContext
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
 class DatasetIndexer(BaseIndexer):
     @classmethod
-    def upsert(cls, session, dataset_uri: str):
-        dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+    def upsert(cls, session, dataset_uri: str, context: DatasetIndexingContext = None):
+        if context:
+            dataset = context.datasets.get(dataset_uri)
+        else:
+            dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
 
-        if dataset:
+        if dataset and context:
+            env = context.environment_of(dataset)
+            org = context.organization_of(dataset)
+            count_tables = context.table_counts.get(dataset_uri, 0)
+            count_folders = len(context.folders.get(dataset_uri, []))
+            count_upvotes = context.upvotes.get(dataset_uri, 0)
+            glossary = context.glossary_of(dataset_uri)
+        elif dataset:
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
 
@@ -24,6 +35,8 @@ class DatasetIndexer(BaseIndexer):
             count_upvotes = VoteRepository.count_upvotes(session, dataset_uri, target_type='dataset')
 
             glossary = BaseIndexer._get_target_glossary_terms(session, dataset_uri)
+
+        if dataset:
             BaseIndexer._index(
                 doc_id=dataset_uri,
                 doc={
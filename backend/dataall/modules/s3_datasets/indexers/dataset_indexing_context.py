@@ -0,0 +1,73 @@
+"""
+Lookups needed to build the catalog documents of datasets, tables and folders.
+They are loaded for all the datasets at once with a few set-based queries, so indexing the whole catalog
+doesn't query the environment, organization, votes and glossary terms of every single document
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from dataall.core.environment.db.environment_models import Environment
+from dataall.core.organizations.db.organization_models import Organization
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.s3_datasets.db.dataset_models import DatasetStorageLocation, DatasetTable, S3Dataset
+from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
+from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.vote.db.vote_repositories import VoteRepository
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class DatasetIndexingContext:
+    datasets: Dict[str, S3Dataset] = field(default_factory=dict)
+    environments: Dict[str, Environment] = field(default_factory=dict)
+    organizations: Dict[str, Organization] = field(default_factory=dict)
+    active_tables: Dict[str, List[DatasetTable]] = field(default_factory=dict)
+    table_counts: Dict[str, int] = field(default_factory=dict)
+    folders: Dict[str, List[DatasetStorageLocation]] = field(default_factory=dict)
+    upvotes: Dict[str, int] = field(default_factory=dict)
+    glossary_terms: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, session, datasets: List[S3Dataset]) -> 'DatasetIndexingContext':
+        context = cls(datasets={dataset.datasetUri: dataset for dataset in datasets})
+        if not datasets:
+            return context
+        dataset_uris = list(context.datasets.keys())
+
+        environment_uris = {dataset.environmentUri for dataset in datasets}
+        context.environments = {
+            env.environmentUri: env
+            for env in session.query(Environment).filter(Environment.environmentUri.in_(environment_uris))
+        }
+        organization_uris = {dataset.organizationUri for dataset in datasets}
+        context.organizations = {
+            org.organizationUri: org
+            for org in session.query(Organization).filter(Organization.organizationUri.in_(organization_uris))
+        }
+
+        for table in DatasetTableRepository.find_all_active_tables_of_datasets(session, dataset_uris):
+            context.active_tables.setdefault(table.datasetUri, []).append(table)
+        context.table_counts = DatasetRepository.count_tables_by_dataset(session, dataset_uris)
+        for folder in DatasetLocationRepository.get_folders_of_datasets(session, dataset_uris):
+            context.folders.setdefault(folder.datasetUri, []).append(folder)
+
+        context.upvotes = VoteRepository.count_upvotes_by_target(session, target_type='dataset')
+        context.glossary_terms = BaseIndexer._get_glossary_terms_by_target(session)
+        log.info(
+            f'Loaded the indexing context of {len(datasets)} datasets, '
+            f'{len(context.environments)} environments and {len(context.organizations)} organizations'
+        )
+        return context
+
+    def environment_of(self, dataset: S3Dataset) -> Environment:
+        return self.environments[dataset.environmentUri]
+
+    def organization_of(self, dataset: S3Dataset) -> Organization:
+        return self.organizations[dataset.organizationUri]
+
+    def glossary_of(self, target_uri: str) -> List[str]:
+        return self.glossary_terms.get(target_uri, [])
@@ -6,6 +6,7 @@ from dataall.core.environment.services.environment_service import EnvironmentSer
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.s3_datasets.db.dataset_location_repositories import DatasetLocationRepository
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
+from dataall.modules.s3_datasets.indexers.dataset_indexing_context import DatasetIndexingContext
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
@@ -19,42 +20,53 @@ class DatasetLocationIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, folder_uri)
-
-            BaseIndexer._index(
-                doc_id=folder_uri,
-                doc={
-                    'name': folder.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': folder.owner,
-                    'label': folder.label,
-                    'resourceKind': 'folder',
-                    'description': folder.description,
-                    'source': dataset.S3BucketName,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [f.replace('-', '') for f in folder.tags or []],
-                    'topics': dataset.topics,
-                    'region': folder.region.replace('-', ''),
-                    'datasetUri': folder.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': folder.created,
-                    'updated': folder.updated,
-                    'deleted': folder.deleted,
-                    'glossary': glossary,
-                },
-            )
+            cls._index_folder(folder, dataset, env, org, glossary)
         return folder
 
     @classmethod
-    def upsert_all(cls, session, dataset_uri: str):
+    def _index_folder(cls, folder, dataset, env, org, glossary):
+        BaseIndexer._index(
+            doc_id=folder.locationUri,
+            doc={
+                'name': folder.name,
+                'admins': dataset.SamlAdminGroupName,
+                'owner': folder.owner,
+                'label': folder.label,
+                'resourceKind': 'folder',
+                'description': folder.description,
+                'source': dataset.S3BucketName,
+                'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+                'tags': [f.replace('-', '') for f in folder.tags or []],
+                'topics': dataset.topics,
+                'region': folder.region.replace('-', ''),
+                'datasetUri': folder.datasetUri,
+                'environmentUri': env.environmentUri,
+                'environmentName': env.name,
+                'organizationUri': org.organizationUri,
+                'organizationName': org.name,
+                'created': folder.created,
+                'updated': folder.updated,
+                'deleted': folder.deleted,
+                'glossary': glossary,
+            },
+        )
+
+    @classmethod
+    def upsert_all(cls, session, dataset_uri: str, context: DatasetIndexingContext = None):
+        if context:
+            dataset = context.datasets[dataset_uri]
+            folders = context.folders.get(dataset_uri, [])
+            env = context.environment_of(dataset)
+            org = context.organization_of(dataset)
+            for folder in folders:
+                cls._index_folder(folder, dataset, env, org, context.glossary_of(folder.locationUri))
+            return folders
+
         folders = DatasetLocationRepository.get_dataset_folders(session, dataset_uri)
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        glossary = BaseIndexer._get_glossary_terms_by_target(session, [folder.locationUri for folder in folders])
         for folder in folders:
-            DatasetLocationIndexer.upsert(
-                session=session, folder_uri=folder.locationUri, dataset=dataset, env=env, org=org
-            )
+            cls._index_folder(folder, dataset, env, org, glossary.get(folder.locationUri, []))
         return folders
@@ -7,6 +7,7 @@ from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.s3_datasets.indexers.dataset_indexing_context import DatasetIndexingContext
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
@@ -20,44 +21,57 @@ class DatasetTableIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
-
-            tags = table.tags if table.tags else []
-            BaseIndexer._index(
-                doc_id=table_uri,
-                doc={
-                    'name': table.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': table.owner,
-                    'label': table.label,
-                    'resourceKind': 'table',
-                    'description': table.description,
-                    'database': table.GlueDatabaseName,
-                    'source': table.S3BucketName,
-                    'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
-                    'tags': [t.replace('-', '') for t in tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'datasetUri': table.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': table.created,
-                    'updated': table.updated,
-                    'deleted': table.deleted,
-                    'glossary': glossary,
-                },
-            )
+            cls._index_table(table, dataset, env, org, glossary)
         return table
 
     @classmethod
-    def upsert_all(cls, session, dataset_uri: str):
+    def _index_table(cls, table, dataset, env, org, glossary):
+        tags = table.tags if table.tags else []
+        BaseIndexer._index(
+            doc_id=table.tableUri,
+            doc={
+                'name': table.name,
+                'admins': dataset.SamlAdminGroupName,
+                'owner': table.owner,
+                'label': table.label,
+                'resourceKind': 'table',
+                'description': table.description,
+                'database': table.GlueDatabaseName,
+                'source': table.S3BucketName,
+                'classification': re.sub('[^A-Za-z0-9]+', '', dataset.confidentiality),
+                'tags': [t.replace('-', '') for t in tags or []],
+                'topics': dataset.topics,
+                'region': dataset.region.replace('-', ''),
+                'datasetUri': table.datasetUri,
+                'environmentUri': env.environmentUri,
+                'environmentName': env.name,
+                'organizationUri': org.organizationUri,
+                'organizationName': org.name,
+                'created': table.created,
+                'updated': table.updated,
+                'deleted': table.deleted,
+                'glossary': glossary,
+            },
+        )
+
+    @classmethod
+    def upsert_all(cls, session, dataset_uri: str, context: DatasetIndexingContext = None):
+        if context:
+            dataset = context.datasets[dataset_uri]
+            tables = context.active_tables.get(dataset_uri, [])
+            env = context.environment_of(dataset)
+            org = context.organization_of(dataset)
+            for table in tables:
+                cls._index_table(table, dataset, env, org, context.glossary_of(table.tableUri))
+            return tables
+
         tables = DatasetTableRepository.find_all_active_tables(session, dataset_uri)
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        glossary = BaseIndexer._get_glossary_terms_by_target(session, [table.tableUri for table in tables])
         for table in tables:
-            DatasetTableIndexer.upsert(session=session, table_uri=table.tableUri, dataset=dataset, env=env, org=org)
+            cls._index_table(table, dataset, env, org, glossary.get(table.tableUri, []))
         return tables
 
     @classmethod
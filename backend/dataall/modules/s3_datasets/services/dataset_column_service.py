@@ -8,6 +8,7 @@ from dataall.core.tasks.db.task_models import Task
 from dataall.modules.s3_datasets.aws.glue_table_client import GlueTableClient
 from dataall.modules.s3_datasets.db.dataset_column_repositories import DatasetColumnRepository
 from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.s3_datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.s3_datasets.services.dataset_permissions import UPDATE_DATASET_TABLE, MANAGE_DATASETS
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, DatasetTableColumn
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
@@ -53,7 +54,8 @@ class DatasetColumnService:
             aws = SessionHelper.remote_session(table.AWSAccountId, table.region)
             glue_table = GlueTableClient(aws, table).get_table()
 
-            DatasetTableRepository.sync_table_columns(session, table, glue_table['Table'])
+            drift = DatasetTableRepository.sync_table_columns(session, table, glue_table['Table'])
+            DatasetTableService.post_schema_drift(session, table, drift)
         return cls.paginate_active_columns_for_table(uri=table_uri, filter={})
 
     @staticmethod
@@ -367,7 +367,7 @@ class DatasetService:
                     message=f'{context.username=} is not a member of the group {dataset.SamlAdminGroupName}',
                 )
         pivot_session = SessionHelper.remote_session(account_id, region)
-        aws_session = SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn)
+        aws_session = SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn, cached=False)
         url = SessionHelper.get_console_access_url(
             aws_session,
             region=dataset.region,
@@ -413,8 +413,10 @@ class DatasetService:
             dataset = DatasetRepository.get_dataset_by_uri(session, uri)
 
         pivot_session = SessionHelper.remote_session(dataset.AwsAccountId, dataset.region)
-        aws_session = SessionHelper.get_session(base_session=pivot_session, role_arn=dataset.IAMDatasetAdminRoleArn)
-        c = aws_session.get_credentials()
+        aws_session = SessionHelper.get_session(
+            base_session=pivot_session, role_arn=dataset.IAMDatasetAdminRoleArn, cached=False
+        )
+        c = aws_session.get_credentials().get_frozen_credentials()
         credentials = {
             'AccessKey': c.access_key,
             'SessionKey': c.secret_key,
@@ -3,6 +3,7 @@ from dataall.base.context import get_context
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.feed.db.feed_models import FeedMessage
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.modules.s3_datasets.aws.athena_table_client import AthenaTableClient
 from dataall.modules.s3_datasets.aws.glue_dataset_client import DatasetCrawler
@@ -31,6 +32,8 @@ from dataall.base.db import exceptions
 
 log = logging.getLogger(__name__)
 
+SCHEMA_DRIFT_FEED_CREATOR = 'data.all'
+
 
 class DatasetTableService:
     @staticmethod
@@ -148,15 +151,31 @@ class DatasetTableService:
                     log.info(f'Storing new table: {table} for dataset db {dataset.GlueDatabaseName}')
                     updated_table = DatasetTableRepository.create_synced_table(session, dataset, table)
                     DatasetTableService._attach_dataset_table_permission(session, dataset, updated_table.tableUri)
+                    DatasetTableRepository.sync_table_columns(session, updated_table, table)
                 else:
                     log.info(f'Updating table: {table} for dataset db {dataset.GlueDatabaseName}')
                     updated_table: DatasetTable = existing_dataset_tables_map.get(table['Name'])
                     updated_table.GlueTableProperties = json_utils.to_json(table.get('Parameters', {}))
-
-                DatasetTableRepository.sync_table_columns(session, updated_table, table)
+                    drift = DatasetTableRepository.sync_table_columns(session, updated_table, table)
+                    DatasetTableService.post_schema_drift(session, updated_table, drift)
 
         return True
 
+    @staticmethod
+    def post_schema_drift(session, table: DatasetTable, drift: dict):
+        """Posts the columns added, updated and removed by a sync of the table to its feed"""
+        changes = [f'{change} columns {", ".join(names)}' for change, names in drift.items() if names]
+        if not changes:
+            return
+        session.add(
+            FeedMessage(
+                targetUri=table.tableUri,
+                targetType='DatasetTable',
+                creator=SCHEMA_DRIFT_FEED_CREATOR,
+                content=f'Schema of table {table.GlueTableName} changed in Glue: {"; ".join(changes)}',
+            )
+        )
+
     @staticmethod
     def _attach_dataset_table_permission(session, dataset: S3Dataset, table_uri):
         """
@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from collections import defaultdict
+from typing import Dict, List
 
 from dataall.core.environment.tasks.env_stack_finder import StackFinder
 from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
@@ -18,3 +19,11 @@ class DatasetStackFinder(StackFinder):
         all_datasets: [S3Dataset] = DatasetRepository.list_all_active_datasets(session)
         log.info(f'Found {len(all_datasets)} datasets')
         return [dataset.datasetUri for dataset in all_datasets]
+
+    def find_stack_uris_by_environment(self, session) -> Dict[str, List[str]]:
+        all_datasets: [S3Dataset] = DatasetRepository.list_all_active_datasets(session)
+        log.info(f'Found {len(all_datasets)} datasets')
+        stack_uris = defaultdict(list)
+        for dataset in all_datasets:
+            stack_uris[dataset.environmentUri].append(dataset.datasetUri)
+        return stack_uris
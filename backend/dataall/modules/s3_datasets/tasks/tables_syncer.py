@@ -1,12 +1,16 @@
 import logging
 import os
 import sys
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from operator import and_
 
 from dataall.base.aws.sts import SessionHelper
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.base.db import get_engine
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.s3_datasets.aws.glue_dataset_client import DatasetCrawler
 from dataall.modules.s3_datasets.aws.lf_table_client import LakeFormationTableClient
 from dataall.modules.s3_datasets.services.dataset_table_service import DatasetTableService
@@ -18,60 +22,141 @@ from dataall.modules.s3_datasets.services.dataset_alarm_service import DatasetAl
 
 log = logging.getLogger(__name__)
 
+# number of (account, region) groups synchronized at the same time
+MAX_WORKERS = int(os.getenv('TABLES_SYNC_MAX_WORKERS', '8'))
+# number of groups of the same account synchronized at the same time, to stay below the AWS API quotas of the account
+MAX_WORKERS_PER_ACCOUNT = int(os.getenv('TABLES_SYNC_MAX_WORKERS_PER_ACCOUNT', '2'))
+
 
 def sync_tables(engine):
+    """
+    Synchronizes the tables of all the active datasets with their Glue databases.
+    The datasets are grouped by (AwsAccountId, region), the pivot role is assumed once per group
+    and the groups are synchronized in parallel
+    """
     with engine.scoped_session() as session:
-        processed_tables = []
         all_datasets: [S3Dataset] = DatasetRepository.list_all_active_datasets(session)
-        log.info(f'Found {len(all_datasets)} datasets for tables sync')
-        dataset: S3Dataset
-        for dataset in all_datasets:
-            log.info(f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables')
-            env: Environment = (
-                session.query(Environment)
-                .filter(
-                    and_(
-                        Environment.environmentUri == dataset.environmentUri,
-                        Environment.deleted.is_(None),
+    log.info(f'Found {len(all_datasets)} datasets for tables sync')
+
+    groups = defaultdict(list)
+    for dataset in all_datasets:
+        groups[(dataset.AwsAccountId, dataset.region)].append(dataset)
+
+    processed_tables = []
+    if len(groups) <= 1 or MAX_WORKERS <= 1:
+        for (account_id, region), datasets in groups.items():
+            processed_tables += _sync_group(engine, account_id, region, datasets)
+        return processed_tables
+
+    # the groups of an account are submitted only when the account has less than MAX_WORKERS_PER_ACCOUNT groups
+    # running, so that the workers of the pool are not blocked waiting for an account
+    pending = defaultdict(deque)
+    for account_id, region in groups:
+        pending[account_id].append(region)
+    running = Counter()
+    futures = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='tables-syncer') as executor:
+
+        def submit_ready_groups():
+            for account_id, regions in pending.items():
+                while regions and running[account_id] < MAX_WORKERS_PER_ACCOUNT and len(futures) < MAX_WORKERS:
+                    region = regions.popleft()
+                    running[account_id] += 1
+                    future = executor.submit(_sync_group, engine, account_id, region, groups[(account_id, region)])
+                    futures[future] = (account_id, region)
+
+        submit_ready_groups()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                account_id, region = futures.pop(future)
+                running[account_id] -= 1
+                try:
+                    processed_tables += future.result()
+                except Exception as e:
+                    # the tables of the other groups are still returned
+                    log.error(f'Failed to sync tables of account {account_id} in {region} due to: {e}')
+            submit_ready_groups()
+    return processed_tables
+
+
+def _sync_group(engine, account_id, region, datasets):
+    started = time.perf_counter()
+    processed_tables = []
+    failed = 0
+    pivot_role_assumable = None
+    pivot_role_error = None
+    # the catalog documents of the group are sent in batches once the group is synchronized
+    with BaseIndexer.bulk():
+        for dataset in datasets:
+            with engine.scoped_session() as session:
+                env: Environment = (
+                    session.query(Environment)
+                    .filter(
+                        and_(
+                            Environment.environmentUri == dataset.environmentUri,
+                            Environment.deleted.is_(None),
+                        )
                     )
+                    .first()
                 )
-                .first()
-            )
-            env_group: EnvironmentGroup = EnvironmentService.get_environment_group(
-                session, dataset.SamlAdminGroupName, env.environmentUri
-            )
-            try:
-                if not env or not is_assumable_pivot_role(env):
+                if env and pivot_role_assumable is None:
+                    # the pivot role session is cached, the Glue and LF clients of the group reuse it
+                    try:
+                        pivot_role_assumable = is_assumable_pivot_role(env)
+                    except Exception as e:
+                        log.error(f'Failed to assume dataall pivot role in environment {env.AwsAccountId}: {e}')
+                        pivot_role_assumable = False
+                        pivot_role_error = str(e)
+                if not env or not pivot_role_assumable:
                     log.info(f'Dataset {dataset.GlueDatabaseName} has an invalid environment')
-                else:
-                    tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
+                    if env and pivot_role_error:
+                        failed += 1
+                        DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, pivot_role_error)
+                    continue
+                try:
+                    processed_tables += _sync_dataset_tables(session, dataset, env)
+                except Exception as e:
+                    failed += 1
+                    session.rollback()
+                    log.error(
+                        f'Failed to sync tables for dataset {dataset.AwsAccountId}/{dataset.GlueDatabaseName} due to: {e}'
+                    )
+                    DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
 
-                    log.info(f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}')
+    log.info(
+        f'Synchronized {len(datasets) - failed}/{len(datasets)} datasets and {len(processed_tables)} tables '
+        f'of account {account_id} in {region} in {time.perf_counter() - started:.1f}s'
+    )
+    return processed_tables
 
-                    DatasetTableService.sync_existing_tables(session, uri=dataset.datasetUri, glue_tables=tables)
 
-                    tables = session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset.datasetUri).all()
+def _sync_dataset_tables(session, dataset: S3Dataset, env: Environment):
+    log.info(f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables')
+    env_group: EnvironmentGroup = EnvironmentService.get_environment_group(
+        session, dataset.SamlAdminGroupName, env.environmentUri
+    )
+    tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
 
-                    log.info('Updating tables permissions on Lake Formation...')
+    log.info(f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}')
 
-                    for table in tables:
-                        LakeFormationTableClient(table).grant_principals_all_table_permissions(
-                            principals=[
-                                SessionHelper.get_delegation_role_arn(env.AwsAccountId, env.region),
-                                env_group.environmentIAMRoleArn,
-                            ],
-                        )
+    DatasetTableService.sync_existing_tables(session, uri=dataset.datasetUri, glue_tables=tables)
 
-                    processed_tables.extend(tables)
+    tables = session.query(DatasetTable).filter(DatasetTable.datasetUri == dataset.datasetUri).all()
 
-                    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-                    DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
-            except Exception as e:
-                log.error(
-                    f'Failed to sync tables for dataset {dataset.AwsAccountId}/{dataset.GlueDatabaseName} due to: {e}'
-                )
-                DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
-        return processed_tables
+    log.info('Updating tables permissions on Lake Formation...')
+    LakeFormationTableClient.batch_grant_principals_all_table_permissions(
+        tables=tables,
+        principals=[
+            SessionHelper.get_delegation_role_arn(env.AwsAccountId, env.region),
+            env_group.environmentIAMRoleArn,
+        ],
+    )
+
+    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
+    DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+    return tables
 
 
 def is_assumable_pivot_role(env: Environment):
@@ -1,14 +1,20 @@
 import logging
-from typing import List
+import random
+from typing import Dict, List, Set, Tuple
 import time
 
 from botocore.exceptions import ClientError
-from retrying import Retrying
 
 from dataall.base.aws.sts import SessionHelper
 
 log = logging.getLogger('aws:lakeformation')
 
+# maximum number of entries of BatchGrantPermissions and BatchRevokePermissions
+BATCH_SIZE = 20
+# attempts of the entries failing with ConcurrentModificationException
+MAX_ATTEMPTS = 5
+ALREADY_REVOKED_MESSAGES = ['Grantee has no permissions', 'No permissions revoked', 'not found']
+
 
 class LakeFormationClient:
     def __init__(self, account_id, region):
@@ -115,6 +121,7 @@ class LakeFormationClient:
     def grant_permissions_to_table_with_filters(
         self, principals, database_name, table_name, catalog_id, permissions, data_filters=[]
     ) -> True:
+        entries = []
         for f_name in data_filters:
             data_filter_resource = {
                 'DataCellsFilter': {
@@ -124,13 +131,16 @@ class LakeFormationClient:
                     'Name': f_name,
                 },
             }
-            self._grant_permissions_to_resource(
-                principals=principals,
-                resource=data_filter_resource,
-                permissions=permissions,
-                permissions_with_grant_options=None,
-                check_resource=data_filter_resource,
+            entries.extend(
+                self._missing_grant_entries(
+                    principals=principals,
+                    resource=data_filter_resource,
+                    permissions=permissions,
+                    permissions_with_grant_options=None,
+                    check_resource=data_filter_resource,
+                )
             )
+        self._batch_grant(entries)
         return True
 
     def _grant_permissions_to_resource(
@@ -141,54 +151,161 @@ class LakeFormationClient:
         permissions_with_grant_options: List = None,
         check_resource: dict = None,
     ) -> True:
+        entries = self._missing_grant_entries(
+            principals=principals,
+            resource=resource,
+            permissions=permissions,
+            permissions_with_grant_options=permissions_with_grant_options,
+            check_resource=check_resource,
+        )
+        self._batch_grant(entries)
+        return True
+
+    def _missing_grant_entries(
+        self,
+        principals: List,
+        resource: dict,
+        permissions: List,
+        permissions_with_grant_options: List = None,
+        check_resource: dict = None,
+    ) -> List[dict]:
+        """
+        Lists the existing permissions of all the principals to the resource with a single paginated call
+        and returns the batch entries of the principals that miss some of the permissions
+        """
+        existing = self._list_permissions_by_principal(check_resource if check_resource else resource)
+        entries = []
         for principal in principals:
-            try:
-                if not self._check_permissions_to_resource(
-                    principal=principal,
-                    resource=resource,
-                    permissions=permissions,
-                    permissions_with_grant_options=permissions_with_grant_options,
-                    check_resource=check_resource,
-                ):
-                    log.info(f'Granting principal {principal} permissions {permissions} to {str(resource)}...')
-                    # We define the grant with "permissions" instead of "missing_permissions" because we want to avoid
-                    # duplicates done by data.all, but we want to avoid dependencies with external grants
-                    grant_dict = dict(
-                        Principal={'DataLakePrincipalIdentifier': principal},
-                        Resource=resource,
-                        Permissions=permissions,
-                    )
-                    if permissions_with_grant_options:
-                        grant_dict['PermissionsWithGrantOption'] = permissions_with_grant_options
-
-                    response = Retrying(
-                        retry_on_exception=lambda ex: isinstance(
-                            ex, self._client.exceptions.ConcurrentModificationException
-                        ),
-                        stop_max_attempt_number=5,
-                        wait_random_min=1000,
-                        wait_random_max=3000,
-                    ).call(self._client.grant_permissions, **grant_dict)
-
-                    log.info(
-                        f'Successfully granted principal {principal} '
-                        f'permissions {permissions} '
-                        f'and permissions with grant options {permissions_with_grant_options} '
-                        f'to {str(resource)}  '
-                        f'response: {response}'
+            current, current_grant = existing.get(principal, (set(), set()))
+            if set(permissions) <= current and set(permissions_with_grant_options or []) <= current_grant:
+                log.info(
+                    f'Already granted principal {principal} '
+                    f'permissions {permissions} '
+                    f'and permissions with grant options {permissions_with_grant_options} '
+                    f'to {str(resource)}'
+                )
+                continue
+            # We define the grant with "permissions" instead of "missing_permissions" because we want to avoid
+            # duplicates done by data.all, but we want to avoid dependencies with external grants
+            entries.append(self._batch_entry(principal, resource, permissions, permissions_with_grant_options))
+        return entries
+
+    def _list_permissions_by_principal(self, resource: dict) -> Dict[str, Tuple[Set[str], Set[str]]]:
+        try:
+            by_principal = {}
+            kwargs = dict(Resource=resource)
+            while True:
+                page = self._client.list_permissions(**kwargs)
+                for permission in page['PrincipalResourcePermissions']:
+                    current, current_grant = by_principal.setdefault(
+                        permission['Principal']['DataLakePrincipalIdentifier'], (set(), set())
                     )
-                    time.sleep(2)
+                    current.update(permission['Permissions'])
+                    current_grant.update(permission['PermissionsWithGrantOption'])
+                if not page.get('NextToken'):
+                    return by_principal
+                kwargs['NextToken'] = page['NextToken']
+        except ClientError as e:
+            log.error(f'Could not list permissions to {str(resource)} due to: {e}')
+            raise e
 
-            except ClientError as e:
+    @staticmethod
+    def _batch_entry(principal, resource, permissions, permissions_with_grant_options=None) -> dict:
+        entry = dict(
+            Principal={'DataLakePrincipalIdentifier': principal},
+            Resource=resource,
+            Permissions=permissions,
+        )
+        if permissions_with_grant_options:
+            entry['PermissionsWithGrantOption'] = permissions_with_grant_options
+        return entry
+
+    def _batch_grant(self, entries: List[dict]) -> None:
+        for entry, error in self._submit_batches(self._client.batch_grant_permissions, entries):
+            log.error(
+                f'Could not grant principal {entry["Principal"]["DataLakePrincipalIdentifier"]} '
+                f'permissions {entry["Permissions"]} '
+                f'and permissions with grant options {entry.get("PermissionsWithGrantOption")} '
+                f'to {str(entry["Resource"])} '
+                f'due to: {error}'
+            )
+            raise ClientError(
+                {'Error': {'Code': error.get('ErrorCode'), 'Message': error.get('ErrorMessage')}},
+                'BatchGrantPermissions',
+            )
+        for entry in entries:
+            log.info(
+                f'Successfully granted principal {entry["Principal"]["DataLakePrincipalIdentifier"]} '
+                f'permissions {entry["Permissions"]} '
+                f'and permissions with grant options {entry.get("PermissionsWithGrantOption")} '
+                f'to {str(entry["Resource"])}'
+            )
+
+    def _batch_revoke(self, entries: List[dict]) -> None:
+        for entry, error in self._submit_batches(self._client.batch_revoke_permissions, entries):
+            principal = entry['Principal']['DataLakePrincipalIdentifier']
+            if not self._is_already_revoked(error.get('ErrorCode'), error.get('ErrorMessage')):
                 log.error(
-                    f'Could not grant principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)}  '
-                    f'due to: {e}'
+                    f'Failed revoking principal {principal} '
+                    f'permissions {entry["Permissions"]} '
+                    f'and permissions with grant options {entry.get("PermissionsWithGrantOption")} '
+                    f'to {str(entry["Resource"])} '
+                    f'due to: {error}'
                 )
-                raise e
-        return True
+                raise ClientError(
+                    {'Error': {'Code': error.get('ErrorCode'), 'Message': error.get('ErrorMessage')}},
+                    'BatchRevokePermissions',
+                )
+            log.warning(
+                f'Principal {principal} already has revoked '
+                f'permissions {entry["Permissions"]} '
+                f'and permissions with grant options {entry.get("PermissionsWithGrantOption")} '
+                f'to {str(entry["Resource"])} '
+                f'response error: {error}'
+            )
+
+    @staticmethod
+    def _is_already_revoked(code, message) -> bool:
+        return code == 'InvalidInputException' and any(m in (message or '') for m in ALREADY_REVOKED_MESSAGES)
+
+    def _submit_batches(self, operation, entries: List[dict]) -> List[Tuple[dict, dict]]:
+        """
+        Submits the entries in chunks of BATCH_SIZE and returns the (entry, error) of the failed entries.
+        Only the entries failing with ConcurrentModificationException are resubmitted, with an exponential backoff
+        """
+        failed = []
+        for i in range(0, len(entries), BATCH_SIZE):
+            pending = {str(i + j): entry for j, entry in enumerate(entries[i : i + BATCH_SIZE])}
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    response = operation(Entries=[{'Id': id, **entry} for id, entry in pending.items()])
+                    failures = response.get('Failures', [])
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConcurrentModificationException':
+                        raise e
+                    # the whole batch is rejected, all its entries are retried
+                    failures = [
+                        {'RequestEntry': {'Id': id}, 'Error': {'ErrorCode': 'ConcurrentModificationException'}}
+                        for id in pending
+                    ]
+
+                retry = {}
+                for failure in failures:
+                    id = failure['RequestEntry']['Id']
+                    error = failure.get('Error', {})
+                    if error.get('ErrorCode') == 'ConcurrentModificationException' and attempt < MAX_ATTEMPTS - 1:
+                        retry[id] = pending[id]
+                    else:
+                        failed.append((pending[id], error))
+                if not retry:
+                    break
+                delay = min(0.5 * 2**attempt, 10) + random.uniform(0, 0.5)
+                log.warning(
+                    f'Concurrent modification of {len(retry)} Lake Formation permissions, retrying in {delay:.1f}s'
+                )
+                time.sleep(delay)
+                pending = retry
+        return failed
 
     def revoke_permissions_to_database(
         self,
@@ -242,6 +359,7 @@ class LakeFormationClient:
     def revoke_permissions_to_table_with_filters(
         self, principals, database_name, table_name, catalog_id, permissions, data_filters
     ) -> True:
+        entries = []
         for f_name in data_filters:
             data_filter_resource = {
                 'DataCellsFilter': {
@@ -251,66 +369,25 @@ class LakeFormationClient:
                     'Name': f_name,
                 },
             }
-            self._revoke_permissions_from_resource(
-                principals=principals,
-                resource=data_filter_resource,
-                permissions=permissions,
-            )
+            entries.extend(self._batch_entry(principal, data_filter_resource, permissions) for principal in principals)
+        self._batch_revoke(entries)
         return True
 
     def _revoke_permissions_from_resource(
         self, principals, resource, permissions, permissions_with_grant_options=None
     ) -> True:
-        for principal in principals:
-            try:
-                log.info(
-                    f'Revoking principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)}... '
-                )
-                revoke_dict = dict(
-                    Principal={'DataLakePrincipalIdentifier': principal},
-                    Resource=resource,
-                    Permissions=permissions,
-                )
-                if permissions_with_grant_options:
-                    revoke_dict['PermissionsWithGrantOption'] = permissions_with_grant_options
-
-                response = self._client.revoke_permissions(**revoke_dict)
-                log.info(
-                    f'Successfully revoked principal {principal} '
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)} '
-                    f'response: {response}'
-                )
-                time.sleep(2)
-            except ClientError as error:
-                response = error.response
-                if not (
-                    response['Error']['Code'] == 'InvalidInputException'
-                    and (
-                        'Grantee has no permissions' in response['Error']['Message']
-                        or 'No permissions revoked' in response['Error']['Message']
-                        or 'not found' in response['Error']['Message']
-                    )
-                ):
-                    log.error(
-                        f'Failed revoking principal {principal} '
-                        f'permissions {permissions} '
-                        f'and permissions with grant options {permissions_with_grant_options} '
-                        f'to {str(resource)} '
-                        f'due to: {error}'
-                    )
-                    raise error
-                log.warning(
-                    f'Principal {principal} already has revoked'
-                    f'permissions {permissions} '
-                    f'and permissions with grant options {permissions_with_grant_options} '
-                    f'to {str(resource)} '
-                    f'response error: {error}'
-                )
+        log.info(
+            f'Revoking principals {principals} '
+            f'permissions {permissions} '
+            f'and permissions with grant options {permissions_with_grant_options} '
+            f'to {str(resource)}... '
+        )
+        self._batch_revoke(
+            [
+                self._batch_entry(principal, resource, permissions, permissions_with_grant_options)
+                for principal in principals
+            ]
+        )
         return True
 
     def check_permissions_to_database(
@@ -221,7 +221,7 @@ class S3ShareService:
                 region = shared_environment.region
 
         pivot_session = SessionHelper.remote_session(account_id, region)
-        aws_session = SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn)
+        aws_session = SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn, cached=False)
         url = SessionHelper.get_console_access_url(
             aws_session,
             region=dataset.region,
@@ -418,7 +418,9 @@ class LFShareManager:
                 catalog_id=self.source_account_id,
                 permissions=perms_to_lfperms(self.share.permissions, LfPermType.Table),
             )
-            time.sleep(2)
+            if self.cross_account:
+                # give Lake Formation time to create the RAM share that is accepted next
+                time.sleep(2)
         return True
 
     def check_if_exists_and_create_resource_link_table_in_shared_database(
@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import List
 from warnings import warn
 from datetime import datetime
@@ -69,6 +70,7 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
         False if share fails
         """
         log.info('##### Starting Sharing tables #######')
+        started = time.perf_counter()
         success = True
         if not self.tables:
             log.info('No tables to share. Skipping...')
@@ -197,6 +199,10 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                         )
                     success = False
                     manager.handle_share_failure(table=table, error=e)
+            log.info(
+                f'Shared {len(self.tables)} tables of share {self.share_data.share.shareUri} '
+                f'in {time.perf_counter() - started:.1f}s (success = {success})'
+            )
         return success
 
     def process_revoked_shares(self) -> bool:
@@ -222,6 +228,7 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
         False if revoke fails
         """
         log.info('##### Starting Revoking tables #######')
+        started = time.perf_counter()
         success = True
         manager = self._initialize_share_manager(self.tables)
         if not self.tables:
@@ -351,6 +358,10 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                     f'due to: {e}'
                 )
                 success = False
+            log.info(
+                f'Revoked {len(self.tables)} tables of share {self.share_data.share.shareUri} '
+                f'in {time.perf_counter() - started:.1f}s (success = {success})'
+            )
             return success
 
     def verify_shares(self) -> bool:
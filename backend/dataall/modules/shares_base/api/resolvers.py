@@ -2,9 +2,11 @@ import logging
 import re
 
 from dataall.base.api.context import Context
-from dataall.base.db.exceptions import RequiredParameter
+from dataall.base.api.loader import BatchLoader
+from dataall.base.context import get_context
+from dataall.base.db.exceptions import ObjectNotFound, RequiredParameter
 from dataall.core.environment.db.environment_models import Environment
-from dataall.core.environment.services.environment_service import EnvironmentService
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
 from dataall.modules.shares_base.services.shares_enums import ShareObjectPermission, PrincipalType
@@ -180,36 +182,91 @@ def get_share_logs(context, source, shareUri: str):
     return ShareLogsService.get_share_logs(shareUri)
 
 
+def _load_datasets(dataset_uris):
+    with get_context().db_engine.scoped_session() as session:
+        return {ds.datasetUri: ds for ds in DatasetBaseRepository.get_datasets_by_uris(session, dataset_uris)}
+
+
+def _load_environments(environment_uris):
+    with get_context().db_engine.scoped_session() as session:
+        return {
+            env.environmentUri: env for env in EnvironmentRepository.get_environments_by_uris(session, environment_uris)
+        }
+
+
+def _load_consumption_roles(role_uris):
+    with get_context().db_engine.scoped_session() as session:
+        return {
+            role.consumptionRoleUri: role
+            for role in EnvironmentRepository.get_consumption_roles_by_uris(session, role_uris)
+        }
+
+
+def _load_environment_groups(group_environment_uris):
+    with get_context().db_engine.scoped_session() as session:
+        return {
+            (group.groupUri, group.environmentUri): group
+            for group in EnvironmentRepository.get_environment_groups(session, group_environment_uris)
+        }
+
+
+# the fields of the shares of a page are loaded with one query per loader for the whole page
+share_dataset_loader = BatchLoader('share_dataset', key=lambda share: share.datasetUri, batch_load=_load_datasets)
+share_dataset_environment_loader = BatchLoader(
+    'share_dataset_environment',
+    key=lambda share: getattr(share_dataset_loader.load(share), 'environmentUri', None),
+    batch_load=_load_environments,
+)
+share_environment_loader = BatchLoader(
+    'share_environment', key=lambda share: share.environmentUri, batch_load=_load_environments
+)
+share_consumption_role_loader = BatchLoader(
+    'share_consumption_role',
+    key=lambda share: share.principalId if share.principalType == PrincipalType.ConsumptionRole.value else None,
+    batch_load=_load_consumption_roles,
+)
+share_environment_group_loader = BatchLoader(
+    'share_environment_group',
+    key=lambda share: (
+        (share.groupUri, share.environmentUri) if share.principalType == PrincipalType.Group.value else None
+    ),
+    batch_load=_load_environment_groups,
+)
+share_statistics_loader = BatchLoader(
+    'share_statistics',
+    key=lambda share: share.shareUri,
+    batch_load=ShareObjectService.batch_resolve_share_object_statistics,
+)
+
+
 def resolve_user_role(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        dataset: DatasetBase = DatasetBaseRepository.get_dataset_by_uri(session, source.datasetUri)
-
-        can_approve = (
-            True
-            if (
-                dataset
-                and (
-                    dataset.stewards in context.groups
-                    or dataset.SamlAdminGroupName in context.groups
-                    or dataset.owner == context.username
-                )
+    dataset: DatasetBase = share_dataset_loader.load(source)
+    can_approve = (
+        True
+        if (
+            dataset
+            and (
+                dataset.stewards in context.groups
+                or dataset.SamlAdminGroupName in context.groups
+                or dataset.owner == context.username
             )
-            else False
         )
+        else False
+    )
 
-        can_request = True if (source.owner == context.username or source.groupUri in context.groups) else False
+    can_request = True if (source.owner == context.username or source.groupUri in context.groups) else False
 
-        return (
-            ShareObjectPermission.ApproversAndRequesters.value
-            if can_approve and can_request
-            else ShareObjectPermission.Approvers.value
-            if can_approve
-            else ShareObjectPermission.Requesters.value
-            if can_request
-            else ShareObjectPermission.NoPermission.value
-        )
+    return (
+        ShareObjectPermission.ApproversAndRequesters.value
+        if can_approve and can_request
+        else ShareObjectPermission.Approvers.value
+        if can_approve
+        else ShareObjectPermission.Requesters.value
+        if can_request
+        else ShareObjectPermission.NoPermission.value
+    )
 
 
 def resolve_can_view_logs(context: Context, source: ShareObject):
@@ -223,51 +280,53 @@ def resolve_can_view_logs(context: Context, source: ShareObject):
 def resolve_dataset(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        ds: DatasetBase = DatasetBaseRepository.get_dataset_by_uri(session, source.datasetUri)
-        if ds:
-            env: Environment = EnvironmentService.get_environment_by_uri(session, ds.environmentUri)
-            return {
-                'datasetUri': source.datasetUri,
-                'datasetName': ds.name if ds else 'NotFound',
-                'SamlAdminGroupName': ds.SamlAdminGroupName if ds else 'NotFound',
-                'environmentName': env.label if env else 'NotFound',
-                'AwsAccountId': env.AwsAccountId if env else 'NotFound',
-                'region': env.region if env else 'NotFound',
-                'exists': True if ds else False,
-                'description': ds.description,
-                'datasetType': ds.datasetType,
-                'enableExpiration': ds.enableExpiration,
-                'expirySetting': ds.expirySetting,
-            }
+    ds: DatasetBase = share_dataset_loader.load(source)
+    if ds:
+        env: Environment = share_dataset_environment_loader.load(source)
+        return {
+            'datasetUri': source.datasetUri,
+            'datasetName': ds.name if ds else 'NotFound',
+            'SamlAdminGroupName': ds.SamlAdminGroupName if ds else 'NotFound',
+            'environmentName': env.label if env else 'NotFound',
+            'AwsAccountId': env.AwsAccountId if env else 'NotFound',
+            'region': env.region if env else 'NotFound',
+            'exists': True if ds else False,
+            'description': ds.description,
+            'datasetType': ds.datasetType,
+            'enableExpiration': ds.enableExpiration,
+            'expirySetting': ds.expirySetting,
+        }
 
 
 def resolve_principal(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
 
-    with context.engine.scoped_session() as session:
-        if source.principalType in set(item.value for item in PrincipalType):
-            environment = EnvironmentService.get_environment_by_uri(session, source.environmentUri)
-            if source.principalType == PrincipalType.ConsumptionRole.value:
-                principal = EnvironmentService.get_environment_consumption_role(
-                    session, source.principalId, source.environmentUri
-                )
-                principalName = f'{principal.consumptionRoleName} [{principal.IAMRoleArn}]'
-            elif source.principalType == PrincipalType.Group.value:
-                principal = EnvironmentService.get_environment_group(session, source.groupUri, source.environmentUri)
-                principalName = f'{source.groupUri} [{principal.environmentIAMRoleArn}]'
-            else:
-                principalName = f'Redshift Role [{source.principalRoleName}]'
-
-            return {
-                'principalName': principalName,
-                'principalId': source.principalId,
-                'principalType': source.principalType,
-                'principalRoleName': source.principalRoleName,
-                'SamlGroupName': source.groupUri,
-                'environmentName': environment.label,
-            }
+    if source.principalType in set(item.value for item in PrincipalType):
+        environment = share_environment_loader.load(source)
+        if not environment:
+            raise ObjectNotFound('Environment', source.environmentUri)
+        if source.principalType == PrincipalType.ConsumptionRole.value:
+            principal = share_consumption_role_loader.load(source)
+            if not principal or principal.environmentUri != source.environmentUri:
+                raise ObjectNotFound('ConsumptionRoleUri', f'({source.principalId},{source.environmentUri})')
+            principalName = f'{principal.consumptionRoleName} [{principal.IAMRoleArn}]'
+        elif source.principalType == PrincipalType.Group.value:
+            principal = share_environment_group_loader.load(source)
+            if not principal:
+                raise ObjectNotFound('EnvironmentGroup', f'({source.groupUri},{source.environmentUri})')
+            principalName = f'{source.groupUri} [{principal.environmentIAMRoleArn}]'
+        else:
+            principalName = f'Redshift Role [{source.principalRoleName}]'
+
+        return {
+            'principalName': principalName,
+            'principalId': source.principalId,
+            'principalType': source.principalType,
+            'principalRoleName': source.principalRoleName,
+            'SamlGroupName': source.groupUri,
+            'environmentName': environment.label,
+        }
 
 
 def resolve_group(context: Context, source: ShareObject, **kwargs):
@@ -279,13 +338,13 @@ def resolve_group(context: Context, source: ShareObject, **kwargs):
 def resolve_share_object_statistics(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
-    return ShareObjectService.resolve_share_object_statistics(uri=source.shareUri)
+    return share_statistics_loader.load(source)
 
 
 def resolve_existing_shared_items(context: Context, source: ShareObject, **kwargs):
     if not source:
         return None
-    return ShareItemService.check_existing_shared_items(source)
+    return share_statistics_loader.load(source)['sharedItems'] > 0
 
 
 def list_shareable_objects(context: Context, source: ShareObject, filter: dict = None):
@@ -218,6 +218,24 @@ class ShareObjectRepository:
     def list_all_active_share_objects(session) -> [ShareObject]:
         return session.query(ShareObject).filter(ShareObject.deleted.is_(None)).all()
 
+    @staticmethod
+    def list_all_active_share_objects_with_accounts(session):
+        """Active share objects with the account of their dataset and the account and region of their environment"""
+        return (
+            session.query(
+                ShareObject.shareUri,
+                ShareObject.principalId,
+                ShareObject.datasetUri,
+                DatasetBase.AwsAccountId.label('sourceAwsAccountId'),
+                Environment.AwsAccountId.label('targetAwsAccountId'),
+                Environment.region.label('region'),
+            )
+            .outerjoin(DatasetBase, DatasetBase.datasetUri == ShareObject.datasetUri)
+            .outerjoin(Environment, Environment.environmentUri == ShareObject.environmentUri)
+            .filter(ShareObject.deleted.is_(None))
+            .all()
+        )
+
     @staticmethod
     def list_user_received_share_requests(session, username, groups, data=None):
         query = (
@@ -1,6 +1,8 @@
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from dataall.modules.shares_base.db.share_object_models import ShareObjectItem, ShareObject
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
@@ -12,7 +14,26 @@ from dataall.modules.shares_base.services.shares_enums import (
 logger = logging.getLogger(__name__)
 
 
+_deferred_commits = threading.local()
+
+
 class ShareStatusRepository:
+    @staticmethod
+    @contextmanager
+    def batch_health_status_updates(session):
+        """
+        The health statuses updated by update_share_item_health_status in the block are committed at once
+        at its end, in a single UPDATE per column set instead of a commit per share item
+        """
+        previous = getattr(_deferred_commits, 'active', False)
+        _deferred_commits.active = True
+        try:
+            yield
+        finally:
+            _deferred_commits.active = previous
+        if not previous:
+            session.commit()
+
     @staticmethod
     def get_share_item_shared_states():
         return [
@@ -128,7 +149,8 @@ class ShareStatusRepository:
         share_item.healthStatus = healthStatus
         share_item.healthMessage = healthMessage
         share_item.lastVerificationTime = timestamp
-        session.commit()
+        if not getattr(_deferred_commits, 'active', False):
+            session.commit()
         return share_item
 
     @staticmethod
@@ -172,6 +194,20 @@ class ShareStatusRepository:
             .count()
         )
 
+    @staticmethod
+    def count_items_by_status(session, share_uris) -> dict:
+        """Number of items of every share per status, e.g. {shareUri: {status: count}}"""
+        rows = (
+            session.query(ShareObjectItem.shareUri, ShareObjectItem.status, func.count(ShareObjectItem.shareItemUri))
+            .filter(ShareObjectItem.shareUri.in_(share_uris))
+            .group_by(ShareObjectItem.shareUri, ShareObjectItem.status)
+            .all()
+        )
+        counts = {}
+        for share_uri, status, count in rows:
+            counts.setdefault(share_uri, {})[status] = count
+        return counts
+
     @staticmethod
     def check_pending_share_items(session, uri):
         share: ShareObject = ShareObjectRepository.get_share_by_uri(session, uri)
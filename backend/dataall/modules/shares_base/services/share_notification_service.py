@@ -9,7 +9,10 @@ from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.base.context import get_context
 from dataall.modules.shares_base.services.shares_enums import ShareObjectStatus
 from dataall.modules.notifications.db.notification_repositories import NotificationRepository
-from dataall.modules.notifications.services.ses_email_notification_service import SESEmailNotificationService
+from dataall.modules.notifications.services.ses_email_notification_service import (
+    EmailNotificationBatch,
+    SESEmailNotificationService,
+)
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
 
 log = logging.getLogger(__name__)
@@ -39,10 +42,11 @@ class ShareNotificationService:
         - share.owner (person that opened the request) OR share.groupUri (if group_notifications=true)
     """
 
-    def __init__(self, session, dataset: DatasetBase, share: ShareObject):
+    def __init__(self, session, dataset: DatasetBase, share: ShareObject, email_batch: EmailNotificationBatch = None):
         self.dataset = dataset
         self.share = share
         self.session = session
+        self.email_batch = email_batch
         self.notification_target_users = self._get_share_object_targeted_users()
 
     def notify_share_object_submission(self, email_id: str):
@@ -338,6 +342,7 @@ class ShareNotificationService:
         Method to directly send email notification instead of creating an SQS Task
         This approach is used while sending email notifications in an ECS task ( e.g. persistent email reminder task, share expiration task, etc )
         Emails send to groups mentioned in recipient_groups_list and / or emails mentioned in recipient_email_ids
+        If the service has an email_batch, the email is added to the batch and sent with the others by the task
         """
         if recipient_groups_list is None:
             recipient_groups_list = []
@@ -352,9 +357,12 @@ class ShareNotificationService:
                 n_config = share_notification_config[share_notification_config_type]
                 if n_config.get('active', False) == True:
                     if share_notification_config_type == 'email':
-                        SESEmailNotificationService.send_email_task(
-                            subject, msg, recipient_groups_list, recipient_email_ids
-                        )
+                        if self.email_batch is not None:
+                            self.email_batch.add(subject, msg, recipient_groups_list, recipient_email_ids)
+                        else:
+                            SESEmailNotificationService.send_email_task(
+                                subject, msg, recipient_groups_list, recipient_email_ids
+                            )
                 else:
                     log.info(f'Notification type : {share_notification_config_type} is not active')
         else:
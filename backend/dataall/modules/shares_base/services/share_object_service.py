@@ -681,24 +681,27 @@ class ShareObjectService:
 
     @staticmethod
     def resolve_share_object_statistics(uri):
+        return ShareObjectService.batch_resolve_share_object_statistics([uri])[uri]
+
+    @staticmethod
+    def batch_resolve_share_object_statistics(uris) -> dict:
+        """Statistics of the items of many shares, computed from a single count of their items per status"""
         with get_context().db_engine.scoped_session() as session:
-            shared_items = ShareStatusRepository.count_items_in_states(
-                session, uri, ShareStatusRepository.get_share_item_shared_states()
-            )
-            revoked_items = ShareStatusRepository.count_items_in_states(
-                session, uri, [ShareItemStatus.Revoke_Succeeded.value]
-            )
-            failed_states = [ShareItemStatus.Share_Failed.value, ShareItemStatus.Revoke_Failed.value]
-            failed_items = ShareStatusRepository.count_items_in_states(session, uri, failed_states)
-            pending_items = ShareStatusRepository.count_items_in_states(
-                session, uri, [ShareItemStatus.PendingApproval.value]
-            )
-            return {
-                'sharedItems': shared_items,
-                'revokedItems': revoked_items,
-                'failedItems': failed_items,
-                'pendingItems': pending_items,
+            counts = ShareStatusRepository.count_items_by_status(session, uris)
+
+        def count_items_in_states(uri, states):
+            return sum(counts.get(uri, {}).get(state, 0) for state in states)
+
+        failed_states = [ShareItemStatus.Share_Failed.value, ShareItemStatus.Revoke_Failed.value]
+        return {
+            uri: {
+                'sharedItems': count_items_in_states(uri, ShareStatusRepository.get_share_item_shared_states()),
+                'revokedItems': count_items_in_states(uri, [ShareItemStatus.Revoke_Succeeded.value]),
+                'failedItems': count_items_in_states(uri, failed_states),
+                'pendingItems': count_items_in_states(uri, [ShareItemStatus.PendingApproval.value]),
             }
+            for uri in uris
+        }
 
     @staticmethod
     def list_shares_in_my_inbox(filter: dict):
@@ -256,23 +256,24 @@ class SharingService:
         """
         with engine.scoped_session() as session:
             share_data, share_items = cls._get_share_data_and_items(session, share_uri, status, healthStatus)
-            for type, processor in ShareProcessorManager.SHARING_PROCESSORS.items():
-                try:
-                    log.info(f'Verifying permissions with {type.value}')
-                    shareable_items = ShareObjectRepository.get_share_data_items_by_type(
-                        session,
-                        share_data.share,
-                        processor.shareable_type,
-                        processor.shareable_uri,
-                        status=status,
-                        healthStatus=healthStatus,
-                    )
-                    if shareable_items:
-                        processor.Processor(session, share_data, shareable_items).verify_shares()
-                    else:
-                        log.info(f'There are no items to verify of type {type.value}')
-                except Exception as e:
-                    log.error(f'Error occurred during share verifying of {type.value}: {e}')
+            with ShareStatusRepository.batch_health_status_updates(session):
+                for type, processor in ShareProcessorManager.SHARING_PROCESSORS.items():
+                    try:
+                        log.info(f'Verifying permissions with {type.value}')
+                        shareable_items = ShareObjectRepository.get_share_data_items_by_type(
+                            session,
+                            share_data.share,
+                            processor.shareable_type,
+                            processor.shareable_uri,
+                            status=status,
+                            healthStatus=healthStatus,
+                        )
+                        if shareable_items:
+                            processor.Processor(session, share_data, shareable_items).verify_shares()
+                        else:
+                            log.info(f'There are no items to verify of type {type.value}')
+                    except Exception as e:
+                        log.error(f'Error occurred during share verifying of {type.value}: {e}')
 
         return True
 
@@ -7,6 +7,7 @@ from dataall.base.db import get_engine
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.services.share_notification_service import ShareNotificationService
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
+from dataall.modules.notifications.services.ses_email_notification_service import EmailNotificationBatch
 
 
 log = logging.getLogger(__name__)
@@ -16,7 +17,9 @@ def persistent_email_reminders(engine):
     """
     A method used by the scheduled ECS Task to run persistent_email_reminder() process against ALL
     active share objects within data.all and send emails to all pending shares.
+    The emails of all the shares are sent together at the end of the task.
     """
+    email_batch = EmailNotificationBatch()
     with engine.scoped_session() as session:
         log.info('Running Persistent Email Reminders Task')
         pending_shares = ShareObjectRepository.fetch_submitted_shares_with_notifications(session=session)
@@ -26,10 +29,12 @@ def persistent_email_reminders(engine):
             log.info(f'Sending Email Reminder for Share: {pending_share.shareUri}')
             share = ShareObjectRepository.get_share_by_uri(session, pending_share.shareUri)
             dataset = DatasetBaseRepository.get_dataset_by_uri(session, share.datasetUri)
-            ShareNotificationService(session=session, dataset=dataset, share=share).notify_persistent_email_reminder(
-                email_id=share.owner
-            )
-            log.info(f'Email reminder sent for share {share.shareUri}')
+            ShareNotificationService(
+                session=session, dataset=dataset, share=share, email_batch=email_batch
+            ).notify_persistent_email_reminder(email_id=share.owner)
+        log.info(f'Sending {len(email_batch)} email reminders')
+        results = email_batch.send()
+        log.info(f'Email reminders sent to {sum(len(result["messageIds"]) for result in results)} recipients')
         log.info('Completed Persistent Email Reminders Task')
 
 
@@ -9,6 +9,7 @@ from dataall.modules.shares_base.db.share_object_state_machines import ShareObje
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
 from dataall.modules.shares_base.services.share_notification_service import ShareNotificationService
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
+from dataall.modules.notifications.services.ses_email_notification_service import EmailNotificationBatch
 from dataall.modules.shares_base.services.shares_enums import ShareObjectActions
 from dataall.modules.shares_base.services.sharing_service import SharingService
 
@@ -18,7 +19,9 @@ log = logging.getLogger(__name__)
 def share_expiration_checker(engine):
     """
     Checks all the share objects which have expiryDate on them and then revokes or notifies users based on if its expired or not
+    The notification emails of all the shares are sent together at the end of the task.
     """
+    email_batch = EmailNotificationBatch()
     with engine.scoped_session() as session:
         log.info('Starting share expiration task')
         shares = ShareObjectRepository.get_all_active_shares_with_expiration(session)
@@ -56,19 +59,22 @@ def share_expiration_checker(engine):
                             f'Sending notifications to the owners: {dataset.SamlAdminGroupName}, {dataset.stewards} as share extension requested for share with uri: {share.shareUri}'
                         )
                         ShareNotificationService(
-                            session=session, dataset=dataset, share=share
+                            session=session, dataset=dataset, share=share, email_batch=email_batch
                         ).notify_share_expiration_to_owners()
                     else:
                         log.info(
                             f'Sending notifications to the requesters with group: {share.groupUri} as share extension is not requested for share with uri: {share.shareUri}'
                         )
                         ShareNotificationService(
-                            session=session, dataset=dataset, share=share
+                            session=session, dataset=dataset, share=share, email_batch=email_batch
                         ).notify_share_expiration_to_requesters()
             except Exception as e:
                 log.error(
                     f'Error occured while processing share expiration processing for share with URI: {share.shareUri} due to: {e}'
                 )
+        log.info(f'Sending {len(email_batch)} share expiration emails')
+        results = email_batch.send()
+        log.info(f'Share expiration emails sent to {sum(len(result["messageIds"]) for result in results)} recipients')
 
 
 if __name__ == '__main__':
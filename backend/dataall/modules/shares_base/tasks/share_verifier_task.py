@@ -1,8 +1,11 @@
 import logging
 import os
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
-from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.modules.shares_base.services.shares_enums import ShareItemStatus
 from dataall.modules.shares_base.services.sharing_service import SharingService
 from dataall.core.stacks.aws.ecs import Ecs
@@ -13,26 +16,85 @@ from dataall.base.loader import load_modules, ImportMode
 
 log = logging.getLogger(__name__)
 
+# number of (source account, target account, region) groups verified at the same time
+MAX_WORKERS = int(os.getenv('SHARE_VERIFIER_MAX_WORKERS', '8'))
+# number of the slowest shares listed in the report of the run
+SLOWEST_SHARES_REPORTED = 10
+
 
 def verify_shares(engine):
     """
     A method used by the scheduled ECS Task to run verify_shares() process against ALL shared items in ALL
     active share objects within data.all and update the health status of those shared items.
+    The shares are grouped by (source account, target account, region): the shares of a group are verified one after
+    the other and reuse the cached sessions and clients of the accounts, the groups are verified in parallel.
     """
+    started = time.perf_counter()
     with engine.scoped_session() as session:
-        processed_share_objects = []
-        all_share_objects: [ShareObject] = ShareObjectRepository.list_all_active_share_objects(session)
-        log.info(f'Found {len(all_share_objects)} share objects  verify ')
-        share_object: ShareObject
-        for share_object in all_share_objects:
-            log.info(
-                f'Verifying Share Items for Share Object with Requestor: {share_object.principalId} on Target Dataset: {share_object.datasetUri}'
-            )
-            processed_share_objects.append(share_object.shareUri)
+        all_share_objects = ShareObjectRepository.list_all_active_share_objects_with_accounts(session)
+    log.info(f'Found {len(all_share_objects)} share objects  verify ')
+
+    groups = defaultdict(list)
+    for share_object in all_share_objects:
+        groups[(share_object.sourceAwsAccountId, share_object.targetAwsAccountId, share_object.region)].append(
+            share_object
+        )
+
+    processed_share_objects = []
+    durations = []
+    if len(groups) <= 1 or MAX_WORKERS <= 1:
+        for key, share_objects in groups.items():
+            _collect(_verify_group(engine, key, share_objects), processed_share_objects, durations)
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='share-verifier') as executor:
+            futures = [
+                executor.submit(_verify_group, engine, key, share_objects) for key, share_objects in groups.items()
+            ]
+            for future in as_completed(futures):
+                _collect(future.result(), processed_share_objects, durations)
+
+    _log_report(durations, len(groups), time.perf_counter() - started)
+    return processed_share_objects
+
+
+def _verify_group(engine, key, share_objects):
+    source_account_id, target_account_id, region = key
+    started = time.perf_counter()
+    durations = []
+    for share_object in share_objects:
+        log.info(
+            f'Verifying Share Items for Share Object with Requestor: {share_object.principalId} on Target Dataset: {share_object.datasetUri}'
+        )
+        share_started = time.perf_counter()
+        try:
             SharingService.verify_share(
                 engine, share_uri=share_object.shareUri, status=ShareItemStatus.Share_Succeeded.value, healthStatus=None
             )
-        return processed_share_objects
+        except Exception as e:
+            log.error(f'Failed to verify share {share_object.shareUri} due to: {e}')
+        durations.append((share_object.shareUri, time.perf_counter() - share_started))
+
+    log.info(
+        f'Verified {len(share_objects)} shares from account {source_account_id} to account {target_account_id} '
+        f'in {region} in {time.perf_counter() - started:.1f}s'
+    )
+    return durations
+
+
+def _collect(group_durations, processed_share_objects, durations):
+    processed_share_objects.extend(share_uri for share_uri, _ in group_durations)
+    durations.extend(group_durations)
+
+
+def _log_report(durations, groups_count, elapsed):
+    throughput = len(durations) / elapsed if elapsed else 0
+    log.info(
+        f'Verified {len(durations)} shares in {groups_count} account groups in {elapsed:.1f}s '
+        f'({throughput:.2f} shares/s, {MAX_WORKERS} workers)'
+    )
+    slowest = sorted(durations, key=lambda duration: duration[1], reverse=True)[:SLOWEST_SHARES_REPORTED]
+    if slowest:
+        log.info('Slowest shares: ' + ', '.join(f'{share_uri} ({duration:.1f}s)' for share_uri, duration in slowest))
 
 
 def trigger_reapply_task():
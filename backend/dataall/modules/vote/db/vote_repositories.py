@@ -1,8 +1,11 @@
 import logging
 from datetime import datetime
 
+from sqlalchemy import func
+
 from dataall.modules.vote.db import vote_models as models
 from dataall.base.context import get_context
+from dataall.base.db.utils import changed_since
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,25 @@ class VoteRepository:
             .count()
         )
 
+    @staticmethod
+    def count_upvotes_by_target(session, target_type, target_uris=None) -> dict:
+        """Number of upvotes of every target of the type, targets without upvotes are missing from the result"""
+        query = session.query(models.Vote.targetUri, func.count(models.Vote.voteUri)).filter(
+            models.Vote.targetType == target_type,
+            models.Vote.upvote == True,
+        )
+        if target_uris is not None:
+            query = query.filter(models.Vote.targetUri.in_(target_uris))
+        return dict(query.group_by(models.Vote.targetUri).all())
+
+    @staticmethod
+    def list_targets_voted_since(session, target_type, since) -> set:
+        query = session.query(models.Vote.targetUri).filter(
+            models.Vote.targetType == target_type,
+            changed_since(models.Vote, since),
+        )
+        return {target_uri for (target_uri,) in query.distinct()}
+
     @staticmethod
     def delete_votes(session, target_uri, target_type) -> [models.Vote]:
         return (
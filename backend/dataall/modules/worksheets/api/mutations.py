@@ -1,5 +1,10 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import create_worksheet, delete_worksheet, update_worksheet
+from dataall.modules.worksheets.api.resolvers import (
+    create_worksheet,
+    delete_worksheet,
+    start_sql_query,
+    update_worksheet,
+)
 
 
 createWorksheet = gql.MutationField(
@@ -27,3 +32,16 @@ deleteWorksheet = gql.MutationField(
     ],
     type=gql.Boolean,
 )
+
+# starts the query without waiting for it, its results are polled with getAthenaQueryResults
+startAthenaSqlQuery = gql.MutationField(
+    name='startAthenaSqlQuery',
+    resolver=start_sql_query,
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='resultReuseMinutes', type=gql.Integer),
+    ],
+    type=gql.Ref('AthenaQueryResult'),
+)
@@ -1,5 +1,10 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import get_worksheet, list_worksheets, run_sql_query
+from dataall.modules.worksheets.api.resolvers import (
+    get_athena_query_results,
+    get_worksheet,
+    list_worksheets,
+    run_sql_query,
+)
 
 
 getWorksheet = gql.QueryField(
@@ -25,6 +30,22 @@ runAthenaSqlQuery = gql.QueryField(
         gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='maxRows', type=gql.Integer),
+        gql.Argument(name='resultReuseMinutes', type=gql.Integer),
     ],
     resolver=run_sql_query,
 )
+
+
+getAthenaQueryResults = gql.QueryField(
+    name='getAthenaQueryResults',
+    type=gql.Ref('AthenaQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='nextToken', type=gql.String),
+        gql.Argument(name='maxRows', type=gql.Integer),
+    ],
+    resolver=get_athena_query_results,
+)
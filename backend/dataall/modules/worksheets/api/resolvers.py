@@ -1,5 +1,6 @@
 from dataall.base.db import exceptions
 from dataall.modules.worksheets.api.enums import WorksheetRole
+from dataall.modules.worksheets.aws.athena_client import AthenaClient
 from dataall.modules.worksheets.db.worksheet_models import Worksheet
 from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
 from dataall.modules.worksheets.services.worksheet_service import WorksheetService
@@ -39,8 +40,69 @@ def list_worksheets(context, source, filter: dict = None):
     return WorksheetService.list_user_worksheets(filter)
 
 
-def run_sql_query(context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None):
-    return WorksheetService.run_sql_query(uri=environmentUri, worksheetUri=worksheetUri, sqlQuery=sqlQuery)
+def run_sql_query(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    sqlQuery: str = None,
+    maxRows: int = None,
+    resultReuseMinutes: int = None,
+):
+    return WorksheetService.run_sql_query(
+        uri=environmentUri,
+        worksheetUri=worksheetUri,
+        sqlQuery=sqlQuery,
+        maxRows=maxRows,
+        resultReuseMinutes=resultReuseMinutes,
+    )
+
+
+def start_sql_query(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    sqlQuery: str = None,
+    resultReuseMinutes: int = None,
+):
+    if not sqlQuery:
+        raise exceptions.RequiredParameter('sqlQuery')
+    return WorksheetService.start_sql_query(
+        uri=environmentUri,
+        worksheetUri=worksheetUri,
+        sqlQuery=sqlQuery,
+        resultReuseMinutes=resultReuseMinutes,
+    )
+
+
+def get_athena_query_results(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    athenaQueryId: str = None,
+    nextToken: str = None,
+    maxRows: int = None,
+):
+    if not athenaQueryId:
+        raise exceptions.RequiredParameter('athenaQueryId')
+    return WorksheetService.get_query_results(
+        uri=environmentUri,
+        worksheetUri=worksheetUri,
+        athenaQueryId=athenaQueryId,
+        nextToken=nextToken,
+        maxRows=maxRows,
+    )
+
+
+def resolve_athena_result_rows(context: Context, source: dict, **kwargs):
+    if not source:
+        return None
+    if 'records' not in source:
+        # results saved before the columnar format
+        return source.get('rows')
+    return AthenaClient.to_cells(source)
 
 
 def delete_worksheet(context, source, worksheetUri: str = None):
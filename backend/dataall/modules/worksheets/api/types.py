@@ -1,5 +1,5 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import resolve_user_role
+from dataall.modules.worksheets.api.resolvers import resolve_athena_result_rows, resolve_user_role
 
 AthenaResultColumnDescriptor = gql.ObjectType(
     name='AthenaResultColumnDescriptor',
@@ -37,7 +37,15 @@ AthenaQueryResult = gql.ObjectType(
         gql.Field(name='DataScannedInBytes', type=gql.Integer),
         gql.Field(name='Status', type=gql.String),
         gql.Field(name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))),
-        gql.Field(name='rows', type=gql.ArrayType(gql.Ref('AthenaResultRecord'))),
+        # values of the rows in the order of the columns
+        gql.Field(name='records', type=gql.ArrayType(gql.ArrayType(gql.String))),
+        # continues the results with getAthenaQueryResults, null when all the rows were returned
+        gql.Field(name='nextToken', type=gql.String),
+        gql.Field(
+            name='rows',
+            type=gql.ArrayType(gql.Ref('AthenaResultRecord')),
+            resolver=resolve_athena_result_rows,
+        ),
     ],
 )
 
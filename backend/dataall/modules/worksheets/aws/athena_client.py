@@ -1,48 +1,146 @@
-from pyathena import connect
+import logging
+import os
+import time
+
 from dataall.base.aws.sts import SessionHelper
 
+log = logging.getLogger(__name__)
+
+# maximum number of rows returned at once, the following rows are fetched with the next token of the result
+MAX_ROWS = int(os.getenv('ATHENA_QUERY_MAX_ROWS', '1000'))
+# maximum number of rows of a GetQueryResults page
+PAGE_SIZE = 1000
+# maximum age of the results that Athena reuses for an identical query of the workgroup
+MAX_RESULT_REUSE_MINUTES = 10080
+
+_PENDING_STATES = {'QUEUED', 'RUNNING'}
+_FAILED_STATES = {'FAILED', 'CANCELLED'}
+
 
 class AthenaClient:
-    """Makes requests to AWS Athena"""
+    """Makes requests to AWS Athena with the IAM role of the environment group"""
 
-    @staticmethod
-    def run_athena_query(aws_account_id, env_group, s3_staging_dir, region, sql=None):
+    def __init__(self, aws_account_id, env_group, region):
         base_session = SessionHelper.remote_session(accountid=aws_account_id, region=region)
-        boto3_session = SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
-        creds = boto3_session.get_credentials()
-        connection = connect(
-            aws_access_key_id=creds.access_key,
-            aws_secret_access_key=creds.secret_key,
-            aws_session_token=creds.token,
-            work_group=env_group.environmentAthenaWorkGroup,
-            s3_staging_dir=s3_staging_dir,
-            region_name=region,
+        session = SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+        self._client = session.client('athena', region_name=region)
+        self._work_group = env_group.environmentAthenaWorkGroup
+
+    def start_query(self, sql, s3_staging_dir, reuse_minutes=0) -> str:
+        """
+        Starts the query in the workgroup of the environment group and returns its id without waiting for it.
+        If reuse_minutes is set, Athena returns the results of an identical query that are not older than that
+        """
+        kwargs = dict(
+            QueryString=sql,
+            WorkGroup=self._work_group,
+            ResultConfiguration={'OutputLocation': s3_staging_dir},
         )
-        cursor = connection.cursor()
-        cursor.execute(sql)
+        if reuse_minutes:
+            kwargs['ResultReuseConfiguration'] = {
+                'ResultReuseByAgeConfiguration': {
+                    'Enabled': True,
+                    'MaxAgeInMinutes': min(reuse_minutes, MAX_RESULT_REUSE_MINUTES),
+                }
+            }
+        return self._client.start_query_execution(**kwargs)['QueryExecutionId']
+
+    def run_query(self, sql, s3_staging_dir, reuse_minutes=0) -> str:
+        """Runs the query in the workgroup of the environment group, waits until it finishes and returns its id"""
+        query_id = self.start_query(sql, s3_staging_dir, reuse_minutes)
+        self.wait_for_query(query_id)
+        return query_id
+
+    def wait_for_query(self, query_id, max_interval=2.0) -> dict:
+        interval = 0.1
+        while True:
+            execution = self._client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+            state = execution['Status']['State']
+            if state not in _PENDING_STATES:
+                break
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+        if state != 'SUCCEEDED':
+            reason = execution['Status'].get('StateChangeReason', state)
+            raise Exception(f'Athena query {query_id} {state.lower()}: {reason}')
+        return execution
 
-        return cursor
+    def get_query_status(self, query_id) -> dict:
+        """Returns the state and the statistics of the query without its results"""
+        execution = self._client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+        return self._to_result(query_id, execution)
+
+    def get_query_results(self, query_id, next_token=None, max_rows=MAX_ROWS) -> dict:
+        """
+        Returns up to max_rows rows of the results of the query in a columnar format:
+        the columns once, and every row as a list of values in the order of the columns.
+        The next token of the result continues the results where they stopped.
+        While the query runs, or if it failed, only the state of the query is returned
+        """
+        max_rows = max(1, min(max_rows or MAX_ROWS, MAX_ROWS))
+        execution = self._client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+        result = self._to_result(query_id, execution)
+        if result['Status'] != 'SUCCEEDED':
+            return result
+
+        # the first row of the results of a SELECT statement is the header
+        skip_header = not next_token and execution.get('StatementType') == 'DML'
+
+        columns = None
+        records = []
+        while True:
+            # the pages end where the rows end, so that the next token of the last page continues after them
+            kwargs = dict(QueryExecutionId=query_id, MaxResults=min(PAGE_SIZE, max_rows - len(records) + skip_header))
+            if next_token:
+                kwargs['NextToken'] = next_token
+            page = self._client.get_query_results(**kwargs)
+
+            if columns is None:
+                columns = [
+                    {'columnName': column['Name'], 'typeName': column['Type']}
+                    for column in page['ResultSet']['ResultSetMetadata']['ColumnInfo']
+                ]
+            rows = page['ResultSet']['Rows']
+            if skip_header:
+                rows = rows[1:]
+                skip_header = False
+            records.extend([cell.get('VarCharValue') for cell in row['Data']] for row in rows)
+
+            next_token = page.get('NextToken')
+            if not next_token or len(records) >= max_rows:
+                break
+
+        result.update(columns=columns, records=records, nextToken=next_token)
+        return result
 
     @staticmethod
-    def convert_query_output(cursor):
-        columns = []
-        for f in cursor.description:
-            columns.append({'columnName': f[0], 'typeName': 'String'})
-
-        rows = []
-        for row in cursor:
-            record = {'cells': []}
-            for col_position, column in enumerate(columns):
-                cell = {}
-                cell['columnName'] = column['columnName']
-                cell['typeName'] = column['typeName']
-                cell['value'] = str(row[col_position])
-                record['cells'].append(cell)
-            rows.append(record)
+    def _to_result(query_id, execution) -> dict:
+        status = execution['Status']
+        state = status['State']
+        statistics = execution.get('Statistics', {})
         return {
-            'error': None,
-            'AthenaQueryId': cursor.query_id,
-            'ElapsedTime': cursor.total_execution_time_in_millis,
-            'rows': rows,
-            'columns': columns,
+            'Error': status.get('StateChangeReason', state) if state in _FAILED_STATES else None,
+            'AthenaQueryId': query_id,
+            'Status': state,
+            'ElapsedTimeInMs': statistics.get('TotalExecutionTimeInMillis'),
+            'DataScannedInBytes': statistics.get('DataScannedInBytes'),
+            'OutputLocation': execution.get('ResultConfiguration', {}).get('OutputLocation'),
+            'columns': None,
+            'records': None,
+            'nextToken': None,
         }
+
+    @staticmethod
+    def to_cells(result: dict) -> list:
+        """Rows of a columnar result in the former cell per value format"""
+        columns = result.get('columns') or []
+        return [
+            {
+                'cells': [
+                    {'columnName': column['columnName'], 'typeName': column['typeName'], 'value': value}
+                    for column, value in zip(columns, record)
+                ]
+            }
+            for record in result.get('records') or []
+        ]
@@ -19,14 +19,16 @@ class WorksheetRepository(EnvironmentResource):
 
     _DEFAULT_PAGE = 1
     _DEFAULT_PAGE_SIZE = 10
+    REUSABLE_STATES = ('QUEUED', 'RUNNING', 'SUCCEEDED')
 
     @staticmethod
-    def count_resources(session, environment, group_uri) -> int:
-        return (
-            session.query(WorksheetQueryResult)
-            .filter(WorksheetQueryResult.AwsAccountId == environment.AwsAccountId)
-            .count()
-        )
+    def delete_env(session, environment):
+        # the query executions only cache the results of the queries of the environment
+        session.query(WorksheetQueryResult).filter(
+            WorksheetQueryResult.OutputLocation.startswith(
+                f's3://{environment.EnvironmentDefaultBucketName}/', autoescape=True
+            )
+        ).delete(synchronize_session=False)
 
     @staticmethod
     def find_worksheet_by_uri(session, uri) -> Worksheet:
@@ -59,3 +61,20 @@ class WorksheetRepository(EnvironmentResource):
             page=data.get('page', WorksheetRepository._DEFAULT_PAGE),
             page_size=data.get('pageSize', WorksheetRepository._DEFAULT_PAGE_SIZE),
         ).to_dict()
+
+    @staticmethod
+    def find_query_result(session, query_id) -> WorksheetQueryResult:
+        return session.query(WorksheetQueryResult).get(query_id)
+
+    @staticmethod
+    def list_query_results_since(session, output_location, since) -> [WorksheetQueryResult]:
+        """Executions of the queries of the workgroup (output location) started after since, the latest first"""
+        return (
+            session.query(WorksheetQueryResult)
+            .filter(
+                WorksheetQueryResult.OutputLocation.startswith(output_location, autoescape=True),
+                WorksheetQueryResult.created >= since,
+            )
+            .order_by(WorksheetQueryResult.created.desc())
+            .all()
+        )
@@ -1,4 +1,7 @@
 import logging
+import os
+import re
+from datetime import datetime, timedelta
 
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.services.environment_service import EnvironmentService
@@ -7,7 +10,7 @@ from dataall.base.context import get_context
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.modules.worksheets.aws.athena_client import AthenaClient
-from dataall.modules.worksheets.db.worksheet_models import Worksheet
+from dataall.modules.worksheets.db.worksheet_models import QueryType, Worksheet, WorksheetQueryResult
 from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
 from dataall.modules.worksheets.services.worksheet_permissions import (
     MANAGE_WORKSHEETS,
@@ -21,6 +24,34 @@ from dataall.modules.worksheets.services.worksheet_permissions import (
 
 logger = logging.getLogger(__name__)
 
+# the results of an identical query of the workgroup are reused during this number of minutes when the caller does
+# not set resultReuseMinutes, 0 disables the reuse
+QUERY_RESULT_REUSE_MINUTES = int(os.getenv('ATHENA_QUERY_RESULT_REUSE_MINUTES', '0'))
+
+# string literals and quoted identifiers are kept as they are, the other whitespaces are collapsed
+_SQL_TOKENS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+
+# comments and opening parentheses before the first keyword of the statement
+_SQL_PREFIX = re.compile(r'(?:\s+|--[^\n]*|/\*.*?\*/|\()*', re.DOTALL)
+_READ_ONLY_STATEMENT = re.compile(r'(?:select|with)\b', re.IGNORECASE)
+
+
+def is_read_only_sql(sql: str) -> bool:
+    """Only the results of the queries that do not write (SELECT, WITH ... SELECT) are reused"""
+    return bool(_READ_ONLY_STATEMENT.match(sql, _SQL_PREFIX.match(sql).end()))
+
+
+def normalize_sql(sql: str) -> str:
+    """Query text used to recognize identical queries, regardless of their formatting"""
+
+    def _collapse(match):
+        if match.group(1):
+            return match.group(1)
+        # a line break ends the -- comments, so it is not collapsed into a space
+        return '\n' if '\n' in match.group(0) else ' '
+
+    return _SQL_TOKENS.sub(_collapse, sql).strip().rstrip(';').strip()
+
 
 class WorksheetService:
     @staticmethod
@@ -133,21 +164,130 @@ class WorksheetService:
     @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
     @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
     @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
-    def run_sql_query(uri, worksheetUri, sqlQuery):
+    def run_sql_query(uri, worksheetUri, sqlQuery, maxRows=None, resultReuseMinutes=None):
         with get_context().db_engine.scoped_session() as session:
-            environment = EnvironmentService.get_environment_by_uri(session, uri)
-            worksheet = WorksheetService._get_worksheet_by_uri(session, worksheetUri)
+            environment, env_group, worksheet = WorksheetService._get_environment_and_group(session, uri, worksheetUri)
+            client = AthenaClient(
+                aws_account_id=environment.AwsAccountId, env_group=env_group, region=environment.region
+            )
+            query_id = WorksheetService._start_query(
+                session, client, environment, env_group, worksheet, sqlQuery, resultReuseMinutes
+            )
+            try:
+                client.wait_for_query(query_id)
+            except Exception as e:
+                WorksheetService._save_query_result(
+                    session, {'AthenaQueryId': query_id, 'Status': 'FAILED', 'Error': str(e)}
+                )
+                session.commit()
+                raise
+            result = client.get_query_results(query_id, max_rows=maxRows)
+            WorksheetService._save_query_result(session, result)
+            return result
 
-            env_group = EnvironmentService.get_environment_group(
-                session, worksheet.SamlAdminGroupName, environment.environmentUri
+    @staticmethod
+    @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
+    def start_sql_query(uri, worksheetUri, sqlQuery, resultReuseMinutes=None):
+        """Starts the query without waiting for it, its results are polled with get_query_results"""
+        with get_context().db_engine.scoped_session() as session:
+            environment, env_group, worksheet = WorksheetService._get_environment_and_group(session, uri, worksheetUri)
+            client = AthenaClient(
+                aws_account_id=environment.AwsAccountId, env_group=env_group, region=environment.region
+            )
+            query_id = WorksheetService._start_query(
+                session, client, environment, env_group, worksheet, sqlQuery, resultReuseMinutes
+            )
+            result = client.get_query_status(query_id)
+            WorksheetService._save_query_result(session, result)
+            return result
+
+    @staticmethod
+    @TenantPolicyService.has_tenant_permission(MANAGE_WORKSHEETS)
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    @ResourcePolicyService.has_resource_permission(GET_WORKSHEET, param_name='worksheetUri')
+    def get_query_results(uri, worksheetUri, athenaQueryId, nextToken=None, maxRows=None):
+        with get_context().db_engine.scoped_session() as session:
+            environment, env_group, _ = WorksheetService._get_environment_and_group(session, uri, worksheetUri)
+            client = AthenaClient(
+                aws_account_id=environment.AwsAccountId, env_group=env_group, region=environment.region
             )
+            result = client.get_query_results(athenaQueryId, next_token=nextToken, max_rows=maxRows)
+            WorksheetService._save_query_result(session, result)
+            return result
+
+    @staticmethod
+    def _get_environment_and_group(session, uri, worksheetUri):
+        environment = EnvironmentService.get_environment_by_uri(session, uri)
+        worksheet = WorksheetService._get_worksheet_by_uri(session, worksheetUri)
+        # the queries run with the role of the worksheet group, which can only read the results of its workgroup
+        env_group = EnvironmentService.get_environment_group(
+            session, worksheet.SamlAdminGroupName, environment.environmentUri
+        )
+        return environment, env_group, worksheet
 
-            cursor = AthenaClient.run_athena_query(
-                aws_account_id=environment.AwsAccountId,
-                env_group=env_group,
-                s3_staging_dir=f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/',
-                region=environment.region,
-                sql=sqlQuery,
+    @staticmethod
+    def _start_query(session, client, environment, env_group, worksheet, sql, reuse_minutes=None) -> str:
+        """
+        Returns the id of an execution of the same query in the workgroup of the environment group that started
+        less than reuse_minutes ago, and starts the query if there is none.
+        Only read-only queries are reused, and not after a statement that might have written in the workgroup.
+        """
+        if reuse_minutes is None:
+            reuse_minutes = QUERY_RESULT_REUSE_MINUTES
+        reuse_minutes = max(reuse_minutes, 0)
+        if not is_read_only_sql(sql):
+            reuse_minutes = 0
+        s3_staging_dir = (
+            f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/'
+        )
+        normalized_sql = normalize_sql(sql)
+
+        query_result = None
+        if reuse_minutes:
+            for recent_result in WorksheetRepository.list_query_results_since(
+                session, output_location=s3_staging_dir, since=datetime.now() - timedelta(minutes=reuse_minutes)
+            ):
+                if not is_read_only_sql(recent_result.sqlBody):
+                    # the results of the queries before the write might be stale, Athena must not reuse them either
+                    reuse_minutes = 0
+                    break
+                if (
+                    recent_result.sqlBody == normalized_sql
+                    and recent_result.status in WorksheetRepository.REUSABLE_STATES
+                ):
+                    query_result = recent_result
+                    break
+        if query_result:
+            logger.info(f'Reusing the execution {query_result.AthenaQueryId} of the query')
+            query_id = query_result.AthenaQueryId
+        else:
+            query_id = client.start_query(sql=sql, s3_staging_dir=s3_staging_dir, reuse_minutes=reuse_minutes)
+            session.add(
+                WorksheetQueryResult(
+                    worksheetUri=worksheet.worksheetUri,
+                    AthenaQueryId=query_id,
+                    status='QUEUED',
+                    queryType=QueryType.data,
+                    sqlBody=normalized_sql,
+                    AwsAccountId=environment.AwsAccountId,
+                    region=environment.region,
+                    OutputLocation=s3_staging_dir,
+                )
             )
+        worksheet.lastSavedAthenaQueryIdForQuery = query_id
+        session.flush()
+        return query_id
 
-            return AthenaClient.convert_query_output(cursor)
+    @staticmethod
+    def _save_query_result(session, result: dict):
+        query_result = WorksheetRepository.find_query_result(session, result['AthenaQueryId'])
+        if not query_result:
+            return
+        query_result.status = result['Status']
+        query_result.error = result.get('Error')
+        if result.get('ElapsedTimeInMs') is not None:
+            query_result.ElapsedTimeInMs = result['ElapsedTimeInMs']
+        if result.get('OutputLocation'):
+            query_result.OutputLocation = result['OutputLocation']
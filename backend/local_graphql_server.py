@@ -12,7 +12,7 @@ from starlette.responses import JSONResponse, HTMLResponse
 from dataall.base.api import get_executable_schema
 from dataall.base.config import config
 from dataall.base.context import set_context, dispose_context, RequestContext
-from dataall.base.db import get_engine, Base
+from dataall.base.db import get_engine, Base, PoolConfig
 from dataall.base.loader import load_modules, ImportMode
 from dataall.base.searchproxy import connect, run_query
 from dataall.core.permissions.services.tenant_permissions import TENANT_ALL
@@ -26,7 +26,7 @@ logger.setLevel(logging.INFO)
 Worker.queue = Worker.process
 ENVNAME = os.getenv('envname', 'local')
 logger.warning(f'Connecting to database `{ENVNAME}`')
-engine = get_engine(envname=ENVNAME)
+engine = get_engine(envname=ENVNAME, pool_config=PoolConfig.wide())
 es = connect(envname=ENVNAME)
 logger.info('Connected')
 # create_schema_and_tables(engine, envname=ENVNAME)
@@ -47,10 +47,11 @@ target_metadata = Base.metadata
 
 
 exclude_tables = config.get_section('alembic:exclude').get('tables', '').split(',')
+exclude_indexes = config.get_section('alembic:exclude').get('indexes', '').split(',')
 
 
 def include_object(object, name, type_, *args, **kwargs):
-    return not (type_ == 'table' and name in exclude_tables)
+    return not ((type_ == 'table' and name in exclude_tables) or (type_ == 'index' and name in exclude_indexes))
 
 
 def run_migrations_offline():
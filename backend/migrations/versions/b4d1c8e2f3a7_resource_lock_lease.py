@@ -0,0 +1,31 @@
+"""resource_lock_lease
+
+Revision ID: b4d1c8e2f3a7
+Revises: af2e1362d4cb
+Create Date: 2026-10-18 10:12:31.418207
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b4d1c8e2f3a7'
+down_revision = 'af2e1362d4cb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('resource_lock', sa.Column('acquiredAt', sa.DateTime(), nullable=True))
+    op.add_column('resource_lock', sa.Column('expiresAt', sa.DateTime(), nullable=True))
+    # the locks held during the upgrade get a lease of the default duration
+    op.execute(
+        'UPDATE resource_lock SET "acquiredAt" = now(), "expiresAt" = now() + interval \'2 hours\' '
+        'WHERE "expiresAt" IS NULL'
+    )
+
+
+def downgrade():
+    op.drop_column('resource_lock', 'expiresAt')
+    op.drop_column('resource_lock', 'acquiredAt')
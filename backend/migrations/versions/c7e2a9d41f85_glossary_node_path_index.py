@@ -0,0 +1,60 @@
+"""glossary_node_path_index
+
+Revision ID: c7e2a9d41f85
+Revises: b4d1c8e2f3a7
+Create Date: 2026-10-18 16:40:12.731904
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2a9d41f85'
+down_revision = 'b4d1c8e2f3a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('glossary_node', sa.Column('depth', sa.Integer(), nullable=True))
+    op.execute("UPDATE glossary_node SET depth = length(path) - length(replace(path, '/', ''))")
+    # subtree queries are prefix LIKE on path, text_pattern_ops makes them index range scans whatever the collation
+    op.create_index(
+        'ix_glossary_node_path',
+        'glossary_node',
+        ['path', 'depth'],
+        postgresql_ops={'path': 'text_pattern_ops'},
+    )
+    op.create_index('ix_glossary_node_parentUri', 'glossary_node', ['parentUri'])
+    # the searches of the glossaries are ilike '%term%' on label and readme, served by trigram indexes.
+    # pg_trgm is not available on every PostgreSQL, without it the searches scan the table
+    bind = op.get_bind()
+    has_pg_trgm = bind.execute(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).scalar()
+    if not has_pg_trgm:
+        print('pg_trgm is not available, the trigram indexes of glossary_node are not created')
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_glossary_node_label_trgm',
+        'glossary_node',
+        ['label'],
+        postgresql_using='gin',
+        postgresql_ops={'label': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_glossary_node_readme_trgm',
+        'glossary_node',
+        ['readme'],
+        postgresql_using='gin',
+        postgresql_ops={'readme': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    # the trigram indexes are missing if pg_trgm was not available
+    op.execute('DROP INDEX IF EXISTS ix_glossary_node_readme_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_glossary_node_label_trgm')
+    op.drop_index('ix_glossary_node_parentUri', table_name='glossary_node')
+    op.drop_index('ix_glossary_node_path', table_name='glossary_node')
+    op.drop_column('glossary_node', 'depth')
@@ -245,6 +245,26 @@ class ContainerStack(pyNestedClass):
 
         self.ecs_task_definitions_families.append(catalog_indexer_task.task_definition.family)
 
+        incremental_catalog_indexer_task, _ = self.set_scheduled_task(
+            cluster=self.ecs_cluster,
+            command=['python3.9', '-m', 'dataall.modules.catalog.tasks.catalog_indexer_task'],
+            container_id=container_id,
+            ecr_repository=self._ecr_repository,
+            environment={**self._create_env(), 'indexing_mode': 'incremental'},
+            image_tag=self._cdkproxy_image_tag,
+            log_group=self.create_log_group(
+                self._envname, self._resource_prefix, log_group_name='catalog-indexer-incremental'
+            ),
+            schedule_expression=Schedule.expression('rate(15 minutes)'),
+            scheduled_task_id=f'{self._resource_prefix}-{self._envname}-catalog-indexer-incremental-schedule',
+            task_id=f'{self._resource_prefix}-{self._envname}-catalog-indexer-incremental',
+            task_role=self.task_role,
+            vpc=self._vpc,
+            security_group=self.scheduled_tasks_sg,
+            prod_sizing=self._prod_sizing,
+        )
+        self.ecs_task_definitions_families.append(incremental_catalog_indexer_task.task_definition.family)
+
     @run_if(['modules.s3_datasets.active'])
     def add_share_management_task(self):
         share_management_task_definition = ecs.FargateTaskDefinition(
@@ -661,6 +681,12 @@ class ContainerStack(pyNestedClass):
                     ],
                     resources=['*'],
                 ),
+                iam.PolicyStatement(
+                    actions=[
+                        'ecs:DescribeTasks',
+                    ],
+                    resources=[f'arn:aws:ecs:{self.region}:{self.account}:task/*{resource_prefix}*/*'],
+                ),
                 iam.PolicyStatement(
                     actions=[
                         's3:GetObject',
@@ -701,7 +727,7 @@ class ContainerStack(pyNestedClass):
         if email_custom_domain and ses_configuration_set:
             role_inline_policy.document.add_statements(
                 iam.PolicyStatement(
-                    actions=['ses:SendEmail'],
+                    actions=['ses:SendEmail', 'ses:SendBulkEmail'],
                     resources=[
                         f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
                         f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
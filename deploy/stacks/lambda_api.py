@@ -223,7 +223,7 @@ class LambdaApiStack(pyNestedClass):
         if email_custom_domain is not None:
             self.aws_handler.add_to_role_policy(
                 iam.PolicyStatement(
-                    actions=['ses:SendEmail'],
+                    actions=['ses:SendEmail', 'ses:SendBulkEmail'],
                     resources=[
                         f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
                         f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
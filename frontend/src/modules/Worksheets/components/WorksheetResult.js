@@ -1,3 +1,4 @@
+import { LoadingButton } from '@mui/lab';
 import {
   Box,
   Card,
@@ -17,7 +18,12 @@ import { FaBars } from 'react-icons/fa';
 import * as ReactIf from 'react-if';
 import { Scrollbar } from 'design';
 
-export const WorksheetResult = ({ results, loading }) => {
+export const WorksheetResult = ({
+  results,
+  loading,
+  loadingMore,
+  onLoadMore
+}) => {
   if (loading) {
     return <CircularProgress />;
   }
@@ -51,6 +57,16 @@ export const WorksheetResult = ({ results, loading }) => {
                 </TableHead>
                 <TableBody>
                   {results &&
+                    results.records &&
+                    results.records.map((record) => (
+                      <TableRow>
+                        {record.map((value) => (
+                          <TableCell>{value}</TableCell>
+                        ))}
+                      </TableRow>
+                    ))}
+                  {results &&
+                    !results.records &&
                     results.rows &&
                     results.rows.map((row) => (
                       <TableRow>
@@ -63,6 +79,13 @@ export const WorksheetResult = ({ results, loading }) => {
               </Table>
             </Box>
           </Scrollbar>
+          {results && results.nextToken && onLoadMore && (
+            <Box sx={{ p: 2 }}>
+              <LoadingButton loading={loadingMore} onClick={onLoadMore}>
+                Load more rows
+              </LoadingButton>
+            </Box>
+          )}
         </Card>
       </ReactIf.Then>
     </ReactIf.If>
@@ -70,5 +93,7 @@ export const WorksheetResult = ({ results, loading }) => {
 };
 WorksheetResult.propTypes = {
   results: PropTypes.object.isRequired,
-  loading: PropTypes.bool.isRequired
+  loading: PropTypes.bool.isRequired,
+  loadingMore: PropTypes.bool,
+  onLoadMore: PropTypes.func
 };
@@ -0,0 +1,40 @@
+import { gql } from 'apollo-boost';
+
+export const getAthenaQueryResults = ({
+  environmentUri,
+  worksheetUri,
+  athenaQueryId,
+  nextToken
+}) => ({
+  variables: {
+    environmentUri,
+    worksheetUri,
+    athenaQueryId,
+    nextToken
+  },
+  query: gql`
+    query getAthenaQueryResults(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $athenaQueryId: String!
+      $nextToken: String
+    ) {
+      getAthenaQueryResults(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        athenaQueryId: $athenaQueryId
+        nextToken: $nextToken
+      ) {
+        AthenaQueryId
+        Status
+        Error
+        columns {
+          columnName
+          typeName
+        }
+        records
+        nextToken
+      }
+    }
+  `
+});
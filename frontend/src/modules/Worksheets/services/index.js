@@ -1,8 +1,10 @@
 export * from './createWorksheet';
 export * from './deleteWorksheet';
+export * from './getAthenaQueryResults';
 export * from './getWorksheet';
 export * from './listS3DatasetsSharedWithEnvGroup';
 export * from './listWorksheets';
 export * from './runAthenaSqlQuery';
+export * from './startAthenaSqlQuery';
 export * from './updateWorksheet';
 export * from './listSharedDatasetTableColumns';
@@ -3,35 +3,35 @@ import { gql } from 'apollo-boost';
 export const runAthenaSqlQuery = ({
   sqlQuery,
   environmentUri,
-  worksheetUri
+  worksheetUri,
+  resultReuseMinutes
 }) => ({
   variables: {
     sqlQuery,
     environmentUri,
-    worksheetUri
+    worksheetUri,
+    resultReuseMinutes
   },
   query: gql`
     query runAthenaSqlQuery(
       $environmentUri: String!
       $worksheetUri: String!
       $sqlQuery: String!
+      $resultReuseMinutes: Int
     ) {
       runAthenaSqlQuery(
         environmentUri: $environmentUri
         worksheetUri: $worksheetUri
         sqlQuery: $sqlQuery
+        resultReuseMinutes: $resultReuseMinutes
       ) {
-        rows {
-          cells {
-            columnName
-            typeName
-            value
-          }
-        }
+        AthenaQueryId
         columns {
           columnName
           typeName
         }
+        records
+        nextToken
       }
     }
   `
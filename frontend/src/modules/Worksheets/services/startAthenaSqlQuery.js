@@ -0,0 +1,34 @@
+import { gql } from 'apollo-boost';
+
+export const startAthenaSqlQuery = ({
+  sqlQuery,
+  environmentUri,
+  worksheetUri,
+  resultReuseMinutes
+}) => ({
+  variables: {
+    sqlQuery,
+    environmentUri,
+    worksheetUri,
+    resultReuseMinutes
+  },
+  mutation: gql`
+    mutation startAthenaSqlQuery(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $sqlQuery: String!
+      $resultReuseMinutes: Int
+    ) {
+      startAthenaSqlQuery(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        sqlQuery: $sqlQuery
+        resultReuseMinutes: $resultReuseMinutes
+      ) {
+        AthenaQueryId
+        Status
+        Error
+      }
+    }
+  `
+});
@@ -41,7 +41,8 @@ import {
   getWorksheet,
   listS3DatasetsSharedWithEnvGroup,
   listSharedDatasetTableColumns,
-  runAthenaSqlQuery,
+  getAthenaQueryResults,
+  startAthenaSqlQuery,
   updateWorksheet
 } from '../services';
 import {
@@ -50,6 +51,8 @@ import {
   WorksheetResult
 } from '../components';
 
+const PENDING_QUERY_STATES = ['QUEUED', 'RUNNING'];
+
 const WorksheetView = () => {
   const navigate = useNavigate();
   const params = useParams();
@@ -59,6 +62,7 @@ const WorksheetView = () => {
   const [environmentOptions, setEnvironmentOptions] = useState([]);
   const [worksheet, setWorksheet] = useState({ worksheetUri: '' });
   const [results, setResults] = useState({ rows: [], fields: [] });
+  const [loadingMoreResults, setLoadingMoreResults] = useState(false);
   const [loading, setLoading] = useState(true);
   const [sqlBody, setSqlBody] = useState(
     " select 'A' as dim, 23 as nb\n union \n select 'B' as dim, 43 as nb "
@@ -282,21 +286,73 @@ const WorksheetView = () => {
   const runQuery = useCallback(async () => {
     try {
       setRunningQuery(true);
-      const response = await client.query(
-        runAthenaSqlQuery({
+      const response = await client.mutate(
+        startAthenaSqlQuery({
           sqlQuery: sqlBody,
           environmentUri: currentEnv.environmentUri,
-          worksheetUri: worksheet.worksheetUri
+          worksheetUri: worksheet.worksheetUri,
+          // a query run by the user always runs again
+          resultReuseMinutes: 0
+        })
+      );
+      if (response.errors) {
+        dispatch({ type: SET_ERROR, error: response.errors[0].message });
+        return;
+      }
+      // the query runs asynchronously, its results are polled until it finishes
+      let athenaResults = response.data.startAthenaSqlQuery;
+      let interval = 250;
+      while (PENDING_QUERY_STATES.includes(athenaResults.Status)) {
+        await new Promise((resolve) => setTimeout(resolve, interval));
+        interval = Math.min(interval * 2, 2000);
+        const poll = await client.query(
+          getAthenaQueryResults({
+            environmentUri: currentEnv.environmentUri,
+            worksheetUri: worksheet.worksheetUri,
+            athenaQueryId: athenaResults.AthenaQueryId
+          })
+        );
+        if (poll.errors) {
+          dispatch({ type: SET_ERROR, error: poll.errors[0].message });
+          return;
+        }
+        athenaResults = poll.data.getAthenaQueryResults;
+      }
+      if (athenaResults.Error) {
+        dispatch({ type: SET_ERROR, error: athenaResults.Error });
+        return;
+      }
+      setResults({
+        ...athenaResults,
+        columns: athenaResults.columns.map((c, index) => ({
+          ...c,
+          id: index
+        }))
+      });
+    } catch (e) {
+      dispatch({ type: SET_ERROR, error: e.message });
+    } finally {
+      setRunningQuery(false);
+    }
+  }, [client, dispatch, currentEnv, worksheet, sqlBody]);
+
+  const loadMoreResults = useCallback(async () => {
+    try {
+      setLoadingMoreResults(true);
+      const response = await client.query(
+        getAthenaQueryResults({
+          environmentUri: currentEnv.environmentUri,
+          worksheetUri: worksheet.worksheetUri,
+          athenaQueryId: results.AthenaQueryId,
+          nextToken: results.nextToken
         })
       );
       if (!response.errors) {
-        const athenaResults = response.data.runAthenaSqlQuery;
+        const page = response.data.getAthenaQueryResults;
         setResults({
-          rows: athenaResults.rows.map((c, index) => ({ ...c, id: index })),
-          columns: athenaResults.columns.map((c, index) => ({
-            ...c,
-            id: index
-          }))
+          ...results,
+          records: results.records.concat(page.records),
+          nextToken: page.nextToken
         });
       } else {
         dispatch({ type: SET_ERROR, error: response.errors[0].message });
@@ -304,9 +360,9 @@ const WorksheetView = () => {
     } catch (e) {
       dispatch({ type: SET_ERROR, error: e.message });
     } finally {
-      setRunningQuery(false);
+      setLoadingMoreResults(false);
     }
-  }, [client, dispatch, currentEnv, sqlBody]);
+  }, [client, dispatch, currentEnv, worksheet, results]);
 
   const deleteWorksheetfunction = useCallback(async () => {
     const response = await client.mutate(
@@ -640,7 +696,12 @@ const WorksheetView = () => {
           </Box>
           <Divider />
           <Box sx={{ p: 2 }}>
-            <WorksheetResult results={results} loading={runningQuery} />
+            <WorksheetResult
+              results={results}
+              loading={runningQuery}
+              loadingMore={loadingMoreResults}
+              onLoadMore={loadMoreResults}
+            />
           </Box>
         </Box>
       </Box>
@@ -0,0 +1,63 @@
+import pytest
+
+from dataall.base.api.loader import BatchLoader, register_siblings
+from dataall.base.context import RequestContext, dispose_context, set_context
+
+
+class Node:
+    def __init__(self, uri, parent_uri):
+        self.uri = uri
+        self.parentUri = parent_uri
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def parent_loader(calls):
+    def batch_load(keys):
+        calls.append(sorted(keys))
+        return {key: f'parent-{key}' for key in keys if key != 'missing'}
+
+    return BatchLoader('test_parent', key=lambda node: node.parentUri, batch_load=batch_load)
+
+
+@pytest.fixture
+def request_context():
+    set_context(RequestContext(db_engine=None, username='alice', groups=[], user_id='alice'))
+    yield
+    dispose_context()
+
+
+def test_loader_batches_the_keys_of_the_siblings(request_context, parent_loader, calls):
+    nodes = [Node('n1', 'p1'), Node('n2', 'p2'), Node('n3', 'p1'), Node('n4', None)]
+    register_siblings({'count': 4, 'nodes': nodes})
+
+    assert [parent_loader.load(node) for node in nodes] == ['parent-p1', 'parent-p2', 'parent-p1', None]
+    assert calls == [['p1', 'p2']]
+
+
+def test_loader_caches_missing_values(request_context, parent_loader, calls):
+    nodes = [Node('n1', 'missing'), Node('n2', 'missing')]
+    register_siblings(nodes)
+
+    assert parent_loader.load(nodes[0]) is None
+    assert parent_loader.load(nodes[1]) is None
+    assert calls == [['missing']]
+
+
+def test_loader_without_siblings(request_context, parent_loader, calls):
+    assert parent_loader.load(Node('n1', 'p1')) == 'parent-p1'
+    assert parent_loader.load(Node('n2', 'p2')) == 'parent-p2'
+    assert calls == [['p1'], ['p2']]
+
+
+def test_loader_outside_request_scope(parent_loader, calls):
+    nodes = [Node('n1', 'p1'), Node('n2', 'p2')]
+    register_siblings(nodes)
+
+    assert parent_loader.load(nodes[0]) == 'parent-p1'
+    assert parent_loader.load(nodes[0]) == 'parent-p1'
+    assert calls == [['p1'], ['p1']]
@@ -0,0 +1,74 @@
+import pytest
+from ariadne import QueryType, graphql_sync, make_executable_schema
+
+from dataall.base.api.query_cache import (
+    PERSISTED_QUERY_NOT_FOUND,
+    QueryDocumentCache,
+    execute_query,
+    query_hash,
+)
+
+QUERY = 'query hello($name: String) { hello(name: $name) }'
+
+
+@pytest.fixture
+def schema():
+    query = QueryType()
+    query.set_field('hello', lambda obj, info, name=None: f'hello {name}')
+    return make_executable_schema('type Query { hello(name: String): String }', query)
+
+
+@pytest.fixture
+def documents(schema):
+    return QueryDocumentCache(schema, max_size=2)
+
+
+def test_documents_are_parsed_once(schema, documents):
+    data = {'query': QUERY, 'variables': {'name': 'alice'}}
+
+    assert execute_query(schema, data, documents) == graphql_sync(schema, data)
+    assert execute_query(schema, {'query': QUERY, 'variables': {'name': 'bob'}}, documents) == (
+        True,
+        {'data': {'hello': 'hello bob'}},
+    )
+    assert documents.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'size': 1}
+
+
+def test_invalid_documents_are_not_cached(schema, documents):
+    data = {'query': '{ unknown }'}
+
+    success, response = execute_query(schema, data, documents)
+
+    assert not success
+    assert response == graphql_sync(schema, data)[1]
+    assert documents.find_document(data) is None
+    assert documents.stats()['size'] == 0
+
+
+def test_least_recently_used_documents_are_evicted(documents):
+    queries = ['{ hello }', '{ a: hello }', '{ b: hello }']
+    for query in queries:
+        documents.get_document({'query': query})
+
+    documents.get_document({'query': queries[2]})
+    documents.get_document({'query': queries[0]})
+
+    assert documents.stats() == {'hits': 1, 'misses': 4, 'hit_rate': 0.2, 'size': 2}
+
+
+def test_persisted_queries(schema, documents):
+    persisted = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash(QUERY)}}
+
+    success, response = execute_query(schema, {'extensions': persisted}, documents)
+    assert not success
+    assert response['errors'][0]['message'] == PERSISTED_QUERY_NOT_FOUND
+
+    # the client sends the query with its hash when the hash is not found
+    assert execute_query(schema, {'query': QUERY, 'extensions': persisted}, documents)[0]
+    assert execute_query(schema, {'extensions': persisted, 'variables': {'name': 'alice'}}, documents) == (
+        True,
+        {'data': {'hello': 'hello alice'}},
+    )
+
+    wrong_hash = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash('{ hello }')}}
+    assert not execute_query(schema, {'query': QUERY, 'extensions': wrong_hash}, documents)[0]
@@ -0,0 +1,30 @@
+from graphql import print_schema
+
+from dataall.base.api import bootstrap, get_executable_schema, schema_cache
+
+
+def test_executable_schema_is_loaded_from_the_cache(tmp_path, mocker):
+    schema = bootstrap()
+    cache_path = str(tmp_path / 'graphql_schema.pickle')
+    schema_cache.write_schema_cache(schema.gql(with_directives=False), cache_path)
+    assert (tmp_path / 'graphql_schema.graphql').read_text() == schema.gql(with_directives=False)
+    expected = get_executable_schema(schema)
+
+    build = mocker.spy(schema_cache, 'build_graphql_schema')
+    executable_schema = get_executable_schema(schema, cache_path=cache_path)
+
+    build.assert_not_called()
+    assert print_schema(executable_schema) == print_schema(expected)
+    query = executable_schema.query_type.fields['getWorksheet']
+    assert query.resolve is not None
+
+
+def test_stale_cache_is_ignored(tmp_path, mocker):
+    cache_path = str(tmp_path / 'graphql_schema.pickle')
+    schema_cache.write_schema_cache('type Query { stale: String }', cache_path)
+
+    build = mocker.spy(schema_cache, 'build_graphql_schema')
+    executable_schema = get_executable_schema(cache_path=cache_path)
+
+    build.assert_called_once()
+    assert 'stale' not in executable_schema.query_type.fields
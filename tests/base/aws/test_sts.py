@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from urllib.parse import quote_plus
+
+import pytest
+from botocore.credentials import ReadOnlyCredentials
+
+from dataall.base.aws.sts import SessionHelper
+
+
+@pytest.fixture
+def base_session(mocker):
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_external_id_secret', return_value='external-id')
+    SessionHelper.clear_session_cache()
+    session = MagicMock()
+    session.client.return_value.assume_role.side_effect = lambda **kwargs: {
+        'Credentials': {
+            'AccessKeyId': 'key',
+            'SecretAccessKey': 'secret',
+            'SessionToken': 'token',
+            'Expiration': datetime.now(timezone.utc) + timedelta(hours=1),
+        }
+    }
+    yield session
+    SessionHelper.clear_session_cache()
+
+
+def test_assumed_role_sessions_are_reused(base_session):
+    calls = SessionHelper.assume_role_calls
+    role_arn = 'arn:aws:iam::111111111111:role/dataallPivotRole'
+    session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
+
+    assert SessionHelper.get_session(base_session=base_session, role_arn=role_arn) is session
+    assert SessionHelper.assume_role_calls == calls + 1
+    base_session.client.return_value.assume_role.assert_called_once_with(
+        RoleArn=role_arn, RoleSessionName='dataallPivotRole', ExternalId='external-id'
+    )
+    assert session.get_credentials().get_frozen_credentials().token == 'token'
+
+    SessionHelper.get_session(base_session=base_session, role_arn='arn:aws:iam::222222222222:role/dataallPivotRole')
+    assert SessionHelper.assume_role_calls == calls + 2
+
+
+def test_clients_of_assumed_role_sessions_are_reused(base_session):
+    session = SessionHelper.get_session(base_session=base_session, role_arn='arn:aws:iam::111111111111:role/role')
+    assert session.client('glue', region_name='eu-west-1') is session.client('glue', region_name='eu-west-1')
+    assert session.client('glue', region_name='eu-west-1') is not session.client('glue', region_name='us-east-1')
+
+
+def test_uncached_sessions_assume_the_role_again(base_session):
+    calls = SessionHelper.assume_role_calls
+    role_arn = 'arn:aws:iam::111111111111:role/role'
+    session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
+
+    assert SessionHelper.get_session(base_session=base_session, role_arn=role_arn, cached=False) is not session
+    assert SessionHelper.get_session(base_session=base_session, role_arn=role_arn) is session
+    assert SessionHelper.assume_role_calls == calls + 2
+
+
+def test_sessions_are_cached_per_base_session_role(base_session):
+    role_arn = 'arn:aws:iam::111111111111:role/role'
+    pivot_session = MagicMock(role_arn='arn:aws:iam::111111111111:role/dataallPivotRole')
+    pivot_session.client = base_session.client
+    session = SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn)
+
+    assert SessionHelper.get_session(base_session=pivot_session, role_arn=role_arn) is session
+    # the role assumed by the default credentials is another session
+    default_session = MagicMock(role_arn=None)
+    default_session.client = base_session.client
+    assert SessionHelper.get_session(base_session=default_session, role_arn=role_arn) is not session
+
+
+def test_console_access_url_uses_frozen_credentials(mocker):
+    credentials = MagicMock()
+    credentials.get_frozen_credentials.return_value = ReadOnlyCredentials('key', 'secret', 'token')
+    boto3_session = MagicMock()
+    boto3_session.get_credentials.return_value = credentials
+    urlopen = mocker.patch('dataall.base.aws.sts.urllib.request.urlopen')
+    urlopen.return_value.read.return_value = '{"SigninToken": "signin-token"}'
+
+    url = SessionHelper.get_console_access_url(boto3_session, region='eu-west-1')
+
+    assert url.endswith('&SigninToken=signin-token')
+    credentials.get_frozen_credentials.assert_called_once()
+    assert quote_plus('"sessionId":"key"') in urlopen.call_args.args[0]
@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import dataall
 
 
@@ -17,3 +19,23 @@ def test(db: dataall.base.db.Engine):
                 assert nb == 0
     else:
         assert True
+
+
+def test_session_per_thread(db: dataall.base.db.Engine):
+    with db.scoped_session() as session:
+        with db.scoped_session() as nested:
+            assert nested is session
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sessions = list(executor.map(lambda _: db.session(), range(2)))
+    assert sessions[0] is not db.session()
+    assert sessions[1] is not db.session()
+
+
+def test_pool_metrics(db: dataall.base.db.Engine):
+    with db.scoped_session() as session:
+        session.execute('SELECT 1')
+        metrics = db.pool_metrics()
+        assert metrics['checked_out'] == 1
+        assert metrics['wait_count'] >= 1
+    assert db.pool_metrics()['checked_out'] == 0
@@ -1,6 +1,6 @@
 import pytest
 
-from dataall.base.db import DbConfig
+from dataall.base.db import DbConfig, PoolConfig
 
 
 def test_incorrect_database():
@@ -50,3 +50,13 @@ def test_incorrect_host():
 def test_correct_config():
     # no exception is raised
     DbConfig(user='dataall', pwd='q68rjdm_aX', host='dataall.eu-west-1.rds.amazonaws.com', db='dataall', schema='dev')
+
+
+def test_pool_config_env_overrides(monkeypatch):
+    monkeypatch.setenv('DB_POOL_SIZE', '8')
+    monkeypatch.setenv('DB_POOL_PRE_PING', 'false')
+    config = PoolConfig.wide().with_env_overrides()
+    assert config.size == 8
+    assert not config.pre_ping
+    assert config.recycle == PoolConfig.wide().recycle
+    assert PoolConfig().size == 1
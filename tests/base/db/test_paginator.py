@@ -0,0 +1,122 @@
+import logging
+import time
+
+import pytest
+
+from dataall.base.db.paginator import CountStrategy, paginate
+from dataall.core.permissions.db.permission.permission_models import Permission
+from dataall.core.permissions.db.resource_policy.resource_policy_models import ResourcePolicy, ResourcePolicyPermission
+
+log = logging.getLogger(__name__)
+
+POLICIES = 250
+PERMISSIONS_PER_POLICY = 4
+
+
+@pytest.fixture(scope='module')
+def policies(db):
+    with db.scoped_session() as session:
+        permissions = [
+            Permission(name=f'PAGINATOR_PERMISSION_{i}', type='RESOURCE', description='paginator')
+            for i in range(PERMISSIONS_PER_POLICY)
+        ]
+        session.add_all(permissions)
+        session.flush()
+        for i in range(POLICIES):
+            policy = ResourcePolicy(
+                principalId=f'group{i % 10}',
+                principalType='GROUP',
+                resourceUri=f'uri{i:04}',
+                resourceType='Paginator',
+            )
+            session.add(policy)
+            session.flush()
+            session.add_all(
+                [ResourcePolicyPermission(sid=policy.sid, permissionUri=p.permissionUri) for p in permissions]
+            )
+    yield POLICIES
+
+
+def _joined_query(session):
+    # every policy is returned once per permission by the database and de-duplicated by the ORM
+    return (
+        session.query(ResourcePolicy)
+        .join(ResourcePolicyPermission, ResourcePolicy.sid == ResourcePolicyPermission.sid)
+        .filter(ResourcePolicy.resourceType == 'Paginator')
+        .order_by(ResourcePolicy.resourceUri)
+    )
+
+
+@pytest.mark.parametrize('strategy', [CountStrategy.DISTINCT, CountStrategy.FETCH_ALL])
+def test_count_strategies_de_duplicate_entities(db, policies, strategy):
+    with db.scoped_session() as session:
+        page = paginate(_joined_query(session), page=2, page_size=20, count_strategy=strategy).to_dict()
+        assert page['count'] == policies
+        assert page['pages'] == 13
+        assert page['hasNext']
+        assert 'nextCursor' not in page
+
+
+def test_count_of_column_queries(db, policies):
+    with db.scoped_session() as session:
+        query = session.query(ResourcePolicy.principalId).filter(ResourcePolicy.resourceType == 'Paginator')
+        assert paginate(query, page=1, page_size=5).total == policies
+        assert paginate(query.distinct(), page=1, page_size=5).total == 10
+
+
+def test_window_count(db, policies):
+    with db.scoped_session() as session:
+        query = session.query(ResourcePolicy).filter(ResourcePolicy.resourceType == 'Paginator')
+        page = paginate(query.order_by(ResourcePolicy.resourceUri), 3, 100, count_strategy=CountStrategy.WINDOW)
+        assert page.total == policies
+        assert len(page.items) == 50
+        assert page.items[0].resourceUri == 'uri0200'
+        assert not page.has_next
+
+        page = paginate(query, page=4, page_size=100, count_strategy=CountStrategy.WINDOW)
+        assert page.items == []
+        assert page.total == policies
+
+
+def test_keyset_pagination(db, policies):
+    with db.scoped_session() as session:
+        query = session.query(ResourcePolicy).filter(ResourcePolicy.resourceType == 'Paginator')
+        uris = []
+        cursor = None
+        page_number = 1
+        while True:
+            page = paginate(
+                query, page=page_number, page_size=40, keyset=ResourcePolicy.resourceUri, cursor=cursor
+            ).to_dict()
+            uris.extend(policy.resourceUri for policy in page['nodes'])
+            assert page['count'] == policies
+            if not page['hasNext']:
+                assert page['nextCursor'] == ''
+                break
+            cursor = page['nextCursor']
+            page_number = page['nextPage']
+        assert uris == [f'uri{i:04}' for i in range(policies)]
+        assert page_number == 7
+
+
+def test_keyset_pagination_of_joined_query(db, policies):
+    with db.scoped_session() as session:
+        uris = []
+        cursor = None
+        while cursor != '':
+            page = paginate(_joined_query(session), 1, page_size=40, keyset=ResourcePolicy.resourceUri, cursor=cursor)
+            uris.extend(policy.resourceUri for policy in page.items)
+            cursor = page.next_cursor
+        assert uris == [f'uri{i:04}' for i in range(policies)]
+
+
+def test_count_strategies_benchmark(db, policies):
+    with db.scoped_session() as session:
+        query = session.query(ResourcePolicy).filter(ResourcePolicy.resourceType == 'Paginator')
+        timings = {}
+        for strategy in CountStrategy:
+            start = time.perf_counter()
+            for page in range(1, 6):
+                assert paginate(query, page, 20, count_strategy=strategy).total == policies
+            timings[strategy.value] = time.perf_counter() - start
+        log.info(f'Pagination timings per count strategy: {timings}')
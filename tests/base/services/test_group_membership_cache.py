@@ -0,0 +1,89 @@
+import pytest
+
+from dataall.base.services.group_membership_cache import GroupMembershipCache, get_groups_for_user, user_groups_cache
+from dataall.base.utils.api_handler_utils import extract_groups
+
+
+def wait_for_refreshes(cache):
+    for thread in list(cache._refreshes.values()):
+        thread.join()
+
+
+def test_memberships_are_cached_until_they_expire():
+    cache = GroupMembershipCache(name='test', ttl=60, stale_ttl=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return ['group-a', 'group-b']
+
+    assert cache.get('user', loader) == ['group-a', 'group-b']
+    groups = cache.get('user', loader)
+    groups.append('group-c')
+    assert cache.get('user', loader) == ['group-a', 'group-b']
+    assert len(loads) == 1
+    assert cache.stats() == {'name': 'test', 'hits': 2, 'stale_hits': 0, 'misses': 1, 'size': 1}
+
+    cache.invalidate('user')
+    cache.get('user', loader)
+    assert len(loads) == 2
+
+
+def test_stale_memberships_are_returned_while_they_are_refreshed():
+    cache = GroupMembershipCache(name='test', ttl=0, stale_ttl=60)
+    values = [['group-a'], ['group-b']]
+
+    assert cache.get('user', lambda: values.pop(0)) == ['group-a']
+    assert cache.get('user', lambda: values.pop(0)) == ['group-a']
+    wait_for_refreshes(cache)
+
+    assert cache.stats()['stale_hits'] == 1
+    assert cache._entries['user'].value == ['group-b']
+
+
+def test_stale_memberships_are_kept_if_the_refresh_fails():
+    cache = GroupMembershipCache(name='test', ttl=0, stale_ttl=60)
+    cache.get('user', lambda: ['group-a'])
+
+    def failing_loader():
+        raise Exception('IdP unavailable')
+
+    assert cache.get('user', failing_loader) == ['group-a']
+    wait_for_refreshes(cache)
+    assert cache.get('user', failing_loader) == ['group-a']
+
+
+def test_empty_memberships_and_errors_are_cached_for_the_negative_ttl():
+    cache = GroupMembershipCache(name='test', ttl=60, stale_ttl=60, negative_ttl=60)
+    loads = []
+
+    def failing_loader():
+        loads.append(1)
+        raise Exception('IdP unavailable')
+
+    for _ in range(2):
+        with pytest.raises(Exception, match='IdP unavailable'):
+            cache.get('user', failing_loader)
+    assert len(loads) == 1
+
+    assert cache.get('no-groups', lambda: []) == []
+    assert cache.get('no-groups', lambda: ['group-a']) == []
+
+    cache = GroupMembershipCache(name='test', ttl=60, stale_ttl=60, negative_ttl=0)
+    assert cache.get('no-groups', lambda: []) == []
+    assert cache.get('no-groups', lambda: ['group-a']) == ['group-a']
+
+
+def test_extract_groups_of_custom_auth_uses_the_cache(mocker, monkeypatch):
+    monkeypatch.setenv('custom_auth', 'custom')
+    user_groups_cache.invalidate()
+    service_provider = mocker.patch(
+        'dataall.base.services.group_membership_cache.ServiceProviderFactory.get_service_provider_instance'
+    )
+    service_provider.return_value.get_groups_for_user.return_value = ['group-a']
+
+    assert extract_groups('user-id', claims={}) == ['group-a']
+    assert extract_groups('user-id', claims={}) == ['group-a']
+    assert get_groups_for_user('user-id') == ['group-a']
+    service_provider.return_value.get_groups_for_user.assert_called_once_with('user-id')
+    user_groups_cache.invalidate()
@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from botocore.exceptions import ClientError
+
+from dataall.base.aws.parameter_store import ParameterStoreManager
+from dataall.base.aws.sts import SessionHelper
+from dataall.base.utils.parameter import Parameter
+from dataall.base.utils.ttl_cache import PARAMETER_CACHE_NEGATIVE_TTL, TTLCache, parameter_cache
+
+# Parameter.get_parameter is patched by the patch_ssm fixture of every test
+get_parameter = Parameter.get_parameter
+
+
+def test_values_are_cached_until_they_expire():
+    cache = TTLCache(name='test', ttl=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get('key', loader) == 1
+    assert cache.get('key', loader) == 1
+    assert cache.get('expired', loader, ttl=0) == 2
+    assert cache.get('expired', loader) == 3
+    assert cache.stats() == {'name': 'test', 'hits': 1, 'misses': 3, 'size': 2}
+
+    cache.invalidate('key')
+    assert cache.get('key', loader) == 4
+
+
+def test_missing_values_are_loaded_once_by_concurrent_callers():
+    cache = TTLCache(name='test', ttl=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.2)
+        return 'value'
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        values = list(executor.map(lambda _: cache.get('key', loader), range(5)))
+
+    assert values == ['value'] * 5
+    assert len(loads) == 1
+
+
+def test_parameter_store_values_and_missing_parameters_are_cached(mocker):
+    parameter_cache.invalidate()
+    client = mocker.patch('dataall.base.aws.parameter_store.ParameterStoreManager.client')
+    client.return_value.get_parameter.side_effect = [
+        {'Parameter': {'Value': 'value'}},
+        ClientError({'Error': {'Code': 'ParameterNotFound'}}, 'GetParameter'),
+        {'Parameter': {'Value': 'created'}},
+    ]
+
+    for _ in range(3):
+        assert (
+            ParameterStoreManager.get_parameter_value(region='eu-west-1', parameter_path='/dataall/test/found')
+            == 'value'
+        )
+        with pytest.raises(Exception, match='not found'):
+            ParameterStoreManager.get_parameter_value(region='eu-west-1', parameter_path='/dataall/test/missing')
+    assert client.return_value.get_parameter.call_count == 2
+
+    # missing parameters are cached for PARAMETER_CACHE_NEGATIVE_TTL seconds only
+    mocker.patch.object(time, 'monotonic', return_value=time.monotonic() + PARAMETER_CACHE_NEGATIVE_TTL + 1)
+    assert (
+        ParameterStoreManager.get_parameter_value(region='eu-west-1', parameter_path='/dataall/test/missing')
+        == 'created'
+    )
+    assert (
+        ParameterStoreManager.get_parameter_value(region='eu-west-1', parameter_path='/dataall/test/found') == 'value'
+    )
+    assert client.return_value.get_parameter.call_count == 3
+    parameter_cache.invalidate()
+
+
+def _missing_then_created(client):
+    client.get_parameter.side_effect = [
+        ClientError({'Error': {'Code': 'ParameterNotFound'}}, 'GetParameter'),
+        {'Parameter': {'Value': 'created'}},
+    ]
+
+
+def test_missing_parameters_are_cached_for_the_negative_ttl(mocker):
+    parameter_cache.invalidate()
+    mocker.patch.object(Parameter, 'get_parameter', get_parameter)
+    ssm = mocker.patch('dataall.base.utils.parameter.Parameter.ssm')
+    _missing_then_created(ssm.return_value)
+
+    assert Parameter.get_parameter(env='test', path='missing') is None
+    assert Parameter.get_parameter(env='test', path='missing') is None
+    assert ssm.return_value.get_parameter.call_count == 1
+
+    mocker.patch.object(time, 'monotonic', return_value=time.monotonic() + PARAMETER_CACHE_NEGATIVE_TTL + 1)
+    assert Parameter.get_parameter(env='test', path='missing') == 'created'
+    parameter_cache.invalidate()
+
+
+def test_missing_session_helper_parameters_are_cached_for_the_negative_ttl(mocker):
+    parameter_cache.invalidate()
+    session = mocker.patch('dataall.base.aws.sts.SessionHelper.get_session')
+    client = session.return_value.client.return_value
+    _missing_then_created(client)
+
+    assert SessionHelper._get_parameter_value(parameter_path='/dataall/test/missing') is None
+    assert SessionHelper._get_parameter_value(parameter_path='/dataall/test/missing') is None
+    assert client.get_parameter.call_count == 1
+
+    mocker.patch.object(time, 'monotonic', return_value=time.monotonic() + PARAMETER_CACHE_NEGATIVE_TTL + 1)
+    assert SessionHelper._get_parameter_value(parameter_path='/dataall/test/missing') == 'created'
+    parameter_cache.invalidate()
@@ -61,8 +61,7 @@ def db() -> Engine:
     engine = get_engine(envname=ENVNAME)
     create_schema_and_tables(engine, envname=ENVNAME)
     yield engine
-    engine.session().close()
-    engine.engine.dispose()
+    engine.dispose()
 
 
 @pytest.fixture(scope='module')
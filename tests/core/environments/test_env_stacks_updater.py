@@ -1,11 +1,65 @@
-from dataall.core.environment.tasks.env_stacks_updater import update_stacks
+from types import SimpleNamespace
 
+import pytest
 
-def test_stacks_update(db, org_fixture, env_fixture, mocker):
-    mocker.patch(
-        'dataall.core.environment.tasks.env_stacks_updater.update_stack',
-        return_value=True,
-    )
+from dataall.core.environment.tasks.env_stacks_updater import StackUpdateScheduler, update_stacks
+
+
+@pytest.fixture
+def ecs(mocker):
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Parameter')
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.time.sleep')
+    ecs = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs')
+    ecs.list_running_tasks_started_by.return_value = set()
+    ecs.run_cdkproxy_task.return_value = 'arn:aws:ecs:eu-west-1:111111111111:task/cluster/cdkproxy'
+    return ecs
+
+
+def test_stacks_update(db, org_fixture, env_fixture, ecs):
     envs, others = update_stacks(engine=db, envname='local')
     assert envs == 1
     assert others == 0
+    ecs.run_cdkproxy_task.assert_called_once()
+
+
+def test_stack_update_scheduler(mocker, ecs):
+    environments = [
+        SimpleNamespace(environmentUri='env1', AwsAccountId='111', region='eu-west-1', name='env1'),
+        SimpleNamespace(environmentUri='env2', AwsAccountId='111', region='eu-west-1', name='env2'),
+        SimpleNamespace(environmentUri='env3', AwsAccountId='222', region='eu-west-1', name='env3'),
+        SimpleNamespace(environmentUri='env4', AwsAccountId='333', region='eu-west-1', name='env4'),
+    ]
+    mocker.patch(
+        'dataall.core.environment.tasks.env_stacks_updater.StackRepository.get_stack_by_target_uri',
+        side_effect=lambda session, target_uri: SimpleNamespace(stackUri=f'stack-{target_uri}', name=target_uri),
+    )
+    started = []
+    running = set()
+
+    def run_cdkproxy_task(stack_uri):
+        started.append(stack_uri)
+        running.add(f'awsworker-{stack_uri}')
+
+    def list_running_tasks_started_by(cluster_name):
+        # the tasks started before the poll finish before the next poll
+        current = set(running)
+        running.clear()
+        return current
+
+    ecs.run_cdkproxy_task.side_effect = run_cdkproxy_task
+    ecs.list_running_tasks_started_by.side_effect = list_running_tasks_started_by
+
+    StackUpdateScheduler(session=mocker.MagicMock(), envname='local', max_concurrent=2).run(
+        environments, {'env1': ['dataset1'], None: ['other']}
+    )
+
+    # env2 waits for env1 of the same account, env4 for a free slot, the dataset of env1 starts right after env1
+    assert started == [
+        'stack-env1',
+        'stack-env3',
+        'stack-dataset1',
+        'stack-env2',
+        'stack-env4',
+        'stack-other',
+    ]
+    assert ecs.list_running_tasks_started_by.call_count == 5
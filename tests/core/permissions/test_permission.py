@@ -1,11 +1,20 @@
 import pytest
 
+from dataall.base.context import set_context, dispose_context, RequestContext
 from dataall.core.permissions.db.permission.permission_models import PermissionType
 from dataall.core.permissions.services.permission_service import PermissionService
 from dataall.base.db import exceptions
 from dataall.core.permissions.services.environment_permissions import ENVIRONMENT_ALL
-from dataall.core.permissions.services.organization_permissions import ORGANIZATION_ALL
-from dataall.core.permissions.services.tenant_permissions import MANAGE_GROUPS, TENANT_ALL
+from dataall.core.permissions.services.organization_permissions import (
+    ORGANIZATION_ALL,
+    GET_ORGANIZATION,
+    UPDATE_ORGANIZATION,
+)
+from dataall.core.permissions.services.resource_permission_cache import ResourcePermissionCache
+from dataall.core.permissions.db.tenant.tenant_policy_repositories import TenantPolicyRepository
+from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
+from dataall.core.permissions.services.tenant_permission_cache import tenant_policy_groups
+from dataall.core.permissions.services.tenant_permissions import MANAGE_GROUPS, MANAGE_ORGANIZATIONS, TENANT_ALL
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 
 
@@ -62,3 +71,101 @@ def test_unauthorized_tenant_policy(db, group):
                 permission_name='UNKNOW_PERMISSION',
                 tenant_name='dataall',
             )
+
+
+def test_resource_permissions_are_cached_per_request(db, group):
+    permissions(db, ORGANIZATION_ALL + ENVIRONMENT_ALL)
+    set_context(RequestContext(db_engine=db, username='alice', groups=[group.name], user_id='alice'))
+    try:
+        with db.scoped_session() as session:
+            ResourcePolicyService.attach_resource_policy(
+                session=session,
+                group=group.name,
+                permissions=[GET_ORGANIZATION],
+                resource_uri='cached-resource',
+                resource_type='Organization',
+            )
+            for _ in range(3):
+                assert ResourcePolicyService.check_user_resource_permission(
+                    session=session,
+                    username='alice',
+                    groups=[group.name],
+                    resource_uri='cached-resource',
+                    permission_name=GET_ORGANIZATION,
+                )
+            with pytest.raises(exceptions.ResourceUnauthorized):
+                ResourcePolicyService.check_user_resource_permission(
+                    session=session,
+                    username='alice',
+                    groups=[group.name],
+                    resource_uri='cached-resource',
+                    permission_name=UPDATE_ORGANIZATION,
+                )
+
+            cache = ResourcePermissionCache.current()
+            assert cache.misses == 1
+            assert cache.hits == 3
+
+            ResourcePolicyService.attach_resource_policy(
+                session=session,
+                group=group.name,
+                permissions=[UPDATE_ORGANIZATION],
+                resource_uri='cached-resource',
+                resource_type='Organization',
+            )
+            assert ResourcePolicyService.check_user_resource_permission(
+                session=session,
+                username='alice',
+                groups=[group.name],
+                resource_uri='cached-resource',
+                permission_name=UPDATE_ORGANIZATION,
+            )
+            assert cache.misses == 2
+
+            ResourcePolicyService.delete_resource_policy(
+                session=session, group=group.name, resource_uri='cached-resource'
+            )
+            with pytest.raises(exceptions.ResourceUnauthorized):
+                ResourcePolicyService.check_user_resource_permission(
+                    session=session,
+                    username='alice',
+                    groups=[group.name],
+                    resource_uri='cached-resource',
+                    permission_name=GET_ORGANIZATION,
+                )
+            assert cache.misses == 3
+    finally:
+        dispose_context()
+
+
+def test_tenant_permissions_are_loaded_once_per_request(db, tenant, mocker):
+    permissions(db, ORGANIZATION_ALL + ENVIRONMENT_ALL)
+    groups = ['cached-tenant-group', 'other-cached-tenant-group']
+    tenant_policy_groups.invalidate()
+    load = mocker.spy(TenantPolicyRepository, 'get_groups_tenant_permission_names')
+    set_context(RequestContext(db_engine=db, username='alice', groups=groups, user_id='alice'))
+    try:
+        with db.scoped_session() as session:
+            TenantPolicyService.attach_missing_group_tenant_policies(
+                session, groups, [MANAGE_GROUPS], TenantPolicyService.TENANT_NAME
+            )
+            load.reset_mock()
+
+            assert TenantPolicyService.check_user_tenant_permission(
+                session, 'alice', groups, TenantPolicyService.TENANT_NAME, MANAGE_GROUPS
+            )
+            with pytest.raises(exceptions.TenantUnauthorized):
+                TenantPolicyService.check_user_tenant_permission(
+                    session, 'alice', groups, TenantPolicyService.TENANT_NAME, MANAGE_ORGANIZATIONS
+                )
+            assert load.call_count == 1
+    finally:
+        dispose_context()
+
+    # the groups are known to have a tenant policy, the next requests do not look them up
+    load.reset_mock()
+    with db.scoped_session() as session:
+        TenantPolicyService.attach_missing_group_tenant_policies(
+            session, groups, TENANT_ALL, TenantPolicyService.TENANT_NAME
+        )
+    load.assert_not_called()
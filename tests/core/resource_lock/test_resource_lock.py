@@ -0,0 +1,116 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from dataall.base.db.exceptions import ResourceLockTimeout
+from dataall.core.resource_lock.db import resource_lock_repositories
+from dataall.core.resource_lock.db.resource_lock_models import ResourceLock
+from dataall.core.resource_lock.db.resource_lock_repositories import ResourceLockRepository, lock_wait_metrics
+
+RESOURCES = [('dataset-uri', 'dataset'), ('group-env', 'environment_group_permission')]
+
+
+@pytest.fixture(autouse=True)
+def clean_locks(db):
+    lock_wait_metrics.reset()
+    yield
+    with db.scoped_session() as session:
+        session.query(ResourceLock).delete()
+
+
+def _holders(db):
+    with db.scoped_session() as session:
+        return {(lock.resourceUri, lock.resourceType): lock.acquiredByUri for lock in session.query(ResourceLock)}
+
+
+def test_acquire_locks_all_or_nothing(db):
+    with db.scoped_session() as session:
+        assert ResourceLockRepository._acquire_locks(RESOURCES[1:], session, 'share-1', 'share_object')
+        assert not ResourceLockRepository._acquire_locks(RESOURCES, session, 'share-2', 'share_object')
+
+    assert _holders(db) == {RESOURCES[1]: 'share-1'}
+
+
+def test_acquire_lock_with_retry_releases_locks(db):
+    with db.scoped_session() as session:
+        with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-1', 'share_object'):
+            assert _holders(db) == {resource: 'share-1' for resource in RESOURCES}
+
+    assert _holders(db) == {}
+    assert lock_wait_metrics.to_dict()['acquired'] == 1
+
+
+def test_expired_lock_is_taken_over(db):
+    with db.scoped_session() as session:
+        session.add(
+            ResourceLock(
+                resourceUri=RESOURCES[0][0],
+                resourceType=RESOURCES[0][1],
+                acquiredByUri='crashed-share',
+                acquiredByType='share_object',
+                acquiredAt=datetime.now() - timedelta(hours=3),
+                expiresAt=datetime.now() - timedelta(hours=1),
+            )
+        )
+        session.commit()
+        assert ResourceLockRepository._acquire_locks(RESOURCES, session, 'share-1', 'share_object')
+
+    assert _holders(db) == {resource: 'share-1' for resource in RESOURCES}
+    assert lock_wait_metrics.to_dict()['expired'] == 1
+
+
+def test_leases_are_renewed_while_the_locks_are_held(db, mocker):
+    mocker.patch.object(resource_lock_repositories, 'LOCK_LEASE_SECONDS', 1)
+    mocker.patch.object(resource_lock_repositories, 'LOCK_HEARTBEAT_SECONDS', 0.2)
+    with db.scoped_session() as session:
+        with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-1', 'share_object'):
+            # the holder outlives the lease, the locks are not taken over
+            time.sleep(2)
+            with db.scoped_session() as other_session:
+                assert not ResourceLockRepository._acquire_locks(RESOURCES, other_session, 'share-2', 'share_object')
+            assert _holders(db) == {resource: 'share-1' for resource in RESOURCES}
+
+    assert _holders(db) == {}
+    assert lock_wait_metrics.to_dict()['expired'] == 0
+
+
+def test_waiter_acquires_lock_as_soon_as_released(db, mocker):
+    mocker.patch.object(resource_lock_repositories, 'MIN_RETRY_INTERVAL', 30)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with db.scoped_session() as session:
+            with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-1', 'share_object'):
+                holding.set()
+                release.wait(10)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait(10)
+    threading.Timer(0.5, release.set).start()
+
+    with db.scoped_session() as session:
+        with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-2', 'share_object'):
+            assert _holders(db) == {resource: 'share-2' for resource in RESOURCES}
+    holder.join()
+
+    metrics = lock_wait_metrics.to_dict()
+    assert metrics['acquired'] == 2
+    assert metrics['contended'] == 1
+    # woken up by the release instead of waiting for the retry interval
+    assert metrics['max_wait_time'] < 10
+
+
+def test_acquire_lock_with_retry_timeout(db, mocker):
+    mocker.patch.object(resource_lock_repositories, 'LOCK_TIMEOUT_SECONDS', 1)
+    with db.scoped_session() as session:
+        assert ResourceLockRepository._acquire_locks(RESOURCES, session, 'share-1', 'share_object')
+        with pytest.raises(ResourceLockTimeout):
+            with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-2', 'share_object'):
+                pass
+
+    assert _holders(db) == {resource: 'share-1' for resource in RESOURCES}
+    assert lock_wait_metrics.to_dict()['timeouts'] == 1
@@ -0,0 +1,61 @@
+import pytest
+
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.service_handlers import WorkerHandler
+
+
+@pytest.fixture(scope='function')
+def worker():
+    worker = WorkerHandler()
+    executions = []
+
+    @worker.handler(path='test.ok')
+    def ok(engine, task):
+        executions.append((task.targetUri, task.payload['order']))
+        return {'target': task.targetUri}
+
+    @worker.handler(path='test.fail')
+    def fail(engine, task):
+        raise Exception('task failed')
+
+    worker.executions = executions
+    yield worker
+
+
+def _create_tasks(db, tasks):
+    with db.scoped_session() as session:
+        created = [
+            Task(targetUri=target, action=action, payload={'order': i}) for i, (target, action) in enumerate(tasks)
+        ]
+        session.add_all(created)
+        session.commit()
+        return [task.taskUri for task in created]
+
+
+def test_process_all_tasks_of_the_batch(db, worker):
+    task_ids = _create_tasks(
+        db,
+        [('target1', 'test.ok'), ('target2', 'test.ok'), ('target1', 'test.ok'), ('target3', 'test.fail')],
+    )
+    responses = worker.process(db, task_ids)
+
+    assert [response['taskUri'] for response in responses] == task_ids
+    assert [response['status'] for response in responses] == ['completed', 'completed', 'completed', 'failed']
+    # tasks of the same target keep the order of the queue
+    assert [order for target, order in worker.executions if target == 'target1'] == [0, 2]
+
+    with db.scoped_session() as session:
+        tasks = {task.taskUri: task for task in session.query(Task).filter(Task.taskUri.in_(task_ids))}
+        assert tasks[task_ids[0]].status == 'completed'
+        assert tasks[task_ids[0]].response == {'target': 'target1'}
+        assert tasks[task_ids[3]].status == 'failed'
+        assert tasks[task_ids[3]].error == {'message': 'task failed'}
+
+
+def test_process_skips_tasks_that_are_not_pending(db, worker):
+    task_ids = _create_tasks(db, [('target1', 'test.ok'), ('target2', 'test.unknown')])
+    assert len(worker.process(db, task_ids)) == 1
+    assert worker.process(db, task_ids) == []
+    assert len(worker.executions) == 1
+    with db.scoped_session() as session:
+        assert session.query(Task).get(task_ids[1]).status == 'pending'
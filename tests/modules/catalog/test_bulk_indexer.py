@@ -0,0 +1,123 @@
+import pytest
+
+from dataall.modules.catalog.indexers import base_indexer
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, _BulkRequest
+
+
+class FakeBulk:
+    """Replaces helpers.parallel_bulk, rejects the documents in `throttled` the first `times` attempts"""
+
+    def __init__(self, throttled=(), times=1, status=429):
+        self.throttled = set(throttled)
+        self.times = times
+        self.status = status
+        self.calls = []
+
+    def __call__(self, client, actions, **kwargs):
+        actions = list(actions)
+        self.calls.append((actions, kwargs))
+        for action in actions:
+            failed = action['_id'] in self.throttled and len(self.calls) <= self.times
+            status = self.status if failed else 201
+            yield not failed, {action['_op_type']: {'_id': action['_id'], 'status': status}}
+
+
+@pytest.fixture
+def fake_bulk(mocker):
+    mocker.patch.object(base_indexer.time, 'sleep')
+
+    def factory(**kwargs):
+        fake = FakeBulk(**kwargs)
+        mocker.patch.object(base_indexer.helpers, 'parallel_bulk', side_effect=fake)
+        return fake
+
+    return factory
+
+
+def _request(chunk_size=2, thread_count=2, max_retries=2):
+    return _BulkRequest(
+        es_provider=lambda: object(),
+        chunk_size=chunk_size,
+        max_chunk_bytes=1024,
+        thread_count=thread_count,
+        max_retries=max_retries,
+    )
+
+
+def _index_action(doc_id):
+    return {'_op_type': 'index', '_index': 'dataall-index', '_id': doc_id, '_source': {'name': doc_id}}
+
+
+def test_bulk_request_flushes_full_batches(fake_bulk):
+    fake = fake_bulk()
+    request = _request()
+    for i in range(9):
+        request.add(_index_action(f'doc{i}'))
+    assert [len(actions) for actions, _ in fake.calls] == [4, 4]
+
+    request.flush()
+    assert [len(actions) for actions, _ in fake.calls] == [4, 4, 1]
+    assert fake.calls[0][1]['chunk_size'] == 2
+    assert fake.calls[0][1]['thread_count'] == 2
+    assert request.stats.indexed == 9
+    assert request.stats.failed == 0
+
+
+def test_bulk_request_retries_throttled_documents(fake_bulk):
+    fake = fake_bulk(throttled={'doc1'}, times=2)
+    request = _request()
+    request.add(_index_action('doc0'))
+    request.add(_index_action('doc1'))
+    request.flush()
+
+    assert [[action['_id'] for action in actions] for actions, _ in fake.calls] == [
+        ['doc0', 'doc1'],
+        ['doc1'],
+        ['doc1'],
+    ]
+    assert request.stats.indexed == 2
+    assert request.stats.retried == 2
+    assert request.stats.failed == 0
+
+
+def test_bulk_request_gives_up_after_max_retries(fake_bulk):
+    fake_bulk(throttled={'doc1'}, times=10)
+    request = _request(max_retries=1)
+    request.add(_index_action('doc0'))
+    request.add(_index_action('doc1'))
+    request.flush()
+
+    assert request.stats.indexed == 1
+    assert request.stats.retried == 1
+    assert request.stats.failed_ids == {'doc1'}
+
+
+def test_bulk_request_does_not_retry_rejected_documents(fake_bulk):
+    fake = fake_bulk(throttled={'doc0'}, status=400)
+    request = _request()
+    request.add(_index_action('doc0'))
+    request.flush()
+
+    assert len(fake.calls) == 1
+    assert request.stats.failed == 1
+
+
+def test_bulk_deletes_ignore_missing_documents(fake_bulk):
+    fake_bulk(throttled={'doc0'}, times=10, status=404)
+    request = _request()
+    request.add({'_op_type': 'delete', '_index': 'dataall-index', '_id': 'doc0'})
+    request.flush()
+
+    assert request.stats.deleted == 1
+    assert request.stats.failed == 0
+
+
+def test_bulk_context_is_reentrant(fake_bulk):
+    fake = fake_bulk()
+    with BaseIndexer.bulk() as stats:
+        with BaseIndexer.bulk() as inner_stats:
+            assert inner_stats is stats
+        assert base_indexer._bulk_context.request is not None
+    assert base_indexer._bulk_context.request is None
+    assert fake.calls == []
+    assert stats.elapsed > 0
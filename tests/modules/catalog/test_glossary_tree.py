@@ -0,0 +1,116 @@
+import logging
+import time
+
+import pytest
+
+from dataall.modules.catalog.db.glossary_models import GlossaryNode, GlossaryNodeStatus, TermLink
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository, _subtree
+
+log = logging.getLogger(__name__)
+
+# generated glossary: a glossary with CATEGORY_LEVELS levels of categories, each node has BRANCHES categories and
+# BRANCHES terms, 363 categories and 1089 terms
+CATEGORY_LEVELS = 5
+BRANCHES = 3
+
+
+def _node(uri, parent, node_type):
+    path = f'{parent.path}/{uri}' if parent else f'/{uri}'
+    return GlossaryNode(
+        nodeUri=uri,
+        parentUri=parent.nodeUri if parent else '',
+        nodeType=node_type,
+        status=GlossaryNodeStatus.approved.value,
+        path=path,
+        depth=path.count('/'),
+        label=f'{node_type} {uri}',
+        readme=f'description of {uri}',
+        owner='alice',
+    )
+
+
+@pytest.fixture(scope='module')
+def deep_glossary(db):
+    glossary = _node('deepglossary', None, 'G')
+    nodes = [glossary]
+    level = [glossary]
+    for _ in range(CATEGORY_LEVELS):
+        next_level = []
+        for parent in level:
+            for i in range(BRANCHES):
+                next_level.append(_node(f'{parent.nodeUri}c{i}', parent, 'C'))
+        level = next_level
+        nodes.extend(level)
+    categories = [node for node in nodes if node.nodeType == 'C']
+    for parent in categories:
+        nodes.extend(_node(f'{parent.nodeUri}t{i}', parent, 'T') for i in range(BRANCHES))
+
+    with db.scoped_session() as session:
+        session.bulk_save_objects(nodes)
+        session.commit()
+        session.execute('ANALYZE glossary_node')
+    yield {'path': glossary.path, 'categories': len(categories), 'terms': len(nodes) - len(categories) - 1}
+    with db.scoped_session() as session:
+        session.query(GlossaryNode).filter(_subtree(glossary.path)).delete(synchronize_session=False)
+        session.commit()
+
+
+def test_node_tree_is_limited_to_the_max_depth(db, deep_glossary):
+    with db.scoped_session() as session:
+        tree = GlossaryRepository.get_node_tree(session, deep_glossary['path'], {'pageSize': 10000})
+        assert tree['count'] == deep_glossary['categories'] + deep_glossary['terms'] + 1
+
+        tree = GlossaryRepository.get_node_tree(session, deep_glossary['path'], {'pageSize': 10000, 'maxDepth': 2})
+        # the glossary, its categories, and the categories and terms of its categories
+        assert tree['count'] == 1 + BRANCHES + 2 * BRANCHES * BRANCHES
+
+        children = GlossaryRepository.list_node_children(
+            session, deep_glossary['path'], {'pageSize': 10000, 'maxDepth': 1, 'nodeType': 'C'}
+        )
+        assert children['count'] == BRANCHES
+        assert all(node.parentUri == 'deepglossary' for node in children['nodes'])
+
+
+def test_subtree_stats_and_delete(db, deep_glossary):
+    category_path = f'{deep_glossary["path"]}/deepglossaryc0'
+    with db.scoped_session() as session:
+        assert GlossaryRepository.get_glossary_categories_terms_and_associations(session, deep_glossary['path']) == {
+            'categories': deep_glossary['categories'],
+            'terms': deep_glossary['terms'],
+            'associations': 0,
+        }
+        # the stats of a category count the category itself
+        subtree_categories = sum(BRANCHES**level for level in range(CATEGORY_LEVELS))
+        assert GlossaryRepository.get_glossary_categories_terms_and_associations(session, category_path) == {
+            'categories': subtree_categories,
+            'terms': subtree_categories * BRANCHES,
+            'associations': 0,
+        }
+        session.add(TermLink(nodeUri='deepglossaryc0t0', targetUri='dataset', targetType='Dataset', owner='alice'))
+        assert (
+            GlossaryRepository.get_glossary_categories_terms_and_associations(session, category_path)['associations']
+            == 1
+        )
+
+        # a sibling whose uri starts with the uri of the node is not in its subtree
+        session.add(_node('deepglossaryc0x', session.query(GlossaryNode).get('deepglossary'), 'T'))
+        assert GlossaryRepository.delete_node(session, 'deepglossaryc0') == subtree_categories * 4
+        assert session.query(GlossaryNode).get('deepglossaryc0x').deleted is None
+        session.rollback()
+
+
+def test_subtree_queries_use_the_path_index(db, deep_glossary):
+    with db.scoped_session() as session:
+        query = session.query(GlossaryNode).filter(_subtree(f'{deep_glossary["path"]}/deepglossaryc1', max_depth=2))
+        statement = query.statement.compile(db.engine, compile_kwargs={'literal_binds': True})
+        session.execute('SET LOCAL enable_seqscan = off')
+        plan = '\n'.join(row[0] for row in session.execute(f'EXPLAIN {statement}'))
+        assert 'ix_glossary_node_path' in plan
+
+        # benchmark of the rendering of the tree, one level at a time
+        for max_depth in range(1, CATEGORY_LEVELS + 2):
+            started = time.perf_counter()
+            tree = GlossaryRepository.get_node_tree(
+                session, deep_glossary['path'], {'pageSize': 10000, 'maxDepth': max_depth}
+            )
+            log.info(f'Tree of depth {max_depth}: {tree["count"]} nodes in {time.perf_counter() - started:.3f}s')
@@ -5,9 +5,22 @@ from unittest.mock import MagicMock
 import pytest
 
 from dataall.modules.notifications.handlers.notifications_handler import NotificationHandler
+from dataall.base.services.group_membership_cache import group_emails_cache
+from dataall.modules.notifications.services.ses_email_notification_service import EmailNotificationBatch
 from dataall.core.tasks.db.task_models import Task
 
 
+@pytest.fixture(autouse=True)
+def clear_group_email_cache():
+    group_emails_cache.invalidate()
+    yield
+    group_emails_cache.invalidate()
+
+
+def bulk_email_results(to_list, message, subject):
+    return {email_id: {'Status': 'SUCCESS', 'MessageId': f'id-{email_id}'} for email_id in to_list}
+
+
 def mock_cognito_client(mocker):
     mock_client = MagicMock()
     mocker.patch('dataall.modules.notifications.services.ses_email_notification_service.Cognito', mock_client)
@@ -26,7 +39,7 @@ def mock_ses_client_(mocker):
 def test_notification_service_email(mocker, db):
     # Mock SES Client
     mock_ses_client = mock_ses_client_(mocker)
-    mock_ses_client().send_email.return_value = True
+    mock_ses_client().send_bulk_email.side_effect = bulk_email_results
 
     # Mock Cognito Client
     cognito_client = mock_cognito_client(mocker)
@@ -54,7 +67,7 @@ def test_notification_service_email(mocker, db):
         session.add(notification_task)
         session.commit()
 
-        NotificationHandler.notification_service(db, notification_task)
+        response = NotificationHandler.notification_service(db, notification_task)
 
     cognito_client().get_user_emailids_from_group.assert_called()
     cognito_calls = cognito_client().get_user_emailids_from_group.call_args_list
@@ -64,9 +77,81 @@ def test_notification_service_email(mocker, db):
         and 'datasetStewardsGroup' in group_name_list_used_for_share
         and 'requesterGroupName' in group_name_list_used_for_share
     )
-    mock_ses_client().send_email.assert_called()
-    # Check if the email send method is called three times for ["bob@email.com", "bob-1@email.com", "email@email.com"]
-    assert mock_ses_client().send_email.call_count == 3
+    # Check if one bulk request sends an email to each of ["bob@email.com", "bob-1@email.com", "email@email.com"]
+    mock_ses_client().send_bulk_email.assert_called_once()
+    assert mock_ses_client().send_bulk_email.call_args.args[0] == [
+        'bob-1@email.com',
+        'bob@email.com',
+        'email@email.com',
+    ]
+    mock_ses_client().send_email.assert_not_called()
+    assert response == {
+        'messageIds': {
+            'bob-1@email.com': 'id-bob-1@email.com',
+            'bob@email.com': 'id-bob@email.com',
+            'email@email.com': 'id-email@email.com',
+        },
+        'failed': {},
+    }
+
+
+def test_notification_service_email_bulk_failures(mocker, db):
+    mock_ses_client = mock_ses_client_(mocker)
+    mock_ses_client().send_bulk_email.return_value = {
+        'bob@email.com': {'Status': 'SUCCESS', 'MessageId': 'id-bob'},
+        'bob-1@email.com': {'Status': 'ACCOUNT_THROTTLED', 'Error': 'throttled'},
+        'email@email.com': {'Status': 'MESSAGE_REJECTED', 'Error': 'rejected'},
+    }
+    mock_ses_client().send_email.return_value = {'MessageId': 'id-bob-1'}
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.return_value = ['bob@email.com', 'bob-1@email.com']
+    mocker.patch(
+        'dataall.modules.notifications.services.ses_email_notification_service.ServiceProviderFactory.get_service_provider_instance',
+        return_value=cognito_client(),
+    )
+
+    notification_task = Task(
+        action='notification.service',
+        targetUri='some_share_uri',
+        payload={
+            'notificationType': 'email',
+            'subject': 'subject',
+            'message': 'message',
+            'recipientGroupsList': ['datasetOwnerGroup'],
+            'recipientEmailList': ['email@email.com'],
+        },
+    )
+    response = NotificationHandler.notification_service(db, notification_task)
+
+    # the throttled recipient is sent an individual email, the rejected one is not retried
+    mock_ses_client().send_email.assert_called_once_with(['bob-1@email.com'], 'message', 'subject')
+    assert response['messageIds'] == {'bob@email.com': 'id-bob', 'bob-1@email.com': 'id-bob-1'}
+    assert list(response['failed']) == ['email@email.com']
+
+
+def test_email_notification_batch(mocker):
+    mock_ses_client = mock_ses_client_(mocker)
+    mock_ses_client().send_bulk_email.side_effect = bulk_email_results
+    mock_ses_client().send_email.return_value = {'MessageId': 'id-single'}
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.return_value = ['bob@email.com', 'bob-1@email.com']
+    mocker.patch(
+        'dataall.modules.notifications.services.ses_email_notification_service.ServiceProviderFactory.get_service_provider_instance',
+        return_value=cognito_client(),
+    )
+
+    email_batch = EmailNotificationBatch()
+    email_batch.add('subject-1', 'message-1', ['datasetOwnerGroup', 'datasetStewardsGroup'])
+    email_batch.add('subject-2', 'message-2', ['datasetOwnerGroup'])
+    email_batch.add('subject-3', 'message-3', recipient_email_list=['email@email.com'])
+    results = email_batch.send()
+
+    # the members of each group are fetched once for all the emails of the batch
+    assert cognito_client().get_user_emailids_from_group.call_count == 2
+    assert mock_ses_client().send_bulk_email.call_count == 2
+    mock_ses_client().send_email.assert_called_once_with(['email@email.com'], 'message-3', 'subject-3')
+    assert [len(result['messageIds']) for result in results] == [2, 2, 1]
+    assert len(email_batch) == 0
 
 
 # Test to check when unknown notification type is used
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dataall.modules.redshift_datasets.aws import redshift_data
+from dataall.modules.redshift_datasets.aws.redshift_data import RedshiftDataClient, redshift_metadata_cache
+
+
+@pytest.fixture
+def data_api(mocker):
+    redshift_metadata_cache.invalidate()
+    mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data.time.sleep')
+    session_helper = mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data.SessionHelper')
+    client = session_helper.remote_session.return_value.client.return_value
+    yield client
+    redshift_metadata_cache.invalidate()
+
+
+def _connection(uri='connection1'):
+    return SimpleNamespace(
+        connectionUri=uri,
+        database='dev',
+        workgroup='workgroup',
+        clusterId=None,
+        secretArn=None,
+        redshiftUser=None,
+    )
+
+
+def test_execute_statement_polls_with_backoff(data_api, mocker):
+    sleep = redshift_data.time.sleep
+    data_api.execute_statement.return_value = {'Id': 'statement1'}
+    data_api.describe_statement.side_effect = [{'Status': 'SUBMITTED'}] * 6 + [
+        {'Status': 'FINISHED', 'Id': 'statement1'}
+    ]
+
+    client = RedshiftDataClient('111111111111', 'eu-west-1', _connection())
+    assert client._execute_statement('SELECT 1') == 'statement1'
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2, 0.4, 0.8, 1.6, 2]
+    # the statement is not added to the parameters of the next calls
+    assert 'Sql' not in client.execute_connection_params
+
+
+def test_execute_statement_failed(data_api):
+    data_api.execute_statement.return_value = {'Id': 'statement1'}
+    data_api.describe_statement.return_value = {'Status': 'FAILED', 'Error': 'ERROR: syntax error'}
+
+    client = RedshiftDataClient('111111111111', 'eu-west-1', _connection())
+    with pytest.raises(Exception, match='ERROR: syntax error'):
+        client._execute_statement('SELEC 1')
+
+
+def test_metadata_is_cached_per_connection(data_api):
+    data_api.list_tables.return_value = {'Tables': [{'name': 'table1', 'type': 'TABLE'}]}
+
+    client = RedshiftDataClient('111111111111', 'eu-west-1', _connection())
+    tables = client.list_redshift_tables('public')
+    tables[0]['alreadyAdded'] = True
+    assert client.list_redshift_tables('public') == [{'name': 'table1', 'type': 'TABLE'}]
+    assert data_api.list_tables.call_count == 1
+
+    RedshiftDataClient('111111111111', 'eu-west-1', _connection('connection2')).list_redshift_tables('public')
+    assert data_api.list_tables.call_count == 2
+
+    client.list_redshift_tables('public', refresh=True)
+    assert data_api.list_tables.call_count == 3
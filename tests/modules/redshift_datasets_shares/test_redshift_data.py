@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dataall.modules.redshift_datasets_shares.aws.redshift_data import RedshiftShareDataClient
+
+
+@pytest.fixture
+def data_api(mocker):
+    mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data.time.sleep')
+    session_helper = mocker.patch('dataall.modules.redshift_datasets_shares.aws.redshift_data.SessionHelper')
+    client = session_helper.remote_session.return_value.client.return_value
+    client.execute_statement.return_value = {'Id': 'statement'}
+    client.batch_execute_statement.return_value = {'Id': 'batch'}
+    client.describe_statement.side_effect = lambda Id: {'Status': 'FINISHED', 'Id': Id}
+    client.get_statement_result.return_value = {'Records': [[{'stringValue': 'datashare1'}]]}
+    yield client
+
+
+@pytest.fixture
+def share_data_client(data_api):
+    connection = SimpleNamespace(
+        database='dev', workgroup='workgroup', clusterId=None, secretArn=None, redshiftUser=None, connectionUri='c1'
+    )
+    yield RedshiftShareDataClient('111111111111', 'eu-west-1', connection)
+
+
+def test_batch_statements(share_data_client, data_api):
+    with share_data_client.batch_statements():
+        share_data_client.grant_database_usage_access_to_redshift_role(database='db', rs_role='role')
+        share_data_client.grant_schema_usage_access_to_redshift_role(schema='schema', rs_role='role')
+
+    data_api.execute_statement.assert_not_called()
+    data_api.batch_execute_statement.assert_called_once_with(
+        Database='dev',
+        WorkgroupName='workgroup',
+        Sqls=[
+            'GRANT USAGE ON DATABASE "db" TO ROLE "role" ;',
+            'GRANT USAGE ON SCHEMA "schema" TO ROLE "role";',
+        ],
+    )
+
+
+def test_batch_statements_failed(share_data_client, data_api):
+    data_api.describe_statement.side_effect = lambda Id: {'Status': 'FAILED', 'Error': 'ERROR: role does not exist'}
+    with pytest.raises(Exception, match='role does not exist'):
+        with share_data_client.batch_statements():
+            share_data_client.grant_database_usage_access_to_redshift_role(database='db', rs_role='role')
+
+
+def test_records_are_reused_until_namespace_changes(share_data_client, data_api):
+    assert share_data_client.check_consumer_permissions_to_datashare('datashare1')
+    assert share_data_client.check_consumer_permissions_to_datashare('datashare1')
+    assert data_api.execute_statement.call_count == 1
+
+    share_data_client.drop_datashare('datashare1')
+    assert share_data_client.check_consumer_permissions_to_datashare('datashare1')
+    assert data_api.execute_statement.call_count == 3
@@ -1,3 +1,4 @@
+import time
 from unittest.mock import call
 from assertpy import assert_that
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
@@ -270,6 +271,30 @@ def test_verify_redshift_cross_account_share_all_successful(
     )
 
 
+def test_verify_redshift_share_checks_the_datashare_once_in_source(
+    redshift_processor_cross_account, mock_redshift_data_shares, mock_redshift_shares
+):
+    # Given
+    events = []
+
+    def check_datashare_exists(*args, **kwargs):
+        events.append('datashare started')
+        time.sleep(0.2)
+        events.append('datashare finished')
+        return True
+
+    def check_schema_in_datashare(*args, **kwargs):
+        events.append('schema started')
+        return True
+
+    mock_redshift_data_shares.return_value.check_datashare_exists.side_effect = check_datashare_exists
+    mock_redshift_data_shares.return_value.check_schema_in_datashare.side_effect = check_schema_in_datashare
+    # When
+    redshift_processor_cross_account.verify_shares()
+    # Then the checks of the source run one after the other, the second one reuses the records of DESC DATASHARE
+    assert_that(events).is_equal_to(['datashare started', 'datashare finished', 'schema started'])
+
+
 def test_verify_redshift_share_datashare_does_not_exist(
     db, redshift_requested_table, redshift_processor_cross_account, mock_redshift_data_shares, mock_redshift_shares
 ):
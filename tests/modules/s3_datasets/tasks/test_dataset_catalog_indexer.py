@@ -1,5 +1,11 @@
+from contextlib import contextmanager
+from datetime import timedelta
+
 import pytest
 
+from dataall.core.tasks.db.task_models import Task
+from dataall.modules.catalog.db.catalog_indexer_repositories import INCREMENTAL_INDEXING_ACTION
+from dataall.modules.catalog.indexers.base_indexer import BulkIndexingStats
 from dataall.modules.catalog.tasks.catalog_indexer_task import CatalogIndexerTask
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 
@@ -81,3 +87,52 @@ def test_catalog_indexer_with_deletes(db, org, env, sync_dataset, table, mocker)
 
     # Count should be One Dataset = 1
     assert indexed_objects_counter == 1
+
+
+def test_catalog_indexer_keeps_documents_if_indexing_failed(db, sync_dataset, table, mocker):
+    mocker.patch('dataall.modules.s3_datasets.indexers.table_indexer.DatasetTableIndexer.upsert_all', return_value=[])
+    mocker.patch(
+        'dataall.modules.s3_datasets.indexers.dataset_indexer.DatasetIndexer.upsert', return_value=sync_dataset
+    )
+
+    @contextmanager
+    def failed_bulk():
+        yield BulkIndexingStats(failed=1, failed_ids={sync_dataset.datasetUri})
+
+    mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.bulk', side_effect=failed_bulk)
+    search_all = mocker.patch(
+        'dataall.modules.catalog.indexers.base_indexer.BaseIndexer.search_all',
+        return_value=[{'_id': table.tableUri}],
+    )
+    alarm = mocker.patch(
+        'dataall.modules.catalog.tasks.catalog_indexer_task.AlarmService.trigger_catalog_indexing_failure_alarm'
+    )
+
+    assert CatalogIndexerTask.index_objects(engine=db, with_deletes='True') == 1
+
+    # the outdated documents are not deleted and the failure is alarmed
+    search_all.assert_not_called()
+    alarm.assert_called_once()
+    assert sync_dataset.datasetUri in alarm.call_args.kwargs['error']
+
+
+def test_catalog_indexer_incremental(db, sync_dataset, table, mocker):
+    mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.HIGH_WATER_MARK_OVERLAP', timedelta(0))
+    delete_doc = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc', return_value=True)
+
+    # The first run indexes everything: One table + One Dataset = 2
+    assert CatalogIndexerTask.index_changes(engine=db) == 2
+    # Nothing changed since the previous run
+    assert CatalogIndexerTask.index_changes(engine=db) == 0
+
+    # When the table is removed from Glue, its document is deleted and the dataset is re-indexed
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).LastGlueTableStatus = 'Deleted'
+    assert CatalogIndexerTask.index_changes(engine=db) == 1
+    delete_doc.assert_called_once_with(doc_id=table.tableUri)
+
+    # the high-water mark is kept in a single task updated by every run
+    with db.scoped_session() as session:
+        runs = session.query(Task).filter(Task.action == INCREMENTAL_INDEXING_ACTION).all()
+        assert len(runs) == 1
+        assert runs[0].response['indexed'] == 1
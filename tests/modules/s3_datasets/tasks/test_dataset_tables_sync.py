@@ -1,7 +1,15 @@
+import time
+from collections import Counter
+from threading import Lock
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from dataall.modules.s3_datasets.db.dataset_models import DatasetTable
+from botocore.exceptions import ClientError
+
+from dataall.modules.s3_datasets.aws.lf_table_client import BATCH_GRANT_SIZE, LakeFormationTableClient
+from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
+from dataall.modules.s3_datasets.tasks import tables_syncer
 from dataall.modules.s3_datasets.tasks.tables_syncer import sync_tables
 
 
@@ -100,3 +108,124 @@ def test_tables_sync(db, org, env, sync_dataset, table_fixture, mocker):
         saved_table: DatasetTable = session.query(DatasetTable).filter(DatasetTable.GlueTableName == 'table1').first()
         assert saved_table
         assert saved_table.GlueTableName == 'table1'
+
+
+def test_tables_sync_groups_datasets_by_account_and_region(
+    db, org_fixture, env_fixture, create_dataset, sync_dataset, mocker
+):
+    other_region_dataset = create_dataset(org_fixture, env_fixture, 'dataset2')
+    with db.scoped_session() as session:
+        session.query(S3Dataset).get(other_region_dataset.datasetUri).region = 'us-east-1'
+
+    mock_crawler = MagicMock()
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer.DatasetCrawler', mock_crawler)
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_arn', return_value='arn:role')
+    mock_crawler().list_glue_database_tables.return_value = [
+        {
+            'Name': 'table1',
+            'DatabaseName': sync_dataset.GlueDatabaseName,
+            'StorageDescriptor': {'Columns': [], 'Location': f's3://{sync_dataset.S3BucketName}/table1'},
+            'PartitionKeys': [],
+        }
+    ]
+    pivot_role = mocker.patch(
+        'dataall.modules.s3_datasets.tasks.tables_syncer.is_assumable_pivot_role', return_value=True
+    )
+    mock_client = MagicMock()
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer.LakeFormationTableClient', mock_client)
+
+    processed_tables = sync_tables(engine=db)
+
+    assert {table.datasetUri for table in processed_tables} == {
+        sync_dataset.datasetUri,
+        other_region_dataset.datasetUri,
+    }
+    # the pivot role is checked once per (account, region) and the grants are sent in one batch per dataset
+    assert pivot_role.call_count == 2
+    assert mock_client.batch_grant_principals_all_table_permissions.call_count == 2
+
+
+def test_tables_sync_continues_when_the_pivot_role_cannot_be_assumed(
+    db, org_fixture, env, env_params, create_dataset, sync_dataset, mocker
+):
+    other_env = env(org_fixture, 'unassumable', 'alice', 'testadmins', '222222222222', parameters=env_params)
+    unassumable_dataset = create_dataset(org_fixture, other_env, 'unassumable')
+
+    mock_crawler = MagicMock()
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer.DatasetCrawler', mock_crawler)
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_arn', return_value='arn:role')
+    mock_crawler().list_glue_database_tables.return_value = []
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer.LakeFormationTableClient', MagicMock())
+    alarm = mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer.DatasetAlarmService')
+
+    def remote_session(accountid, region):
+        if accountid == '222222222222':
+            raise ClientError({'Error': {'Code': 'AccessDenied'}}, 'AssumeRole')
+        return MagicMock()
+
+    mocker.patch(
+        'dataall.modules.s3_datasets.tasks.tables_syncer.SessionHelper.remote_session', side_effect=remote_session
+    )
+
+    processed_tables = sync_tables(engine=db)
+
+    assert sync_dataset.datasetUri in {table.datasetUri for table in processed_tables}
+    alarm().trigger_dataset_sync_failure_alarm.assert_called_once()
+    assert alarm().trigger_dataset_sync_failure_alarm.call_args.args[0].datasetUri == unassumable_dataset.datasetUri
+
+    # a group that fails does not lose the tables of the other groups
+    sync_group = tables_syncer._sync_group
+
+    def failing_sync_group(engine, account_id, region, datasets):
+        if account_id == '222222222222':
+            raise Exception('unexpected error')
+        return sync_group(engine, account_id, region, datasets)
+
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer._sync_group', side_effect=failing_sync_group)
+    processed_tables = sync_tables(engine=db)
+    assert sync_dataset.datasetUri in {table.datasetUri for table in processed_tables}
+
+
+def test_tables_sync_limits_the_groups_of_an_account_running_at_the_same_time(db, mocker):
+    datasets = [
+        SimpleNamespace(AwsAccountId=account_id, region=region)
+        for account_id in ['111111111111', '222222222222']
+        for region in ['eu-west-1', 'eu-west-2', 'us-east-1']
+    ]
+    mocker.patch(
+        'dataall.modules.s3_datasets.tasks.tables_syncer.DatasetRepository.list_all_active_datasets',
+        return_value=datasets,
+    )
+    mocker.patch.object(tables_syncer, 'MAX_WORKERS', 4)
+    mocker.patch.object(tables_syncer, 'MAX_WORKERS_PER_ACCOUNT', 1)
+    lock = Lock()
+    running = Counter()
+    max_running = Counter()
+
+    def sync_group(engine, account_id, region, group_datasets):
+        with lock:
+            running[account_id] += 1
+            max_running[account_id] = max(max_running[account_id], running[account_id])
+        time.sleep(0.05)
+        with lock:
+            running[account_id] -= 1
+        return group_datasets
+
+    mocker.patch('dataall.modules.s3_datasets.tasks.tables_syncer._sync_group', side_effect=sync_group)
+
+    assert len(sync_tables(engine=db)) == len(datasets)
+    assert max_running == {'111111111111': 1, '222222222222': 1}
+
+
+def test_batch_grant_table_permissions(table_fixture):
+    aws_session = MagicMock()
+    client = aws_session.client.return_value
+    client.batch_grant_permissions.return_value = {'Failures': [{'RequestEntry': {'Id': '0'}, 'Error': {}}]}
+
+    LakeFormationTableClient.batch_grant_principals_all_table_permissions(
+        tables=[table_fixture] * 15, principals=['arn:role1', 'arn:role2'], aws_session=aws_session
+    )
+
+    batches = [call.kwargs['Entries'] for call in client.batch_grant_permissions.call_args_list]
+    assert [len(entries) for entries in batches] == [BATCH_GRANT_SIZE, 30 - BATCH_GRANT_SIZE]
+    assert len({entry['Id'] for entries in batches for entry in entries}) == 30
@@ -8,10 +8,11 @@ def sync_dataset(create_dataset, org_fixture, env_fixture, db):
 
 
 def test_stacks_update(db, org, env, sync_dataset, mocker):
-    mocker.patch(
-        'dataall.core.environment.tasks.env_stacks_updater.update_stack',
-        return_value=True,
-    )
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Parameter')
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.time.sleep')
+    ecs = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs')
+    ecs.list_running_tasks_started_by.return_value = set()
+    ecs.run_cdkproxy_task.return_value = 'arn:aws:ecs:eu-west-1:111111111111:task/cluster/cdkproxy'
     envs, datasets = update_stacks(engine=db, envname='local')
     assert envs == 1
     assert datasets == 1
@@ -55,7 +55,7 @@ def test_dataset_term_link_approval(db, client, t1, dataset_fixture, user, group
         groups=[group.name],
     )
     assert r
-    link: TermLink = session.query(TermLink).get(link.linkUri)
+    link: TermLink = session.query(TermLink).populate_existing().get(link.linkUri)
     assert link.approvedBySteward
 
     r = client.query(
@@ -69,7 +69,7 @@ def test_dataset_term_link_approval(db, client, t1, dataset_fixture, user, group
         groups=[group.name],
     )
     assert r
-    link: TermLink = session.query(TermLink).get(link.linkUri)
+    link: TermLink = session.query(TermLink).populate_existing().get(link.linkUri)
     assert not link.approvedBySteward
 
 
@@ -1,3 +1,7 @@
+from sqlalchemy import event
+
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+from dataall.modules.s3_datasets.indexers.dataset_catalog_indexer import DatasetCatalogIndexer
 from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
@@ -39,3 +43,29 @@ def test_upsert_tables(db, dataset_fixture, folder_fixture):
     with db.scoped_session() as session:
         tables = DatasetTableIndexer.upsert_all(session, dataset_uri=dataset_fixture.datasetUri)
         assert len(tables) == 1
+
+
+def test_catalog_indexer_prefetches_lookups(db, dataset_fixture, table_fixture, folder_fixture, mocker):
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index', return_value=True)
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    try:
+        with db.scoped_session() as session:
+            indexer = next(i for i in CatalogIndexer.all() if isinstance(i, DatasetCatalogIndexer))
+            uris = indexer.index(session)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
+
+    assert {dataset_fixture.datasetUri, table_fixture.tableUri, folder_fixture.locationUri} <= set(uris)
+    assert index.call_count == len(uris)
+    # datasets, environments, organizations, tables, table counts, folders, upvotes and glossary terms
+    assert len(statements) == 8
+
+    docs = {call.kwargs['doc_id']: call.kwargs['doc'] for call in index.call_args_list}
+    assert docs[dataset_fixture.datasetUri]['tables'] == 1
+    assert docs[dataset_fixture.datasetUri]['folders'] == 1
+    assert docs[table_fixture.tableUri]['environmentUri'] == docs[dataset_fixture.datasetUri]['environmentUri']
@@ -1,3 +1,5 @@
+from dataall.modules.feed.db.feed_models import FeedMessage
+from dataall.modules.s3_datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.s3_datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.s3_datasets.services.dataset_table_data_filter_service import DatasetTableDataFilterService
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTableColumn, DatasetTable, DatasetTableDataFilter
@@ -142,7 +144,7 @@ def test_update_dataset_table_column(client, table, dataset_fixture, db):
         print('response', response)
         assert response.data.updateDatasetTableColumn.description == 'My new description'
 
-        column = session.query(DatasetTableColumn).get(column.columnUri)
+        column = session.query(DatasetTableColumn).populate_existing().get(column.columnUri)
         assert column.description == 'My new description'
         response = client.query(
             """
@@ -247,6 +249,62 @@ def test_sync_tables_and_columns(client, table, dataset_fixture, db):
         assert deleted_table.LastGlueTableStatus == 'Deleted'
 
 
+def test_sync_table_columns_keeps_unchanged_columns(table, dataset_fixture, db):
+    def glue_table(columns, partitions=()):
+        return {
+            'Name': 'drift_table',
+            'StorageDescriptor': {'Columns': [{'Name': name, 'Type': type} for name, type in columns]},
+            'PartitionKeys': [{'Name': name, 'Type': type} for name, type in partitions],
+        }
+
+    def active_columns(session):
+        return {
+            column.name: column
+            for column in session.query(DatasetTableColumn).filter(
+                DatasetTableColumn.tableUri == drift_table.tableUri, DatasetTableColumn.deleted.is_(None)
+            )
+        }
+
+    drift_table = table(dataset=dataset_fixture, name='drift_table', username=dataset_fixture.owner)
+    with db.scoped_session() as session:
+        drift = DatasetTableRepository.sync_table_columns(
+            session, drift_table, glue_table([('id', 'int'), ('name', 'string')], [('day', 'string')])
+        )
+        assert drift == {'added': ['id', 'name', 'day'], 'updated': [], 'removed': []}
+        columns = active_columns(session)
+        columns['name'].description = 'Name of the customer'
+        uris = {name: column.columnUri for name, column in columns.items()}
+
+    with db.scoped_session() as session:
+        drift = DatasetTableRepository.sync_table_columns(
+            session, drift_table, glue_table([('id', 'bigint'), ('name', 'string'), ('email', 'string')])
+        )
+        assert drift == {'added': ['email'], 'updated': ['id'], 'removed': ['day']}
+        DatasetTableService.post_schema_drift(session, drift_table, drift)
+
+    with db.scoped_session() as session:
+        columns = active_columns(session)
+        assert set(columns) == {'id', 'name', 'email'}
+        assert columns['id'].columnUri == uris['id']
+        assert columns['id'].typeName == 'bigint'
+        assert columns['name'].columnUri == uris['name']
+        assert columns['name'].description == 'Name of the customer'
+        message = session.query(FeedMessage).filter(FeedMessage.targetUri == drift_table.tableUri).one()
+        assert 'added columns email' in message.content
+        assert 'removed columns day' in message.content
+
+        # a removed column is restored with its metadata
+        drift = DatasetTableRepository.sync_table_columns(
+            session, drift_table, glue_table([('id', 'bigint'), ('name', 'string')], [('day', 'string')])
+        )
+        assert drift == {'added': ['day'], 'updated': [], 'removed': ['email']}
+        assert active_columns(session)['day'].columnUri == uris['day']
+
+        assert DatasetTableRepository.sync_table_columns(
+            session, drift_table, glue_table([('id', 'bigint'), ('name', 'string')], [('day', 'string')])
+        ) == {'added': [], 'updated': [], 'removed': []}
+
+
 def delete_table(client, tableUri, username, groups):
     return client.query(
         """
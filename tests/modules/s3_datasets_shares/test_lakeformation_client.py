@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from dataall.modules.s3_datasets_shares.aws import lakeformation_client
+from dataall.modules.s3_datasets_shares.aws.lakeformation_client import BATCH_SIZE, LakeFormationClient
+
+ACCOUNT = '1' * 12
+
+
+@pytest.fixture
+def lf_client(mocker):
+    client = MagicMock()
+    client.list_permissions.return_value = {'PrincipalResourcePermissions': []}
+    client.batch_grant_permissions.return_value = {'Failures': []}
+    client.batch_revoke_permissions.return_value = {'Failures': []}
+    session = MagicMock()
+    session.client.return_value = client
+    mocker.patch('dataall.base.aws.sts.SessionHelper.remote_session', return_value=session)
+    mocker.patch.object(lakeformation_client.time, 'sleep')
+    return client
+
+
+def _principals(count):
+    return [f'arn:aws:iam::{ACCOUNT}:role/role{i}' for i in range(count)]
+
+
+def _permission(principal, permissions):
+    return {
+        'Principal': {'DataLakePrincipalIdentifier': principal},
+        'Permissions': permissions,
+        'PermissionsWithGrantOption': [],
+    }
+
+
+def test_grant_only_missing_permissions_in_batches(lf_client):
+    principals = _principals(BATCH_SIZE + 5)
+    lf_client.list_permissions.side_effect = [
+        {'PrincipalResourcePermissions': [_permission(principals[0], ['SELECT', 'DESCRIBE'])], 'NextToken': 'next'},
+        {'PrincipalResourcePermissions': [_permission(principals[1], ['DESCRIBE'])]},
+    ]
+
+    LakeFormationClient(ACCOUNT, 'eu-west-1').grant_permissions_to_table(
+        principals=principals,
+        database_name='db',
+        table_name='table',
+        catalog_id=ACCOUNT,
+        permissions=['SELECT', 'DESCRIBE'],
+    )
+
+    assert lf_client.list_permissions.call_count == 2
+    assert lf_client.list_permissions.call_args.kwargs['NextToken'] == 'next'
+    batches = [call.kwargs['Entries'] for call in lf_client.batch_grant_permissions.call_args_list]
+    assert [len(batch) for batch in batches] == [BATCH_SIZE, 4]
+    granted = [entry['Principal']['DataLakePrincipalIdentifier'] for batch in batches for entry in batch]
+    assert granted == principals[1:]
+    assert len({entry['Id'] for batch in batches for entry in batch}) == len(granted)
+
+
+def test_grant_retries_concurrent_modifications_only(lf_client):
+    principals = _principals(3)
+    lf_client.batch_grant_permissions.side_effect = [
+        {
+            'Failures': [
+                {'RequestEntry': {'Id': '1'}, 'Error': {'ErrorCode': 'ConcurrentModificationException'}},
+            ]
+        },
+        {'Failures': []},
+    ]
+
+    LakeFormationClient(ACCOUNT, 'eu-west-1').grant_permissions_to_database(
+        principals=principals, database_name='db', permissions=['DESCRIBE']
+    )
+
+    retried = lf_client.batch_grant_permissions.call_args_list[1].kwargs['Entries']
+    assert [entry['Principal']['DataLakePrincipalIdentifier'] for entry in retried] == [principals[1]]
+    assert lakeformation_client.time.sleep.call_count == 1
+
+
+def test_grant_raises_on_failed_entries(lf_client):
+    lf_client.batch_grant_permissions.return_value = {
+        'Failures': [
+            {'RequestEntry': {'Id': '0'}, 'Error': {'ErrorCode': 'AccessDeniedException', 'ErrorMessage': 'denied'}}
+        ]
+    }
+
+    with pytest.raises(ClientError):
+        LakeFormationClient(ACCOUNT, 'eu-west-1').grant_permissions_to_database(
+            principals=_principals(1), database_name='db', permissions=['DESCRIBE']
+        )
+    assert lakeformation_client.time.sleep.call_count == 0
+
+
+def test_revoke_ignores_already_revoked_permissions(lf_client):
+    lf_client.batch_revoke_permissions.return_value = {
+        'Failures': [
+            {
+                'RequestEntry': {'Id': '0'},
+                'Error': {'ErrorCode': 'InvalidInputException', 'ErrorMessage': 'No permissions revoked'},
+            }
+        ]
+    }
+
+    LakeFormationClient(ACCOUNT, 'eu-west-1').revoke_permissions_to_table_with_filters(
+        principals=_principals(2),
+        database_name='db',
+        table_name='table',
+        catalog_id=ACCOUNT,
+        permissions=['SELECT'],
+        data_filters=['filter1', 'filter2'],
+    )
+
+    lf_client.batch_revoke_permissions.assert_called_once()
+    assert len(lf_client.batch_revoke_permissions.call_args.kwargs['Entries']) == 4
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 import boto3
 import pytest
 from assertpy import assert_that
+from sqlalchemy import event
 
 from dataall.base.utils.expiration_util import ExpirationUtils
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup, ConsumptionRole
@@ -23,6 +24,7 @@ from dataall.modules.shares_base.db.share_object_models import ShareObject, Shar
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
 from dataall.modules.shares_base.db.share_object_state_machines import ShareItemSM, ShareObjectSM
+from dataall.modules.shares_base.tasks.share_verifier_task import verify_shares
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 
 
@@ -1745,6 +1747,63 @@ def test_list_shares_from_me_requester(client, user2, group2, share1_draft):
     assert get_share_requests_from_me_response.data.getShareRequestsFromMe.count == 4
 
 
+def test_list_shares_from_me_batches_the_share_fields(
+    client, db, user2, group2, share1_draft, share2_submitted, share3_processed
+):
+    # Given
+    # Existing share objects sent by the Requesters group
+    fields_query = """
+        query getShareRequestsFromMe($filter: ShareObjectFilter){
+            getShareRequestsFromMe(filter: $filter){
+                count
+                nodes{
+                    shareUri
+                    userRoleForShareObject
+                    existingSharedItems
+                    dataset { datasetName environmentName }
+                    principal { principalName environmentName }
+                    statistics { sharedItems pendingItems }
+                }
+            }
+        }
+    """
+    uris_query = """
+        query getShareRequestsFromMe($filter: ShareObjectFilter){
+            getShareRequestsFromMe(filter: $filter){
+                count
+                nodes{ shareUri }
+            }
+        }
+    """
+
+    def count_statements(query):
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+        try:
+            response = client.query(query, username=user2.username, groups=[group2.name])
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count_statement)
+        assert not response.errors
+        return response, len(statements)
+
+    # When the requester lists the share objects with their dataset, principal and statistics
+    response, statements = count_statements(fields_query)
+    _, list_statements = count_statements(uris_query)
+
+    # Then the fields of all the shares are loaded with one query per type
+    # datasets, dataset environments, share environments, environment groups, consumption roles and statistics
+    nodes = response.data.getShareRequestsFromMe.nodes
+    assert len(nodes) >= 3
+    assert statements - list_statements <= 6
+    assert all(node.dataset.datasetName for node in nodes)
+    assert all(node.principal.environmentName for node in nodes)
+    assert all(node.statistics.sharedItems is not None for node in nodes)
+
+
 def test_add_share_item(client, user2, group2, share1_draft, mock_glue_client):
     # Given
     # Existing share object in status Draft (-> fixture share1_draft)
@@ -2944,3 +3003,42 @@ def _successfull_processing_for_share_object(db, share):
             Item_SM.update_state(session, share.shareUri, new_state)
 
         Share_SM.update_state(session, share, new_share_state)
+
+
+def test_verify_shares_verifies_every_active_share(db, share1_draft, share2_submitted, mocker):
+    # Given
+    # a share that fails to be verified
+    def verify_share(engine, share_uri, status=None, healthStatus=None):
+        if share_uri == share1_draft.shareUri:
+            raise Exception('verification failed')
+        return True
+
+    verify = mocker.patch(
+        'dataall.modules.shares_base.tasks.share_verifier_task.SharingService.verify_share', side_effect=verify_share
+    )
+
+    # When
+    processed = verify_shares(db)
+
+    # Then
+    # the failure does not stop the verification of the other shares
+    assert {share1_draft.shareUri, share2_submitted.shareUri} <= set(processed)
+    assert verify.call_count == len(processed)
+    with db.scoped_session() as session:
+        assert len(processed) == len(ShareObjectRepository.list_all_active_share_objects(session))
+
+
+def test_batch_health_status_updates_commit_once(db, share3_processed):
+    with db.scoped_session() as session:
+        items = session.query(ShareObjectItem).filter(ShareObjectItem.shareUri == share3_processed.shareUri).all()
+        commit = MagicMock(wraps=session.commit)
+        session.commit = commit
+
+        with ShareStatusRepository.batch_health_status_updates(session):
+            for item in items:
+                ShareStatusRepository.update_share_item_health_status(
+                    session, item, healthStatus=ShareItemHealthStatus.Healthy.value, timestamp=datetime.now()
+                )
+            commit.assert_not_called()
+
+        commit.assert_called_once()
@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.modules.worksheets.aws import athena_client
+from dataall.modules.worksheets.aws.athena_client import AthenaClient
+
+COLUMNS = [{'Name': 'id', 'Type': 'integer'}, {'Name': 'name', 'Type': 'varchar'}]
+
+
+def _page(rows, next_token=None):
+    page = {
+        'ResultSet': {
+            'ResultSetMetadata': {'ColumnInfo': COLUMNS},
+            'Rows': [{'Data': [{'VarCharValue': v} if v is not None else {} for v in row]} for row in rows],
+        }
+    }
+    if next_token:
+        page['NextToken'] = next_token
+    return page
+
+
+@pytest.fixture
+def athena(mocker):
+    client = MagicMock()
+    client.start_query_execution.return_value = {'QueryExecutionId': 'qid'}
+    client.get_query_execution.return_value = {
+        'QueryExecution': {
+            'StatementType': 'DML',
+            'Status': {'State': 'SUCCEEDED'},
+            'Statistics': {'TotalExecutionTimeInMillis': 120, 'DataScannedInBytes': 2048},
+        }
+    }
+    session = MagicMock()
+    session.client.return_value = client
+    mocker.patch('dataall.base.aws.sts.SessionHelper.remote_session')
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_session', return_value=session)
+    mocker.patch.object(athena_client.time, 'sleep')
+    return client
+
+
+@pytest.fixture
+def env_group():
+    return MagicMock(environmentIAMRoleArn='arn:aws:iam::111111111111:role/group', environmentAthenaWorkGroup='wg')
+
+
+def test_query_results_are_columnar(athena, env_group):
+    athena.get_query_results.return_value = _page([('id', 'name'), ('1', 'a'), ('2', None)])
+
+    result = AthenaClient('111111111111', env_group, 'eu-west-1').get_query_results('qid')
+
+    assert result['columns'] == [
+        {'columnName': 'id', 'typeName': 'integer'},
+        {'columnName': 'name', 'typeName': 'varchar'},
+    ]
+    assert result['records'] == [['1', 'a'], ['2', None]]
+    assert result['nextToken'] is None
+    assert result['ElapsedTimeInMs'] == 120
+    assert AthenaClient.to_cells(result)[0]['cells'] == [
+        {'columnName': 'id', 'typeName': 'integer', 'value': '1'},
+        {'columnName': 'name', 'typeName': 'varchar', 'value': 'a'},
+    ]
+
+
+def test_query_results_are_capped_and_continued(athena, env_group):
+    athena.get_query_results.side_effect = [
+        _page([('id', 'name'), ('1', 'a'), ('2', 'b')], next_token='t1'),
+        _page([('3', 'c'), ('4', 'd')], next_token='t2'),
+    ]
+    client = AthenaClient('111111111111', env_group, 'eu-west-1')
+
+    first = client.get_query_results('qid', max_rows=2)
+    assert first['records'] == [['1', 'a'], ['2', 'b']]
+    assert first['nextToken'] == 't1'
+    # the header row is requested on top of the rows
+    assert athena.get_query_results.call_args.kwargs['MaxResults'] == 3
+
+    second = client.get_query_results('qid', next_token=first['nextToken'], max_rows=2)
+    assert second['records'] == [['3', 'c'], ['4', 'd']]
+    assert second['nextToken'] == 't2'
+    assert athena.get_query_results.call_args.kwargs == {'QueryExecutionId': 'qid', 'MaxResults': 2, 'NextToken': 't1'}
+
+
+def test_run_query_waits_for_the_query(athena, env_group):
+    running = {'QueryExecution': {'Status': {'State': 'RUNNING'}}}
+    failed = {'QueryExecution': {'Status': {'State': 'FAILED', 'StateChangeReason': 'SYNTAX_ERROR'}}}
+    athena.get_query_execution.side_effect = [running, running, failed]
+
+    with pytest.raises(Exception, match='SYNTAX_ERROR'):
+        AthenaClient('111111111111', env_group, 'eu-west-1').run_query('select 1', 's3://bucket/prefix/')
+
+    assert athena.start_query_execution.call_args.kwargs['WorkGroup'] == 'wg'
+    assert athena_client.time.sleep.call_count == 2
+
+
+def test_start_query_reuses_the_results_of_identical_queries(athena, env_group):
+    client = AthenaClient('111111111111', env_group, 'eu-west-1')
+
+    assert client.start_query('select 1', 's3://bucket/prefix/', reuse_minutes=20000) == 'qid'
+    assert athena.start_query_execution.call_args.kwargs['ResultReuseConfiguration'] == {
+        'ResultReuseByAgeConfiguration': {'Enabled': True, 'MaxAgeInMinutes': athena_client.MAX_RESULT_REUSE_MINUTES}
+    }
+    athena.get_query_execution.assert_not_called()
+
+    client.start_query('select 1', 's3://bucket/prefix/')
+    assert 'ResultReuseConfiguration' not in athena.start_query_execution.call_args.kwargs
+
+
+def test_query_results_of_a_running_query(athena, env_group):
+    athena.get_query_execution.return_value = {'QueryExecution': {'Status': {'State': 'RUNNING'}}}
+
+    result = AthenaClient('111111111111', env_group, 'eu-west-1').get_query_results('qid')
+
+    assert result['Status'] == 'RUNNING'
+    assert result['Error'] is None
+    assert result['records'] is None
+    athena.get_query_results.assert_not_called()
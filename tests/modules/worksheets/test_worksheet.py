@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import pytest
 
 from dataall.modules.worksheets.api.resolvers import WorksheetRole
@@ -145,3 +147,108 @@ def test_update_worksheet(client, worksheet, group):
     )
 
     assert response.data.updateWorksheet.label == 'change label'
+
+
+START_QUERY = """
+    mutation startAthenaSqlQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!, $resultReuseMinutes:Int){
+        startAthenaSqlQuery(
+            environmentUri:$environmentUri,
+            worksheetUri:$worksheetUri,
+            sqlQuery:$sqlQuery,
+            resultReuseMinutes:$resultReuseMinutes
+        ){
+            AthenaQueryId
+            Status
+        }
+    }
+"""
+
+
+@pytest.fixture
+def athena(mocker):
+    client = mocker.patch('dataall.modules.worksheets.services.worksheet_service.AthenaClient').return_value
+    client.start_query.side_effect = lambda **kwargs: f'qid{uuid4().hex}'
+    client.get_query_status.side_effect = lambda query_id: {'AthenaQueryId': query_id, 'Status': 'RUNNING'}
+    return client
+
+
+def _start_query(client, env, worksheet, group, sql, reuse_minutes=5):
+    response = client.query(
+        START_QUERY,
+        environmentUri=env.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        sqlQuery=sql,
+        resultReuseMinutes=reuse_minutes,
+        username='alice',
+        groups=[group.name],
+    )
+    return response.data.startAthenaSqlQuery
+
+
+def test_start_query_reuses_identical_queries(client, env_fixture, worksheet, group, athena):
+    first = _start_query(client, env_fixture, worksheet, group, "select *  from t\nwhere name = 'a  b';")
+    assert first.Status == 'RUNNING'
+    assert athena.start_query.call_args.kwargs['s3_staging_dir'].endswith('/athenaqueries/workgroup/')
+
+    # the same query formatted differently reuses the execution
+    second = _start_query(client, env_fixture, worksheet, group, "select * from t \n  where name = 'a  b'")
+    assert second.AthenaQueryId == first.AthenaQueryId
+    assert athena.start_query.call_count == 1
+
+    # a different literal is a different query
+    third = _start_query(client, env_fixture, worksheet, group, "select * from t\nwhere name = 'a b'")
+    assert third.AthenaQueryId != first.AthenaQueryId
+
+    # the reuse is disabled with a window of 0 minutes
+    fourth = _start_query(client, env_fixture, worksheet, group, "select * from t\nwhere name = 'a b'", 0)
+    assert fourth.AthenaQueryId not in (first.AthenaQueryId, third.AthenaQueryId)
+    assert athena.start_query.call_args.kwargs['reuse_minutes'] == 0
+
+
+def test_failed_queries_are_not_reused(client, env_fixture, worksheet, group, athena):
+    query_id = _start_query(client, env_fixture, worksheet, group, 'select 2').AthenaQueryId
+
+    athena.get_query_results.return_value = {'AthenaQueryId': query_id, 'Status': 'FAILED', 'Error': 'SYNTAX_ERROR'}
+    response = client.query(
+        """
+        query getAthenaQueryResults($environmentUri:String!, $worksheetUri:String!, $athenaQueryId:String!){
+            getAthenaQueryResults(
+                environmentUri:$environmentUri,
+                worksheetUri:$worksheetUri,
+                athenaQueryId:$athenaQueryId
+            ){
+                Status
+                Error
+                records
+            }
+        }
+        """,
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        athenaQueryId=query_id,
+        username='alice',
+        groups=[group.name],
+    )
+    assert response.data.getAthenaQueryResults.Error == 'SYNTAX_ERROR'
+
+    assert _start_query(client, env_fixture, worksheet, group, 'select 2').AthenaQueryId != query_id
+
+
+def test_writes_are_not_reused(client, env_fixture, worksheet, group, athena):
+    # without resultReuseMinutes the query runs again
+    first = _start_query(client, env_fixture, worksheet, group, 'select 3', None)
+    assert _start_query(client, env_fixture, worksheet, group, 'select 3', None).AthenaQueryId != first.AthenaQueryId
+
+    reused = _start_query(client, env_fixture, worksheet, group, 'select 4')
+    assert _start_query(client, env_fixture, worksheet, group, 'select 4').AthenaQueryId == reused.AthenaQueryId
+
+    # the statements that write are always run
+    insert = _start_query(client, env_fixture, worksheet, group, '-- load\nINSERT INTO t SELECT 4')
+    assert athena.start_query.call_args.kwargs['reuse_minutes'] == 0
+    assert _start_query(client, env_fixture, worksheet, group, 'INSERT INTO t SELECT 4').AthenaQueryId != (
+        insert.AthenaQueryId
+    )
+
+    # the queries after a write do not reuse the results from before the write
+    assert _start_query(client, env_fixture, worksheet, group, 'select 4').AthenaQueryId != reused.AthenaQueryId
+    assert athena.start_query.call_args.kwargs['reuse_minutes'] == 0
@@ -179,6 +179,9 @@ class TestData:
 
 
 EXPECTED_RESOLVERS: Mapping[str, TestData] = {
+    field_id('AthenaQueryResult', 'rows'): TestData(
+        resource_ignore=IgnoreReason.INTRAMODULE, tenant_ignore=IgnoreReason.NOTREQUIRED
+    ),
     field_id('AttachedMetadataForm', 'entityName'): TestData(
         resource_ignore=IgnoreReason.INTRAMODULE, tenant_ignore=IgnoreReason.NOTREQUIRED
     ),
@@ -578,6 +581,9 @@ EXPECTED_RESOLVERS: Mapping[str, TestData] = {
         tenant_perm=MANAGE_DASHBOARDS, resource_ignore=IgnoreReason.NOTREQUIRED
     ),
     field_id('Mutation', 'revokeItemsShareObject'): TestData(tenant_perm=MANAGE_SHARES, resource_perm=GET_SHARE_OBJECT),
+    field_id('Mutation', 'startAthenaSqlQuery'): TestData(
+        resource_perm=RUN_ATHENA_QUERY, tenant_perm=MANAGE_WORKSHEETS
+    ),
     field_id('Mutation', 'startDatasetProfilingRun'): TestData(
         tenant_perm=MANAGE_DATASETS, resource_perm=PROFILE_DATASET_TABLE
     ),
@@ -710,6 +716,7 @@ EXPECTED_RESOLVERS: Mapping[str, TestData] = {
     field_id('Query', 'generateEnvironmentAccessToken'): TestData(
         tenant_perm=MANAGE_ENVIRONMENTS, resource_perm=CREDENTIALS_ENVIRONMENT
     ),
+    field_id('Query', 'getAthenaQueryResults'): TestData(resource_perm=RUN_ATHENA_QUERY, tenant_perm=MANAGE_WORKSHEETS),
     field_id('Query', 'getAttachedMetadataForm'): TestData(
         resource_ignore=IgnoreReason.PUBLIC, tenant_ignore=IgnoreReason.NOTREQUIRED
     ),